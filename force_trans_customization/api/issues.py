@@ -1,7 +1,69 @@
 import frappe
 from frappe import _
+from frappe.model.db_query import DatabaseQuery
+from frappe.utils import cint, make_filter_tuple
+from frappe.utils.caching import request_cache
+from force_trans_customization.force_trans_customization.doctype.issue_statistics.issue_statistics import get_issue_statistics
+from force_trans_customization.utils.autocomplete_index import redis_command, search_autocomplete_index
 from datetime import datetime
+import base64
+import copy
+import functools
+import hashlib
 import json
+import re
+import time
+
+
+STAT_TYPES = ["team_tickets", "assigned_to_me", "open_tickets", "actionable_tickets", "response_tickets"]
+
+# Base fields the issue list endpoints fetch from the Issue doctype
+ISSUE_LIST_FIELDS = [
+    "name",
+    "subject", 
+    "status",
+    "priority",
+    "raised_by",
+    "customer",
+    "project",
+    "issue_type",
+    "creation",
+    "modified",
+    "owner",
+    # Bounded plain text snippet, full descriptions are loaded per row with get_issue_descriptions
+    "custom_description_snippet",
+    "custom_is_response_expected",
+    "custom_assigned_csm_team"
+]
+
+# Team User Assignment columns the list needs for a row (parent groups the rows by issue)
+ISSUE_ASSIGNMENT_FIELDS = ["name", "parent", "idx", "user_assigned", "team", "assigned_date"]
+
+# Most issues get_issue_descriptions and get_issues_by_names return in one call
+ISSUE_NAMES_LIMIT = 100
+
+# Redis key of the tag color map and its version, cleared by Tag and Tag Category changes
+TAG_COLORS_CACHE_KEY = "force_trans_tag_colors"
+
+# Redis key of the User Group names with their member counts, cleared by User Group changes
+USER_GROUPS_CACHE_KEY = "force_trans_user_groups"
+
+# FULLTEXT index used by issue_search (added by patches/v1_2_add_issue_search_fulltext_index)
+ISSUE_SEARCH_INDEX = "issue_search_fulltext"
+ISSUE_SEARCH_COLUMNS = ["name", "subject", "customer", "raised_by"]
+# InnoDB's default innodb_ft_min_token_size, shorter words are not in the index
+ISSUE_SEARCH_MIN_WORD_LENGTH = 3
+
+# Redis counter bumped by every recorded Issue, assignment and tag change (utils/issue_deltas.py)
+# and Issue share change (bump_issue_list_generation),
+# covers the deletions a max(modified) watermark can't see
+ISSUE_LIST_GENERATION_KEY = "force_trans_issue_list_generation"
+
+# Opt-in compact response of the list endpoints (format=columnar), see encode_issues_columnar
+COLUMNAR_FORMAT = "columnar"
+
+# Compiled filter plans kept per worker, the same filter set is sent by every list, count and stat call of a screen
+ISSUE_FILTER_PLAN_CACHE_SIZE = 256
 
 
 def process_order_by(order_by_param):
@@ -91,6 +153,86 @@ def validate_and_clean_order_by(order_by_str):
     return ", ".join(cleaned_parts) if cleaned_parts else "creation desc"
 
 
+def get_keyset_sort_keys(order_by_str):
+    """
+    Get the (field, direction) pairs of a validated order_by string for keyset pagination
+    name is appended as a tie-breaker so every row has a unique position
+    """
+    sort_keys = []
+    for part in validate_and_clean_order_by(order_by_str).split(','):
+        field, direction = part.split()
+        sort_keys.append((field, direction))
+        if field == 'name':
+            # name is unique, later sort keys never break a tie
+            return sort_keys
+    
+    sort_keys.append(('name', sort_keys[-1][1]))
+    return sort_keys
+
+
+def get_cursor_order(sort_keys):
+    """
+    The sort order a cursor is bound to, as a canonical "field direction" list
+    """
+    return ",".join(f"{field} {direction}" for field, direction in sort_keys)
+
+
+def encode_issue_cursor(issue, sort_keys):
+    """
+    Encode the sort order and the sort key values of the last issue on a page into an opaque cursor
+    """
+    values = [issue.get(field) for field, direction in sort_keys]
+    payload = json.dumps({"order": get_cursor_order(sort_keys), "values": values}, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_issue_cursor(cursor, sort_keys):
+    """
+    Decode a cursor from encode_issue_cursor into the sort key values it was built from
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except Exception:
+        frappe.throw(_("Invalid cursor"))
+    
+    # The cursor must have been built for the same sort order and hold scalar values only
+    if not isinstance(payload, dict) or payload.get("order") != get_cursor_order(sort_keys):
+        frappe.throw(_("Cursor does not match the sort order"))
+    values = payload.get("values")
+    if not isinstance(values, list) or len(values) != len(sort_keys):
+        frappe.throw(_("Cursor does not match the sort order"))
+    if any(value is not None and not isinstance(value, (str, int, float)) for value in values):
+        frappe.throw(_("Invalid cursor"))
+    
+    return values
+
+
+def get_keyset_condition(sort_keys, values):
+    """
+    Build the seek predicate that selects rows after the cursor position for a multi-column order
+    (a > x) OR (a = x AND b > y) OR ... with NULLs sorting first in asc and last in desc order
+    """
+    def sql_value(value):
+        return frappe.db.escape(value, percent=False) if isinstance(value, str) else repr(value)
+    
+    def is_equal(column, value):
+        return f"{column} IS NULL" if value is None else f"{column} = {sql_value(value)}"
+    
+    def is_after(column, direction, value):
+        if direction == 'asc':
+            return f"{column} IS NOT NULL" if value is None else f"{column} > {sql_value(value)}"
+        # Nothing sorts after NULL in desc order
+        return "1 = 0" if value is None else f"({column} < {sql_value(value)} OR {column} IS NULL)"
+    
+    branches = []
+    for i, (field, direction) in enumerate(sort_keys):
+        parts = [is_equal(f"`tabIssue`.`{f}`", v) for (f, d), v in zip(sort_keys[:i], values[:i], strict=True)]
+        parts.append(is_after(f"`tabIssue`.`{field}`", direction, values[i]))
+        branches.append("(" + " AND ".join(parts) + ")")
+    
+    return "(" + " OR ".join(branches) + ")"
+
+
 def process_filter_list(filters):
     """
     Process the new filter list structure from frontend
@@ -274,23 +416,18 @@ def get_child_table_filters(filters):
     return child_filters
 
 
-def get_issues_by_child_table_filters(child_filters):
+def get_child_table_filter_conditions(child_filters):
     """
-    Get issue names that match child table filters
-    Returns None if no child filters, empty list if no matches, list of names if matches found
+    Compile child table filters into correlated subqueries on Team User Assignment for frappe.get_list filters
+    Returns one condition per child filter (AND operation between different child filters)
     """
-    if not child_filters:
-        return None
-    
+    conditions = []
     
-    issue_names_sets = []
-    
-    for i, child_filter in enumerate(child_filters):
+    for child_filter in child_filters or []:
         field = child_filter.get('field')
         operator = child_filter.get('operator')
         value = child_filter.get('value')
         
-        
         if not value:
             continue
         
@@ -300,142 +437,70 @@ def get_issues_by_child_table_filters(child_filters):
         else:
             values = [value] if not isinstance(value, list) else value
         
-        
         if not values:
             continue
         
-        issue_names = set()
-        
-        # Determine the child table name based on field
+        # Determine the child table column based on field
         if field == 'custom_users_assigned':
-            child_table = "Team User Assignment"
             child_field = "user_assigned"
         elif field == 'custom_assigned_csm_team':
-            child_table = "Team User Assignment"  # Assuming same table with team field
-            child_field = "team"
+            child_field = "team"  # Assuming same table with team field
         else:
             continue
         
-        # Check if table exists
-        if not frappe.db.table_exists(child_table):
-            continue
-        
+        escaped_values = ", ".join(frappe.db.escape(v, percent=False) for v in values)
+        child_rows = f"""FROM `tabTeam User Assignment` tua
+            WHERE tua.parenttype = 'Issue'
+            AND tua.parentfield = {frappe.db.escape(field, percent=False)}"""
         
         if operator == 'in':
-            if len(values) == 1:
-                # Single value case - find issues that have this specific user assigned
-                child_links = frappe.db.get_all(
-                    child_table,
-                    filters={
-                        "parenttype": "Issue",
-                        "parentfield": field,
-                        child_field: values[0]
-                    },
-                    fields=["parent"]
-                )
-                issue_names.update([link.parent for link in child_links])
+            if field == 'custom_users_assigned' and len(values) > 1:
+                # For user assignment: need ALL specified users to be assigned (AND logic)
+                conditions.append(f"""`tabIssue`.name IN (
+                    SELECT tua.parent {child_rows}
+                    AND tua.{child_field} IN ({escaped_values})
+                    GROUP BY tua.parent
+                    HAVING COUNT(DISTINCT tua.{child_field}) = {len(set(values))}
+                )""")
             else:
-                # Multiple values - different logic for different fields
-                potential_issues = frappe.db.get_all(
-                    child_table,
-                    filters={
-                        "parenttype": "Issue",
-                        "parentfield": field,
-                        child_field: ["in", values]
-                    },
-                    fields=["parent", child_field]
-                )
-                
-                if field == 'custom_users_assigned':
-                    # For user assignment: need ALL specified users to be assigned (AND logic)
-                    issue_user_counts = {}
-                    for link in potential_issues:
-                        if link.parent not in issue_user_counts:
-                            issue_user_counts[link.parent] = set()
-                        issue_user_counts[link.parent].add(link.user_assigned)
-                    
-                    # Find issues that have all required users assigned
-                    required_users_set = set(values)
-                    for issue_name, assigned_users in issue_user_counts.items():
-                        if required_users_set.issubset(assigned_users):
-                            issue_names.add(issue_name)
-                            
-                elif field == 'custom_assigned_csm_team':
-                    # For CSM team assignment: need ANY of the specified teams (OR logic)
-                    issue_names.update([link.parent for link in potential_issues])
+                # Single value, or CSM team assignment: need ANY of the specified values (OR logic)
+                conditions.append(f"""EXISTS (
+                    SELECT 1 {child_rows}
+                    AND tua.parent = `tabIssue`.name
+                    AND tua.{child_field} IN ({escaped_values})
+                )""")
         
         elif operator == 'equals' or operator == 'is':
             # Issues that have the exact value
-            child_links = frappe.db.get_all(
-                child_table,
-                filters={
-                    "parenttype": "Issue",
-                    "parentfield": field,
-                    child_field: values[0] if values else ""
-                },
-                fields=["parent"]
-            )
-            issue_names.update([link.parent for link in child_links])
+            conditions.append(f"""EXISTS (
+                SELECT 1 {child_rows}
+                AND tua.parent = `tabIssue`.name
+                AND tua.{child_field} = {frappe.db.escape(values[0], percent=False)}
+            )""")
         
         elif operator == 'not_in':
-            # Issues that do NOT have the specified values
-            all_issues = frappe.db.get_all(
-                "Issue",
-                fields=["name"]
-            )
-            
-            # Get all issues that have ANY of the specified values
-            issues_with_any_values = frappe.db.get_all(
-                child_table,
-                filters={
-                    "parenttype": "Issue",
-                    "parentfield": field,
-                    child_field: ["in", values]
-                },
-                fields=["parent"]
-            )
-            
-            issues_with_values_set = {link.parent for link in issues_with_any_values}
-            
-            # Return all issues except those that have any of the specified values
+            # Issues that do NOT have any of the specified values
             # This logic works the same for both User Assigned and CSM Team
-            issue_names.update([
-                issue.name for issue in all_issues 
-                if issue.name not in issues_with_values_set
-            ])
-            
-        if issue_names:
-            issue_names_sets.append(issue_names)
+            conditions.append(f"""NOT EXISTS (
+                SELECT 1 {child_rows}
+                AND tua.parent = `tabIssue`.name
+                AND tua.{child_field} IN ({escaped_values})
+            )""")
     
-    # Intersect all sets (AND operation between different child filters)
-    if not issue_names_sets:
-        return None
-    
-    result = issue_names_sets[0]
-    
-    for i, issue_set in enumerate(issue_names_sets[1:], 2):
-        result = result.intersection(issue_set)
-    
-    final_result = list(result)
-    
-    return final_result
+    return conditions
 
 
-def get_issues_by_tag_filters(tag_filters):
+def get_tag_filter_conditions(tag_filters):
     """
-    Get issue names that match tag filters
-    Returns None if no tag filters, empty list if no matches, list of names if matches found
+    Compile tag filters into SQL semi-joins on Tag Link for frappe.get_list filters
+    Returns one condition per tag filter (AND operation between different tag filters)
     """
-    if not tag_filters:
-        return None
-    
-    issue_names_sets = []
+    conditions = []
     
-    for i, tag_filter in enumerate(tag_filters):
+    for tag_filter in tag_filters or []:
         operator = tag_filter.get('operator')
         value = tag_filter.get('value')
         
-        
         if not value:
             continue
         
@@ -445,109 +510,489 @@ def get_issues_by_tag_filters(tag_filters):
         else:
             tags = [value] if not isinstance(value, list) else value
         
-        
         if not tags:
             continue
         
-        issue_names = set()
+        escaped_tags = ", ".join(frappe.db.escape(tag, percent=False) for tag in tags)
+        tag_link_exists = f"""EXISTS (
+            SELECT 1 FROM `tabTag Link` tl
+            WHERE tl.document_type = 'Issue'
+            AND tl.document_name = `tabIssue`.name
+            AND tl.tag IN ({escaped_tags})
+        )"""
         
         if operator == 'has':
             # Issues that have ANY of the specified tags (A OR B OR C)
-            tag_links = frappe.db.get_all(
-                "Tag Link",
-                filters={
-                    "document_type": "Issue",
-                    "tag": ["in", tags]
-                },
-                fields=["document_name"]
-            )
-            issue_names.update([link.document_name for link in tag_links])
+            conditions.append(tag_link_exists)
         
         elif operator == 'has_all':
             # Issues that have ALL of the specified tags (A AND B AND C)
-            if len(tags) == 1:
-                # Single tag case
-                tag_links = frappe.db.get_all(
-                    "Tag Link",
-                    filters={
-                        "document_type": "Issue",
-                        "tag": tags[0]
-                    },
-                    fields=["document_name"]
-                )
-                issue_names.update([link.document_name for link in tag_links])
-            else:
-                # Multiple tags - need all
-                potential_issues = frappe.db.get_all(
-                    "Tag Link",
-                    filters={
-                        "document_type": "Issue",
-                        "tag": ["in", tags]
-                    },
-                    fields=["document_name", "tag"]
-                )
-                
-                # Group by issue name
-                issue_tag_counts = {}
-                for link in potential_issues:
-                    if link.document_name not in issue_tag_counts:
-                        issue_tag_counts[link.document_name] = set()
-                    issue_tag_counts[link.document_name].add(link.tag)
-                
-                
-                # Find issues that have all required tags
-                required_tags_set = set(tags)
-                for issue_name, issue_tags in issue_tag_counts.items():
-                    if required_tags_set.issubset(issue_tags):
-                        issue_names.add(issue_name)
-                
+            conditions.append(f"""`tabIssue`.name IN (
+                SELECT tl.document_name FROM `tabTag Link` tl
+                WHERE tl.document_type = 'Issue'
+                AND tl.tag IN ({escaped_tags})
+                GROUP BY tl.document_name
+                HAVING COUNT(DISTINCT tl.tag) = {len(set(tags))}
+            )""")
         
         elif operator == 'not_has':
             # Issues that do NOT have ANY of the specified tags (NOT A AND NOT B)
-            all_issues = frappe.db.get_all(
-                "Issue",
-                fields=["name"]
-            )
-            
-            issues_with_tags = frappe.db.get_all(
-                "Tag Link",
-                filters={
-                    "document_type": "Issue",
-                    "tag": ["in", tags]
-                },
-                fields=["document_name"]
-            )
-            
-            issues_with_tags_set = {link.document_name for link in issues_with_tags}
-            issue_names.update([
-                issue.name for issue in all_issues 
-                if issue.name not in issues_with_tags_set
-            ])
+            conditions.append(f"NOT {tag_link_exists}")
+    
+    return conditions
+
+
+def attach_assignments_and_tags(issues):
+    """
+    Attach custom_users_assigned child table rows and tags to a page of issues
+    Loads the whole page in two IN (...) queries instead of two queries per issue
+    """
+    if not issues:
+        return issues
+
+    issue_names = [issue.name for issue in issues]
+
+    # Get child table data for all issues on the page, ordered by idx to keep the form order
+    user_assignments = frappe.db.get_all(
+        "Team User Assignment",
+        filters={"parent": ["in", issue_names]},
+        fields=ISSUE_ASSIGNMENT_FIELDS,
+        order_by="idx asc"
+    )
+
+    # Get tags for all issues on the page in the order they were added
+    tag_links = frappe.db.get_all(
+        "Tag Link",
+        filters={
+            "document_type": "Issue",
+            "document_name": ["in", issue_names]
+        },
+        fields=["document_name", "tag"],
+        order_by="creation asc"
+    )
+
+    # Group rows by issue, preserving the query ordering within each group
+    assignments_by_issue = {}
+    for assignment in user_assignments:
+        assignments_by_issue.setdefault(assignment.parent, []).append(assignment)
+
+    tags_by_issue = {}
+    for tag_link in tag_links:
+        tags_by_issue.setdefault(tag_link.document_name, []).append(tag_link.tag)
+
+    for issue in issues:
+        issue["custom_users_assigned"] = assignments_by_issue.get(issue.name, [])
+        issue["_user_tags"] = tags_by_issue.get(issue.name, [])
+
+    return issues
+
+
+def encode_issues_columnar(issues, fields):
+    """
+    Compact form of a page of issues for format=columnar: the column header once and rows as arrays
+    custom_users_assigned cells hold assignment arrays (assignment_columns, parent is the row's issue),
+    their users and teams and the _user_tags cells are indexes into the users, teams and tags dictionaries
+    Expanded back into the list shape by decodeIssueRows in frontend/src/data/issues.js
+    """
+    columns = [field for field in fields if field not in ("custom_users_assigned", "_user_tags")]
+    assignment_columns = [field for field in ISSUE_ASSIGNMENT_FIELDS if field != "parent"]
+    dictionaries = {"users": {}, "teams": {}, "tags": {}}
+    
+    def encode_value(dictionary, value):
+        return dictionaries[dictionary].setdefault(value, len(dictionaries[dictionary]))
+    
+    rows = []
+    for issue in issues:
+        assignments = []
+        for assignment in issue.get("custom_users_assigned") or []:
+            row = [assignment.get(field) for field in assignment_columns]
+            row[assignment_columns.index("user_assigned")] = encode_value("users", assignment.get("user_assigned"))
+            row[assignment_columns.index("team")] = encode_value("teams", assignment.get("team"))
+            assignments.append(row)
+        
+        rows.append(
+            [issue.get(field) for field in columns]
+            + [assignments, [encode_value("tags", tag) for tag in issue.get("_user_tags") or []]]
+        )
+    
+    return {
+        "format": COLUMNAR_FORMAT,
+        "columns": [*columns, "custom_users_assigned", "_user_tags"],
+        "assignment_columns": assignment_columns,
+        "rows": rows,
+        # Dictionaries keep insertion order, so a value's position is its index
+        **{name: list(values) for name, values in dictionaries.items()}
+    }
+
+
+def format_issues(issues, fields, response_format=None):
+    """The page of issues as list rows, or encoded with encode_issues_columnar for format=columnar"""
+    if response_format == COLUMNAR_FORMAT:
+        return encode_issues_columnar(issues, fields)
+    return issues
+
+
+def get_issues_page(fields, filter_list, or_filters, order_by, limit_page_length, limit_start=0, pagination="offset", cursor=None, response_format=None):
+    """
+    Fetch one page of issues with their assignments and tags
+    Offset pagination returns the list of issues
+    Cursor pagination seeks past the cursor instead of skipping limit_start rows and returns {"issues": [...], "next_cursor": ...}
+    With response_format="columnar" the issues are returned encoded by encode_issues_columnar
+    """
+    if pagination != "cursor" and not cursor:
+        issues = frappe.get_list(
+            "Issue",
+            fields=fields,
+            filters=filter_list,
+            or_filters=or_filters,
+            order_by=order_by,
+            limit_page_length=limit_page_length,
+            limit_start=limit_start
+        )
+        
+        # Fetch the custom_users_assigned child table data and tags for the whole page
+        attach_assignments_and_tags(issues)
         
-        if issue_names:
-            issue_names_sets.append(issue_names)
+        return format_issues(issues, fields, response_format)
+    
+    sort_keys = get_keyset_sort_keys(order_by)
+    filter_list = list(filter_list)
+    if cursor:
+        filter_list.append(get_keyset_condition(sort_keys, decode_issue_cursor(cursor, sort_keys)))
+    
+    # Sort key values are needed to build the next cursor
+    fields = fields + [field for field, direction in sort_keys if field not in fields]
+    
+    # Fetch one extra row to know whether there is a next page
+    issues = frappe.get_list(
+        "Issue",
+        fields=fields,
+        filters=filter_list,
+        or_filters=or_filters,
+        order_by=", ".join(f"{field} {direction}" for field, direction in sort_keys),
+        limit_page_length=limit_page_length + 1 if limit_page_length else 0
+    )
+    
+    next_cursor = None
+    if limit_page_length and len(issues) > limit_page_length:
+        issues = issues[:limit_page_length]
+        next_cursor = encode_issue_cursor(issues[-1], sort_keys)
+    
+    attach_assignments_and_tags(issues)
+    
+    return {"issues": format_issues(issues, fields, response_format), "next_cursor": next_cursor}
+
+
+class IssueFilterPlan:
+    """
+    A frontend filter list compiled once: field predicates and or-groups for frappe.get_list,
+    tag semi-joins on Tag Link and child table semi-joins on Team User Assignment
+    Plans are shared between requests, so the filters are handed out as copies
+    """
+
+    __slots__ = ("child_conditions", "field_filters", "or_groups", "tag_conditions")
+
+    def __init__(self, field_filters, or_groups, tag_conditions, child_conditions):
+        self.field_filters = tuple(field_filters)
+        self.or_groups = tuple(or_groups)
+        self.tag_conditions = tuple(tag_conditions)
+        self.child_conditions = tuple(child_conditions)
+
+    def get_filter_list(self):
+        """frappe.get_list filters (field predicates, then tag and child table conditions)"""
+        return copy.deepcopy(list(self.field_filters)) + list(self.tag_conditions) + list(self.child_conditions)
+
+    def get_or_filters(self):
+        return copy.deepcopy(list(self.or_groups))
+
+
+def compile_issue_filter_plan(filters):
+    """Walk the frontend filter list once and compile it into an IssueFilterPlan"""
+    processed_filters, or_filters = process_filter_list(filters)
+    return IssueFilterPlan(
+        field_filters=[make_filter_tuple("Issue", field, value) for field, value in processed_filters.items()],
+        or_groups=or_filters,
+        # Tag filters are compiled into semi-joins on Tag Link (since tags are in a separate table)
+        tag_conditions=get_tag_filter_conditions(get_tag_filters(filters)),
+        # Child table filters are compiled into subqueries on Team User Assignment (since they are in child tables)
+        child_conditions=get_child_table_filter_conditions(get_child_table_filters(filters))
+    )
+
+
+@functools.lru_cache(maxsize=ISSUE_FILTER_PLAN_CACHE_SIZE)
+def get_cached_issue_filter_plan(db_type, filters_key):
+    """Compiled plan of a canonical filter JSON, db_type is part of the key since escaping depends on it"""
+    return compile_issue_filter_plan(json.loads(filters_key))
+
+
+def get_issue_filter_plan(filters):
+    """
+    IssueFilterPlan for the frontend filter list, memoized by its canonical JSON
+    so the list, count and stat endpoints of a screen share one parse
+    """
+    if not filters or not isinstance(filters, list):
+        return compile_issue_filter_plan(filters)
+
+    try:
+        filters_key = json.dumps(filters, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        # Not plain JSON, compile without caching
+        return compile_issue_filter_plan(filters)
+
+    return get_cached_issue_filter_plan(frappe.db.db_type, filters_key)
+
+
+def build_issue_filters(filters):
+    """
+    Build frappe.get_list filters from the frontend filter list
+    Returns (filter_list, or_filters) with tag and child table filters compiled into SQL conditions
+    """
+    plan = get_issue_filter_plan(filters)
+    return plan.get_filter_list(), plan.get_or_filters()
+
+
+def count_issues(filters=None, or_filters=None):
+    """
+    Count the issues the user can see with SELECT COUNT(*) instead of fetching every matching name
+    Accepts the same filters and or_filters as frappe.get_list and applies the same permission conditions
+    """
+    result = frappe.get_list(
+        "Issue",
+        fields=["count(`tabIssue`.name) as total_count"],
+        filters=filters,
+        or_filters=or_filters,
+        ignore_permissions=False
+    )
+    return cint(result[0].total_count) if result else 0
+
+
+def get_issue_filter_conditions(filter_list, or_filters=None):
+    """
+    Convert frappe.get_list style filters on Issue into SQL conditions for raw aggregate queries
+    """
+    query = DatabaseQuery("Issue")
+    conditions = []
+    query.build_filter_conditions(filter_list or [], conditions)
+    
+    if or_filters:
+        or_conditions = []
+        query.build_filter_conditions(or_filters, or_conditions)
+        conditions.append(" OR ".join(f"({condition})" for condition in or_conditions))
     
-    # Intersect all sets (AND operation between different tag filters)
-    if not issue_names_sets:
-        return None
+    return conditions
+
+
+def get_issue_permission_conditions():
+    """
+    Get the permission conditions frappe.get_list applies to Issue for the session user
+    (user permissions, the issue_query hook and shared documents) for use in raw SQL
+    """
+    query = DatabaseQuery("Issue")
+    conditions = [query.build_match_conditions()]
+    # Users who can only see shared issues get their share condition added to query.conditions
+    conditions.extend(query.conditions)
+    return [condition for condition in conditions if condition]
+
+
+def get_stat_filter_conditions(stat_type, user, permission_conditions=None):
+    """
+    Get the SQL conditions on `tabIssue` that select the issues counted by a stat type
+    Returns a list so it can be appended to frappe.get_list filters
+    """
+    escaped_user = frappe.db.escape(user, percent=False)
+    assignment_exists = """EXISTS (
+        SELECT 1 FROM `tabTeam User Assignment`
+        WHERE `tabTeam User Assignment`.parent = `tabIssue`.name
+        AND `tabTeam User Assignment`.parenttype = 'Issue'
+        AND `tabTeam User Assignment`.parentfield = 'custom_users_assigned'
+        AND {condition}
+    )"""
+    
+    if stat_type == "assigned_to_me":
+        # Issues where the current user is individually assigned
+        condition = f"`tabTeam User Assignment`.user_assigned = {escaped_user}"
+        return [assignment_exists.format(condition=condition)]
     
-    result = issue_names_sets[0]
+    elif stat_type == "open_tickets":
+        # Issues where no one from the current user's team(s) is assigned (regardless of status).
+        # The user's teams come from their own assignments on issues they can see; the inner
+        # `tabIssue` shadows the outer one so the permission conditions apply to it unchanged.
+        if permission_conditions is None:
+            permission_conditions = get_issue_permission_conditions()
+        permission_sql = "".join(f" AND ({condition})" for condition in permission_conditions)
+        condition = f"""`tabTeam User Assignment`.team IN (
+            SELECT `user_team`.team FROM `tabTeam User Assignment` `user_team`
+            INNER JOIN `tabIssue` ON `tabIssue`.name = `user_team`.parent
+            WHERE `user_team`.parenttype = 'Issue'
+            AND `user_team`.parentfield = 'custom_users_assigned'
+            AND `user_team`.user_assigned = {escaped_user}
+            AND IFNULL(`user_team`.team, '') != ''{permission_sql}
+        )"""
+        return [f"NOT {assignment_exists.format(condition=condition)}"]
+    
+    elif stat_type == "actionable_tickets":
+        # Issues where customer awaits reply (custom_is_response_expected = 1)
+        return ["`tabIssue`.custom_is_response_expected = 1"]
+    
+    elif stat_type == "response_tickets":
+        # Issues awaiting customer response (custom_is_response_awaited = 1)
+        return ["`tabIssue`.custom_is_response_awaited = 1"]
+    
+    # team_tickets: all issues the user can see
+    return []
+
+
+def get_issue_stat_counts(filter_conditions=None, permission_conditions=None):
+    """
+    Count every stat type in a single aggregate query over the issues the user can see
+    filter_conditions are extra SQL conditions on `tabIssue` applied to all counts
+    """
+    user = frappe.session.user
+    if permission_conditions is None:
+        permission_conditions = get_issue_permission_conditions()
+    
+    # One COUNT / SUM(CASE ...) column per stat type
+    columns = []
+    for stat_type in STAT_TYPES:
+        stat_conditions = get_stat_filter_conditions(stat_type, user, permission_conditions)
+        if stat_conditions:
+            stat_condition = " AND ".join(f"({condition})" for condition in stat_conditions)
+            columns.append(f"SUM(CASE WHEN {stat_condition} THEN 1 ELSE 0 END) AS `{stat_type}`")
+        else:
+            columns.append(f"COUNT(*) AS `{stat_type}`")
+    
+    conditions = list(filter_conditions or []) + permission_conditions
+    where_clause = " AND ".join(f"({condition})" for condition in conditions) or "1=1"
+    
+    result = frappe.db.sql(
+        f"""SELECT {", ".join(columns)} FROM `tabIssue` WHERE {where_clause}""",
+        as_dict=True
+    )
+    counts = result[0] if result else {}
+    
+    return {
+        "team_tickets": cint(counts.get("team_tickets")),
+        "open_tickets": cint(counts.get("open_tickets")),
+        "assigned_to_me": cint(counts.get("assigned_to_me")),
+        "actionable_tickets": cint(counts.get("actionable_tickets")),
+        "response_tickets": cint(counts.get("response_tickets"))
+    }
+
+
+def get_issue_list_watermark():
+    """
+    Cheap version of the data the issue list, count and stat endpoints read:
+    max(modified) of Issue, Team User Assignment, Tag Link and DocShare (read from their modified indexes)
+    and the change generation
+    Shares decide which issues restricted users see, without changing their permission conditions
+    """
+    modified = frappe.db.sql(
+        """SELECT (SELECT MAX(modified) FROM `tabIssue`),
+            (SELECT MAX(modified) FROM `tabTeam User Assignment`),
+            (SELECT MAX(modified) FROM `tabTag Link`),
+            (SELECT MAX(modified) FROM `tabDocShare`)"""
+    )[0]
+    generation = redis_command("GET", frappe.cache.make_key(ISSUE_LIST_GENERATION_KEY))
+    return [str(value) for value in modified] + [frappe.safe_decode(generation or "")]
+
+
+def bump_issue_list_generation(doc, method=None):
+    """
+    DocShare on_update / after_delete: an Issue share changes what its user sees in the list
+    Removed shares don't move max(modified), so the generation changes after commit
+    """
+    if doc.share_doctype != "Issue":
+        return
+    
+    def bump():
+        try:
+            redis_command("INCR", frappe.cache.make_key(ISSUE_LIST_GENERATION_KEY))
+        except Exception as e:
+            frappe.log_error(f"Error bumping the issue list generation for {doc.name}: {e!s}")
+    
+    frappe.db.after_commit.add(bump)
+
+
+def get_issue_list_etag(endpoint, params, permission_conditions):
+    """ETag of an endpoint response: the watermark, the user's permission signature and a hash of the parameters"""
+    permission_signature = [frappe.session.user, *permission_conditions]
+    key = json.dumps(
+        [endpoint, params, get_issue_list_watermark(), permission_signature],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def parse_if_none_match(header):
+    """Entity tags of an If-None-Match header, without the weak W/ prefix and the quotes"""
+    etags = []
+    for etag in (header or "").split(","):
+        etag = etag.strip()
+        if etag.startswith("W/"):
+            etag = etag[2:]
+        if len(etag) >= 2 and etag.startswith('"') and etag.endswith('"'):
+            etag = etag[1:-1]
+        if etag:
+            etags.append(etag)
+    return etags
+
+
+def is_issue_list_not_modified(endpoint, permission_conditions=None, **params):
+    """
+    Conditional GET for the issue list, count and stat endpoints
+    Sets the ETag of the response and answers 304 Not Modified (no body) when If-None-Match holds it
+    Returns True when the endpoint should return without running its queries
+    Endpoints that query with the permission conditions pass them in, so they are built once per request
+    Only the endpoint the request called is checked, not the ones it calls internally
+    """
+    request = getattr(frappe.local, "request", None)
+    if request is None or not request.path.rstrip("/").endswith(f".{endpoint}"):
+        return False
     
-    for i, issue_set in enumerate(issue_names_sets[1:], 2):
-        result = result.intersection(issue_set)
+    try:
+        if permission_conditions is None:
+            permission_conditions = get_issue_permission_conditions()
+        etag = get_issue_list_etag(endpoint, params, permission_conditions)
+    except Exception as e:
+        # Serve the response without an ETag rather than failing it
+        frappe.log_error(f"Error computing the ETag of {endpoint}: {e!s}")
+        return False
     
-    final_result = list(result)
+    response_headers = getattr(frappe.local, "response_headers", None)
+    if response_headers is not None:
+        response_headers["ETag"] = f'"{etag}"'
+        # Browsers keep the response and revalidate it on every request
+        response_headers["Cache-Control"] = "private, no-cache"
     
-    return final_result
+    if etag in parse_if_none_match(request.headers.get("If-None-Match")):
+        frappe.local.response.http_status_code = 304
+        return True
+    return False
 
 
 @frappe.whitelist()
-def get_issues_with_assignments(limit_page_length=10, limit_start=0, filters=None, order_by="creation desc"):
+def get_issues_with_assignments(limit_page_length=10, limit_start=0, filters=None, order_by="creation desc", pagination="offset", cursor=None, format=None):
     """
     Get issues list with custom_users_assigned child table data
     Enhanced to handle complex filter objects from frontend and support advanced sorting
+    With pagination="cursor" (or a cursor) returns {"issues": [...], "next_cursor": ...} for keyset pagination
+    With format="columnar" the issues are returned in the compact form of encode_issues_columnar
     """
     try:
+        # Conditional GET: nothing the response depends on changed since the client's copy
+        if is_issue_list_not_modified(
+            "get_issues_with_assignments",
+            limit_page_length=limit_page_length,
+            limit_start=limit_start,
+            filters=filters,
+            order_by=order_by,
+            pagination=pagination,
+            cursor=cursor,
+            format=format
+        ):
+            return None
+        
         # Convert string parameters to integers
         limit_page_length = int(limit_page_length)
         limit_start = int(limit_start)
@@ -572,113 +1017,23 @@ def get_issues_with_assignments(limit_page_length=10, limit_start=0, filters=Non
             filters = json.loads(filters)
             
         # Base fields to fetch from Issue doctype
-        fields = [
-            "name",
-            "subject", 
-            "status",
-            "priority",
-            "raised_by",
-            "customer",
-            "project",
-            "issue_type",
-            "creation",
-            "modified",
-            "owner",
-            "description",
-            "custom_is_response_expected",
-            "custom_assigned_csm_team"
-        ]
+        fields = list(ISSUE_LIST_FIELDS)
         
-        # Process new filter structure from frontend
-        processed_filters, or_filters = process_filter_list(filters)
-        
-        # Handle tag filters separately (since tags are in Tag Link table)
-        tag_filters = get_tag_filters(filters)
-        issue_names_from_tags = None
-        
-        if tag_filters:
-            issue_names_from_tags = get_issues_by_tag_filters(tag_filters)
-            if issue_names_from_tags is not None:
-                if len(issue_names_from_tags) == 0:
-                    return []
-        
-        # Handle child table filters separately (since they are in child tables)
-        child_filters = get_child_table_filters(filters)
-        issue_names_from_child_tables = None
-        
-        if child_filters:
-            issue_names_from_child_tables = get_issues_by_child_table_filters(child_filters)
-            if issue_names_from_child_tables is not None:
-                if len(issue_names_from_child_tables) == 0:
-                    return []
-        
-        # Combine all issue name restrictions
-        final_issue_names = None
-        if issue_names_from_tags is not None and issue_names_from_child_tables is not None:
-            # Both filters exist - intersect them
-            final_issue_names = list(set(issue_names_from_tags).intersection(set(issue_names_from_child_tables)))
-        elif issue_names_from_tags is not None:
-            final_issue_names = issue_names_from_tags
-        elif issue_names_from_child_tables is not None:
-            final_issue_names = issue_names_from_child_tables
-        
-        # Apply combined name filter if needed
-        if final_issue_names is not None:
-            if len(final_issue_names) == 0:
-                return []
-            else:
-                processed_filters['name'] = ['in', final_issue_names]
+        # Process new filter structure from frontend, including tag and child table filters
+        filter_list, or_filters = build_issue_filters(filters)
         
         # Get issues using frappe.get_list with enhanced filter handling
-        
-        if or_filters:
-            issues = frappe.get_list(
-                "Issue",
-                fields=fields,
-                filters=processed_filters,
-                or_filters=or_filters,
-                order_by=validated_order_by,
-                limit_page_length=limit_page_length,
-                limit_start=limit_start
-            )
-        else:
-            issues = frappe.get_list(
-                "Issue",
-                fields=fields,
-                filters=processed_filters,
-                order_by=validated_order_by,
-                limit_page_length=limit_page_length,
-                limit_start=limit_start
-            )
-        
-        
-        # For each issue, fetch the custom_users_assigned child table data and tags
-        for issue in issues:
-            # Get child table data for custom_users_assigned
-            user_assignments = frappe.db.get_all(
-                "Team User Assignment",
-                filters={"parent": issue.name},
-                fields=["*"],  # Get all fields to ensure user_assigned is included
-                order_by="idx asc"  # Order by idx to maintain the order from the form
-            )
-            
-            issue["custom_users_assigned"] = user_assignments
-            
-            # Get tags for this issue
-            tags = frappe.db.get_all(
-                "Tag Link",
-                filters={
-                    "document_type": "Issue",
-                    "document_name": issue.name
-                },
-                fields=["tag"],
-                order_by="creation asc"
-            )
-            
-            # Convert tags to a simple list of tag names
-            issue["_user_tags"] = [tag.tag for tag in tags] if tags else []
-        
-        return issues
+        return get_issues_page(
+            fields,
+            filter_list,
+            or_filters,
+            validated_order_by,
+            limit_page_length,
+            limit_start=limit_start,
+            pagination=pagination,
+            cursor=cursor,
+            response_format=format
+        )
         
     except Exception as e:
         frappe.log_error(f"Error in get_issues_with_assignments: {str(e)}")
@@ -692,176 +1047,252 @@ def get_issues_count_with_filters(filters=None):
     Enhanced to handle complex filter objects from frontend
     """
     try:
+        # Conditional GET: nothing the response depends on changed since the client's copy
+        if is_issue_list_not_modified("get_issues_count_with_filters", filters=filters):
+            return None
+        
         # Handle filters
         if filters is None:
             filters = []
         elif isinstance(filters, str):
             filters = json.loads(filters)
         
-        # Process new filter structure from frontend
-        processed_filters, or_filters = process_filter_list(filters)
-        
-        # Handle tag filters separately
-        tag_filters = get_tag_filters(filters)
-        issue_names_from_tags = None
-        
-        if tag_filters:
-            issue_names_from_tags = get_issues_by_tag_filters(tag_filters)
-            if issue_names_from_tags is not None:
-                if len(issue_names_from_tags) == 0:
-                    # No issues match tag filters
-                    return 0
-                else:
-                    # Add name filter to restrict to issues matching tags
-                    processed_filters['name'] = ['in', issue_names_from_tags]
-        
-        # Use frappe.get_list to get count while respecting permissions
-        if or_filters:
-            result = frappe.get_list(
-                "Issue",
-                filters=processed_filters,
-                or_filters=or_filters,
-                limit_page_length=0,
-                as_list=True,
-                ignore_permissions=False
-            )
-        else:
-            result = frappe.get_list(
-                "Issue",
-                filters=processed_filters,
-                limit_page_length=0,
-                as_list=True,
-                ignore_permissions=False
-            )
+        # Build the same field, tag and child table filters as get_issues_with_assignments
+        filter_list, or_filters = build_issue_filters(filters)
         
         # Return the count of records that the user is allowed to see
-        return len(result)
+        return count_issues(filter_list, or_filters)
         
     except Exception as e:
         frappe.log_error(f"Error in get_issues_count_with_filters: {str(e)}")
         frappe.throw(_("Failed to get issues count: {0}").format(str(e)))
 
 
+def get_issue_rows(issue_names):
+    """
+    List rows (same fields, permissions and hydration as get_issues_with_assignments) of the given issues
+    in their order, issues that don't exist or the user can't see are left out
+    One projected query for the rows plus the two hydration queries, whatever the number of names
+    """
+    issue_names = list(dict.fromkeys(issue_names or []))[:ISSUE_NAMES_LIMIT]
+    if not issue_names:
+        return []
+
+    issues = frappe.get_list(
+        "Issue",
+        fields=list(ISSUE_LIST_FIELDS),
+        filters={"name": ["in", issue_names]},
+        limit_page_length=len(issue_names)
+    )
+    attach_assignments_and_tags(issues)
+
+    position = {name: i for i, name in enumerate(issue_names)}
+    return sorted(issues, key=lambda issue: position[issue.name])
+
+
 @frappe.whitelist()
 def get_single_issue_with_assignments(issue_name):
     """
-    Get a single issue with custom_users_assigned child table data
-    Used for realtime updates to refresh individual rows
+    Get a single issue row with custom_users_assigned child table data
+    Used for realtime updates to refresh individual rows, returns None when the issue is gone or hidden
     """
     try:
-        # Base fields to fetch from Issue doctype
-        fields = [
-            "name",
-            "subject", 
-            "status",
-            "priority",
-            "raised_by",
-            "customer",
-            "project",
-            "issue_type",
-            "creation",
-            "modified",
-            "owner",
-            "description",
-            "custom_is_response_expected",
-            "custom_assigned_csm_team"
-        ]
-        
-        # Get the single issue
-        issue = frappe.get_doc("Issue", issue_name)
+        rows = get_issue_rows([issue_name])
+        return rows[0] if rows else None
         
-        # Convert to dict with only required fields
-        issue_data = {}
-        for field in fields:
-            issue_data[field] = getattr(issue, field, None)
-        
-        # Get child table data for custom_users_assigned
-        user_assignments = frappe.db.get_all(
-            "Team User Assignment",
-            filters={"parent": issue_name},
-            fields=["*"],  # Get all fields to ensure user_assigned is included
-            order_by="idx asc"  # Order by idx to maintain the order from the form
-        )
+    except Exception as e:
+        frappe.log_error(f"Error in get_single_issue_with_assignments: {str(e)}")
+        frappe.throw(_("Failed to fetch single issue: {0}").format(str(e)))
+
+
+@frappe.whitelist()
+def get_issues_by_names(issue_names):
+    """
+    List rows (same shape as get_issues_with_assignments) of the given issues the user can see, in their order
+    For clients resyncing their visible rows in one call after missing realtime deltas
+    """
+    try:
+        if isinstance(issue_names, str):
+            issue_names = json.loads(issue_names)
         
-        issue_data["custom_users_assigned"] = user_assignments
-        
-        # Get tags for this issue
-        tags = frappe.db.get_all(
-            "Tag Link",
-            filters={
-                "document_type": "Issue",
-                "document_name": issue_name
-            },
-            fields=["tag"],
-            order_by="creation asc"
-        )
+        return get_issue_rows(issue_names)
         
-        # Convert tags to a simple list of tag names
-        issue_data["_user_tags"] = [tag.tag for tag in tags] if tags else []
+    except Exception as e:
+        frappe.log_error(f"Error in get_issues_by_names: {e!s}")
+        frappe.throw(_("Failed to fetch issues: {0}").format(str(e)))
+
+
+@frappe.whitelist()
+def get_issue_descriptions(issue_names):
+    """
+    Full descriptions of the issues the user expands in the list, as {name: description}
+    The list endpoints only return custom_description_snippet
+    """
+    try:
+        if isinstance(issue_names, str):
+            issue_names = json.loads(issue_names)
         
-        return issue_data
+        issue_names = list(dict.fromkeys(issue_names or []))[:ISSUE_NAMES_LIMIT]
+        if not issue_names:
+            return {}
         
-    except frappe.DoesNotExistError:
-        # Issue was deleted, return None
-        return None
+        # frappe.get_list so issues the user can't see are left out
+        issues = frappe.get_list(
+            "Issue",
+            fields=["name", "description"],
+            filters={"name": ["in", issue_names]},
+            limit_page_length=len(issue_names),
+            ignore_permissions=False
+        )
+        return {issue.name: issue.description for issue in issues}
         
     except Exception as e:
-        frappe.log_error(f"Error in get_single_issue_with_assignments: {str(e)}")
-        frappe.throw(_("Failed to fetch single issue: {0}").format(str(e)))
+        frappe.log_error(f"Error in get_issue_descriptions: {e!s}")
+        frappe.throw(_("Failed to fetch issue descriptions: {0}").format(str(e)))
+
+
+def build_tag_color_map():
+    """
+    Map tag names, and the Tag Category names themselves, to their category color
+    One join over Tag Category and Tag instead of one Tag query per category
+    """
+    if not frappe.db.exists("DocType", "Tag Category"):
+        return {}
+    
+    tag_join = ""
+    tag_column = "NULL"
+    if frappe.db.has_column("Tag", "custom_tag_category"):
+        tag_join = "LEFT JOIN `tabTag` tag ON tag.custom_tag_category = tc.tag_category_name"
+        tag_column = "tag.name"
+    
+    rows = frappe.db.sql(
+        f"""SELECT tc.tag_category_name AS category, tc.category_color AS color, {tag_column} AS tag
+        FROM `tabTag Category` tc
+        {tag_join}
+        WHERE IFNULL(tc.category_color, '') != ''
+        ORDER BY tc.tag_category_name, tag""",
+        as_dict=True
+    )
+    
+    tag_color_map = {}
+    for row in rows:
+        if row.tag:
+            tag_color_map[row.tag] = row.color
+        # Also map the category name itself as a tag (for direct matching)
+        tag_color_map[row.category] = row.color
+    
+    return tag_color_map
+
+
+def get_tag_color_data():
+    """
+    The tag color map with its version, from Redis or built and cached
+    The version is a hash of the map, so clients holding the same map keep their copy after a rebuild
+    """
+    data = frappe.cache.get_value(TAG_COLORS_CACHE_KEY)
+    if data is None:
+        colors = build_tag_color_map()
+        version = hashlib.md5(json.dumps(colors, sort_keys=True).encode()).hexdigest()[:16]
+        data = {"version": version, "colors": colors}
+        frappe.cache.set_value(TAG_COLORS_CACHE_KEY, data)
+    return data
+
+
+def clear_tag_colors_cache(doc=None, method=None, *args):
+    """Tag / Tag Category changes: drop the cached map, the next request builds a new version"""
+    frappe.cache.delete_value(TAG_COLORS_CACHE_KEY)
+
+
+def is_tag_colors_version_current(version, data):
+    """Whether the client's version (argument or If-None-Match header) matches the cached map"""
+    if not version and getattr(frappe.local, "request", None):
+        return data["version"] in parse_if_none_match(frappe.request.headers.get("If-None-Match"))
+    return bool(version) and version == data["version"]
 
 
 @frappe.whitelist()
 def get_tag_colors():
     """
-    Get all tag colors from Tag Categories
-    Returns a mapping of tag names to their colors
+    Get all tag colors from Tag Categories
+    Returns a mapping of tag names to their colors
+    """
+    try:
+        return get_tag_color_data()["colors"]
+        
+    except Exception as e:
+        frappe.log_error(f"Error in get_tag_colors: {str(e)}")
+        # Return empty dict instead of raising exception to prevent frontend errors
+        return {}
+
+
+@frappe.whitelist()
+def get_tag_color_map(version=None):
+    """
+    Versioned tag color map for clients that keep a local copy
+    Returns {"version", "colors"}, or only {"version"} when the client's version is current
+    An If-None-Match request for the current version is answered with 304 Not Modified
     """
     try:
-        # Check if Tag Category doctype exists
-        if not frappe.db.exists("DocType", "Tag Category"):
-            frappe.log_error("Tag Category doctype does not exist")
-            return {}
+        data = get_tag_color_data()
         
-        # Get all Tag Categories with their colors
-        tag_categories = frappe.get_all(
-            "Tag Category",
-            fields=["tag_category_name", "category_color"],
-            limit_page_length=0
-        )
+        response_headers = getattr(frappe.local, "response_headers", None)
+        if response_headers is not None:
+            response_headers["ETag"] = f'"{data["version"]}"'
         
-        tag_color_map = {}
-        
-        # For each category, get all tags that belong to it
-        for category in tag_categories:
-            if category.get("category_color"):
-                try:
-                    # Check if the custom_tag_category field exists on Tag doctype
-                    if frappe.db.has_column("Tag", "custom_tag_category"):
-                        # Get all tags in this category
-                        tags_in_category = frappe.get_all(
-                            "Tag",
-                            fields=["name"],
-                            filters={"custom_tag_category": category.tag_category_name},
-                            limit_page_length=0
-                        )
-                        
-                        # Map each tag to the category color
-                        for tag in tags_in_category:
-                            tag_color_map[tag.name] = category.category_color
-                    
-                    # Also map the category name itself as a tag (for direct matching)
-                    tag_color_map[category.tag_category_name] = category.category_color
-                    
-                except Exception as inner_e:
-                    frappe.log_error(f"Error processing category {category.tag_category_name}: {str(inner_e)}")
-                    continue
-        
-        return tag_color_map
+        if is_tag_colors_version_current(version, data):
+            if not version:
+                frappe.local.response.http_status_code = 304
+            return {"version": data["version"]}
+        
+        return data
         
     except Exception as e:
-        frappe.log_error(f"Error in get_tag_colors: {str(e)}")
-        # Return empty dict instead of raising exception to prevent frontend errors
-        return {}
+        frappe.log_error(f"Error in get_tag_color_map: {e!s}")
+        # Return empty map instead of raising exception to prevent frontend errors
+        return {"version": None, "colors": {}}
+
+
+@request_cache
+def has_issue_search_index():
+    """
+    Check whether the Issue FULLTEXT search index exists (MariaDB only)
+    """
+    return frappe.db.db_type == "mariadb" and bool(frappe.db.has_index("tabIssue", ISSUE_SEARCH_INDEX))
+
+
+def get_issue_search_condition(search_query):
+    """
+    Build the SQL condition and ranking expression that match issues for a search query
+    Words are matched as word prefixes anywhere in name, subject, customer and raised_by through the FULLTEXT index,
+    words too short for the index are checked with LIKE on the rows the index found
+    Falls back to LIKE '%query%' on every column when the index is missing or no word is long enough
+    Returns (condition, relevance)
+    """
+    name_prefix = f"`tabIssue`.name LIKE {frappe.db.escape(search_query + '%', percent=False)}"
+    
+    words = re.findall(r"\w+", search_query)
+    long_words = [word for word in words if len(word) >= ISSUE_SEARCH_MIN_WORD_LENGTH]
+    short_words = [word for word in words if len(word) < ISSUE_SEARCH_MIN_WORD_LENGTH]
+    
+    def like_any_column(text):
+        pattern = frappe.db.escape(f"%{text}%", percent=False)
+        return "(" + " OR ".join(f"`tabIssue`.`{column}` LIKE {pattern}" for column in ISSUE_SEARCH_COLUMNS) + ")"
+    
+    if not long_words or not has_issue_search_index():
+        # Full scan, same as the search before the index existed
+        return like_any_column(search_query), f"({name_prefix})"
+    
+    # Every word must match the start of a word in one of the columns: +word1* +word2*
+    against = frappe.db.escape(" ".join(f"+{word}*" for word in long_words), percent=False)
+    columns = ", ".join(f"`tabIssue`.`{column}`" for column in ISSUE_SEARCH_COLUMNS)
+    match = f"MATCH({columns}) AGAINST ({against} IN BOOLEAN MODE)"
+    
+    condition = " AND ".join([match] + [like_any_column(word) for word in short_words])
+    
+    # Issue name prefix matches first, then FULLTEXT relevance
+    relevance = f"({name_prefix}) * 100 + {match}"
+    
+    return condition, relevance
 
 
 @frappe.whitelist()
@@ -869,7 +1300,8 @@ def issue_search(search_query="", limit=8):
     """
     Search issues for autocomplete suggestions
     Returns only essential fields: name, subject, status, raised_by, creation, description
-    This function respects permissions by using frappe.get_list
+    Matches go through the Issue FULLTEXT index and are ranked by relevance,
+    with the same permission conditions frappe.get_list applies
     """
     try:
         # Convert string parameters
@@ -881,22 +1313,19 @@ def issue_search(search_query="", limit=8):
         
         search_query = search_query.strip()
         
-        # Use frappe.get_list with or_filters to respect permissions
-        or_filters = [
-            ["name", "like", f"%{search_query}%"],
-            ["subject", "like", f"%{search_query}%"],
-            ["customer", "like", f"%{search_query}%"],
-            ["raised_by", "like", f"%{search_query}%"]
-        ]
-        
-        # Get issues using frappe.get_list to respect permissions
-        issues = frappe.get_list(
-            "Issue",
-            fields=["name", "subject", "status", "raised_by", "creation", "description"],
-            or_filters=or_filters,
-            order_by="modified desc",
-            limit_page_length=limit,
-            ignore_permissions=False
+        search_condition, relevance = get_issue_search_condition(search_query)
+        conditions = [search_condition, *get_issue_permission_conditions()]
+        where_clause = " AND ".join(f"({condition})" for condition in conditions)
+        
+        # Raw SQL so results can be ranked by relevance, newest activity breaks ties
+        issues = frappe.db.sql(
+            f"""SELECT `tabIssue`.name, `tabIssue`.subject, `tabIssue`.status,
+                `tabIssue`.raised_by, `tabIssue`.creation, `tabIssue`.description
+            FROM `tabIssue`
+            WHERE {where_clause}
+            ORDER BY {relevance} DESC, `tabIssue`.modified DESC
+            LIMIT {limit}""",
+            as_dict=True
         )
         
         return issues
@@ -906,6 +1335,34 @@ def issue_search(search_query="", limit=8):
         frappe.throw(_("Failed to search issues: {0}").format(str(e)))
 
 
+def get_issue_search_page(search_query, fields, order_by, limit_page_length, limit_start=0):
+    """
+    One page of the issues matching a search, best matches first and order_by (validated) breaking ties
+    Raw SQL like issue_search, frappe.get_list doesn't accept the relevance expression in order_by,
+    with the same permission conditions frappe.get_list applies
+    """
+    search_condition, relevance = get_issue_search_condition(search_query)
+    conditions = [search_condition, *get_issue_permission_conditions()]
+    where_clause = " AND ".join(f"({condition})" for condition in conditions)
+    
+    # order_by only holds sortable fields and directions (validate_and_clean_order_by)
+    tie_breakers = ", ".join(
+        f"`tabIssue`.`{part.split()[0]}` {part.split()[1]}" for part in order_by.split(", ")
+    )
+    order_by_clause = f"{relevance} DESC, {tie_breakers}" if search_query else tie_breakers
+    
+    limit_clause = f"LIMIT {cint(limit_page_length)} OFFSET {cint(limit_start)}" if cint(limit_page_length) else ""
+    
+    return frappe.db.sql(
+        f"""SELECT {", ".join(f"`tabIssue`.`{field}`" for field in fields)}
+        FROM `tabIssue`
+        WHERE {where_clause}
+        ORDER BY {order_by_clause}
+        {limit_clause}""",
+        as_dict=True
+    )
+
+
 @frappe.whitelist()
 def filter_issues_by_suggestion(suggestion_type, suggestion_value, limit_page_length=10, limit_start=0, order_by="creation desc"):
     """
@@ -948,13 +1405,8 @@ def filter_issues_by_suggestion(suggestion_type, suggestion_value, limit_page_le
             filters["project"] = suggestion_value
         else:
             # Default: search in multiple fields if type is not specified
-            # Use frappe.get_list with or_filters to respect permissions
-            or_filters = [
-                ["name", "like", f"%{suggestion_value}%"],
-                ["subject", "like", f"%{suggestion_value}%"],
-                ["customer", "like", f"%{suggestion_value}%"],
-                ["raised_by", "like", f"%{suggestion_value}%"]
-            ]
+            # Same FULLTEXT backed condition and ranking as issue_search
+            search_query = str(suggestion_value or "").strip()
             
             # Base fields to fetch from Issue doctype
             fields = [
@@ -969,43 +1421,14 @@ def filter_issues_by_suggestion(suggestion_type, suggestion_value, limit_page_le
                 "creation",
                 "modified",
                 "owner",
-                "description",
+                "custom_description_snippet",
                 "custom_assigned_csm_team"
             ]
             
-            # Get issues using frappe.get_list to respect permissions
-            issues = frappe.get_list(
-                "Issue",
-                fields=fields,
-                or_filters=or_filters,
-                order_by=validated_order_by,
-                limit_page_length=limit_page_length,
-                limit_start=limit_start,
-                ignore_permissions=False
-            )
+            issues = get_issue_search_page(search_query, fields, validated_order_by, limit_page_length, limit_start)
             
-            # Add child table data and tags for each issue
-            for issue in issues:
-                # Get child table data for custom_users_assigned
-                user_assignments = frappe.db.get_all(
-                    "Team User Assignment",
-                    filters={"parent": issue.name},
-                    fields=["*"],
-                    order_by="idx asc"
-                )
-                issue["custom_users_assigned"] = user_assignments
-                
-                # Get tags for this issue
-                tags = frappe.db.get_all(
-                    "Tag Link",
-                    filters={
-                        "document_type": "Issue",
-                        "document_name": issue.name
-                    },
-                    fields=["tag"],
-                    order_by="creation asc"
-                )
-                issue["_user_tags"] = [tag.tag for tag in tags] if tags else []
+            # Add child table data and tags for the whole page
+            attach_assignments_and_tags(issues)
             
             return issues
         
@@ -1029,101 +1452,20 @@ def get_issue_stats():
     Returns stats that respect the same permission system as other functions
     """
     try:
-        # Get all issues that the user can see (respects permissions)
-        all_issues = frappe.get_list(
-            "Issue",
-            fields=[
-                "name",
-                "status",
-                "raised_by",
-                "custom_is_response_awaited",
-                "custom_is_response_expected",
-            "custom_assigned_csm_team"
-            ],
-            limit_page_length=0,  # Get all records
-            ignore_permissions=False
-        )
-        
-        # Get current user
-        current_user = frappe.session.user
-        
-        # Get current user's team(s) by checking their assignments across all issues
-        user_teams = set()
-        
-        # Get all user assignments for issues the user can see
-        if all_issues:
-            issue_names = [issue.name for issue in all_issues]
-            user_assignments = frappe.db.get_all(
-                "Team User Assignment",
-                filters={
-                    "parent": ["in", issue_names],
-                    "parenttype": "Issue",
-                    "parentfield": "custom_users_assigned"
-                },
-                fields=["*"]  # Get all fields to debug what's available
-            )
-                        
-            # Find current user's teams
-            for assignment in user_assignments:
-                # Handle different possible field names for user_assigned
-                user_field = assignment.get('user_assigned') or assignment.get('user') or assignment.get('assigned_user')
-                team_field = assignment.get('team')
-                
-                if user_field == current_user and team_field:
-                    user_teams.add(team_field)
-            
-            # Create a mapping of issue to its assignments for efficient lookup
-            issue_assignments = {}
-            for assignment in user_assignments:
-                if assignment.parent not in issue_assignments:
-                    issue_assignments[assignment.parent] = []
-                issue_assignments[assignment.parent].append(assignment)
-        else:
-            issue_assignments = {}
-        
-        # Calculate statistics
-        stats = {
-            "team_tickets": len(all_issues),
-            "open_tickets": 0,
-            "assigned_to_me": 0,
-            "actionable_tickets": 0,
-            "response_tickets": 0
-        }
-        
-        for issue in all_issues:
-            issue_name = issue.name
-            issue_status = issue.status
-            
-            # Get assignments for this issue
-            assignments = issue_assignments.get(issue_name, [])
-            
-            # Check if assigned to current user
-            is_assigned_to_me = any(
-                (assignment.get('user_assigned') or assignment.get('user') or assignment.get('assigned_user')) == current_user 
-                for assignment in assignments
-            )
-            
-            if is_assigned_to_me:
-                stats["assigned_to_me"] += 1
-            
-            # Open tickets: no one from current user's team is assigned (regardless of status)
-            has_team_assignment = any(
-                assignment.team in user_teams 
-                for assignment in assignments 
-                if assignment.team
-            )
-            if not has_team_assignment:
-                stats["open_tickets"] += 1
-            
-            # Actionable tickets: Customer awaits reply (custom_is_response_expected = 1)
-            if issue.custom_is_response_expected:
-                stats["actionable_tickets"] += 1
-            
-            # Response tickets: Awaiting customer response (custom_is_response_awaited = 1)
-            if issue.custom_is_response_awaited:
-                stats["response_tickets"] += 1
+        permission_conditions = get_issue_permission_conditions()
         
-        return stats
+        # Conditional GET: nothing the response depends on changed since the client's copy
+        if is_issue_list_not_modified("get_issue_stats", permission_conditions):
+            return None
+
+        # Users who see every Issue read the incrementally maintained counters
+        if not permission_conditions:
+            stats = get_issue_statistics(frappe.session.user)
+            if stats is not None:
+                return stats
+
+        # Count all stat types in one aggregate query (respects permissions)
+        return get_issue_stat_counts(permission_conditions=permission_conditions)
         
     except Exception as e:
         frappe.log_error(f"Error in get_issue_stats: {str(e)}")
@@ -1131,12 +1473,31 @@ def get_issue_stats():
 
 
 @frappe.whitelist()
-def get_issues_by_stat_filter(stat_type, limit_page_length=10, limit_start=0, order_by="creation desc", filters=None):
+def get_issues_by_stat_filter(stat_type, limit_page_length=10, limit_start=0, order_by="creation desc", filters=None, pagination="offset", cursor=None, format=None):
     """
     Get issues filtered by stat type (team_tickets, open_tickets, assigned_to_me, etc.)
     Enhanced to accept additional filters from the frontend
+    With pagination="cursor" (or a cursor) returns {"issues": [...], "next_cursor": ...} for keyset pagination
+    With format="columnar" the issues are returned in the compact form of encode_issues_columnar
     """
     try:
+        permission_conditions = get_issue_permission_conditions()
+        
+        # Conditional GET: nothing the response depends on changed since the client's copy
+        if is_issue_list_not_modified(
+            "get_issues_by_stat_filter",
+            permission_conditions,
+            stat_type=stat_type,
+            limit_page_length=limit_page_length,
+            limit_start=limit_start,
+            order_by=order_by,
+            filters=filters,
+            pagination=pagination,
+            cursor=cursor,
+            format=format
+        ):
+            return None
+        
         # Convert string parameters to integers
         limit_page_length = int(limit_page_length)
         limit_start = int(limit_start)
@@ -1160,281 +1521,27 @@ def get_issues_by_stat_filter(stat_type, limit_page_length=10, limit_start=0, or
             except:
                 filters = []
         
-        # Process additional filters
-        additional_filters, additional_or_filters = process_filter_list(filters)
-        
-        # Handle tag filters from additional filters
-        tag_filters = get_tag_filters(filters)
-        issue_names_from_tags = None
+        # Build field, tag and child table filters shared by every stat type
+        filter_list, or_filters = build_issue_filters(filters)
         
-        if tag_filters:
-            issue_names_from_tags = get_issues_by_tag_filters(tag_filters)
-            if issue_names_from_tags is not None:
-                if len(issue_names_from_tags) == 0:
-                    return []  # No issues match tag filters
-        
-        # Handle child table filters separately (since they are in child tables)
-        child_filters = get_child_table_filters(filters)
-        issue_names_from_child_tables = None
-        
-        if child_filters:
-            issue_names_from_child_tables = get_issues_by_child_table_filters(child_filters)
-            if issue_names_from_child_tables is not None:
-                if len(issue_names_from_child_tables) == 0:
-                    return []
-        
-        # Get current user
-        current_user = frappe.session.user
+        # Add the stat type predicate so filtering and pagination run in the database
+        filter_list.extend(get_stat_filter_conditions(stat_type, frappe.session.user, permission_conditions))
         
         # Base fields to fetch from Issue doctype
-        fields = [
-            "name",
-            "subject", 
-            "status",
-            "priority",
-            "raised_by",
-            "customer",
-            "project",
-            "issue_type",
-            "creation",
-            "modified",
-            "owner",
-            "description",
-            "custom_is_response_expected",
-            "custom_assigned_csm_team"
-        ]
-        
-        # Combine all issue name restrictions
-        final_issue_names = None
-        if issue_names_from_tags is not None and issue_names_from_child_tables is not None:
-            # Both filters exist - intersect them
-            final_issue_names = list(set(issue_names_from_tags).intersection(set(issue_names_from_child_tables)))
-        elif issue_names_from_tags is not None:
-            final_issue_names = issue_names_from_tags
-        elif issue_names_from_child_tables is not None:
-            final_issue_names = issue_names_from_child_tables
-        
-        # Build filters based on stat type
-        if stat_type == "team_tickets":
-            # All issues user can see with additional filters
-            combined_filters = additional_filters.copy()
-            
-            # Apply combined filtering if needed
-            if final_issue_names is not None:
-                if len(final_issue_names) == 0:
-                    return []  # No issues match filters
-                combined_filters['name'] = ['in', final_issue_names]
-
-
-            if additional_or_filters:
-                issues = frappe.get_list(
-                    "Issue",
-                    fields=fields,
-                    filters=combined_filters,
-                    or_filters=additional_or_filters,
-                    order_by=validated_order_by,
-                    limit_page_length=limit_page_length,
-                    limit_start=limit_start,
-                    ignore_permissions=False
-                )
-            else:
-                issues = frappe.get_list(
-                    "Issue",
-                    fields=fields,
-                    filters=combined_filters,
-                    order_by=validated_order_by,
-                    limit_page_length=limit_page_length,
-                    limit_start=limit_start,
-                    ignore_permissions=False
-                )
-        
-        elif stat_type == "assigned_to_me":
-            # Get all issues first, then filter by assignment
-            all_issues = frappe.get_list(
-                "Issue",
-                fields=fields + ["name"],
-                limit_page_length=0,  # Get all to filter
-                ignore_permissions=False
-            )
-            
-            # Get user assignments for all issues
-            if all_issues:
-                issue_names = [issue.name for issue in all_issues]
-                user_assignments = frappe.db.get_all(
-                    "Team User Assignment",
-                    filters={
-                        "parent": ["in", issue_names],
-                        "parenttype": "Issue",
-                        "parentfield": "custom_users_assigned",
-                        "user_assigned": current_user
-                    },
-                    fields=["parent"]
-                )
-                
-                assigned_issue_names = [assignment.parent for assignment in user_assignments]
-                
-                # Filter issues to only those assigned to current user
-                filtered_issues = [issue for issue in all_issues if issue.name in assigned_issue_names]
-                
-                # Apply pagination to filtered results
-                start_idx = limit_start
-                end_idx = limit_start + limit_page_length
-                issues = filtered_issues[start_idx:end_idx]
-            else:
-                issues = []
-        
-        elif stat_type == "open_tickets":
-            # Get all issues first, then filter by team assignment logic
-            all_issues = frappe.get_list(
-                "Issue",
-                fields=fields + ["name"],
-                limit_page_length=0,  # Get all to filter
-                ignore_permissions=False
-            )
-            
-            if all_issues:
-                issue_names = [issue.name for issue in all_issues]
-                
-                # Get current user's teams
-                user_assignments = frappe.db.get_all(
-                    "Team User Assignment",
-                    filters={
-                        "parent": ["in", issue_names],
-                        "parenttype": "Issue",
-                        "parentfield": "custom_users_assigned"
-                    },
-                    fields=["*"]
-                )
-                
-                user_teams = set()
-                for assignment in user_assignments:
-                    if assignment.user_assigned == current_user and assignment.team:
-                        user_teams.add(assignment.team)
-                
-                # Create mapping of issues to their team assignments
-                issue_team_assignments = {}
-                for assignment in user_assignments:
-                    if assignment.parent not in issue_team_assignments:
-                        issue_team_assignments[assignment.parent] = []
-                    if assignment.team:
-                        issue_team_assignments[assignment.parent].append(assignment.team)
-                
-                # Filter for open tickets (no team member assigned)
-                open_issues = []
-                for issue in all_issues:
-                    assigned_teams = issue_team_assignments.get(issue.name, [])
-                    has_team_assignment = any(team in user_teams for team in assigned_teams)
-                    if not has_team_assignment:
-                        open_issues.append(issue)
-                
-                # Apply pagination to filtered results
-                start_idx = limit_start
-                end_idx = limit_start + limit_page_length
-                issues = open_issues[start_idx:end_idx]
-            else:
-                issues = []
-        
-        elif stat_type == "actionable_tickets":
-            # Issues where customer awaits reply (custom_is_response_expected = 1)
-            combined_filters = additional_filters.copy()
-            combined_filters["custom_is_response_expected"] = 1
-            
-            # Apply combined filtering if needed
-            if final_issue_names is not None:
-                if len(final_issue_names) == 0:
-                    return []
-                combined_filters['name'] = ['in', final_issue_names]
-            
-            if additional_or_filters:
-                issues = frappe.get_list(
-                    "Issue",
-                    fields=fields,
-                    filters=combined_filters,
-                    or_filters=additional_or_filters,
-                    order_by=validated_order_by,
-                    limit_page_length=limit_page_length,
-                    limit_start=limit_start,
-                    ignore_permissions=False
-                )
-            else:
-                issues = frappe.get_list(
-                    "Issue",
-                    fields=fields,
-                    filters=combined_filters,
-                    order_by=validated_order_by,
-                    limit_page_length=limit_page_length,
-                    limit_start=limit_start,
-                    ignore_permissions=False
-                )
-        
-        elif stat_type == "response_tickets":
-            # Issues awaiting customer response (custom_is_response_awaited = 1)
-            combined_filters = additional_filters.copy()
-            combined_filters["custom_is_response_awaited"] = 1
-            
-            # Apply combined filtering if needed
-            if final_issue_names is not None:
-                if len(final_issue_names) == 0:
-                    return []
-                combined_filters['name'] = ['in', final_issue_names]
-            
-            if additional_or_filters:
-                issues = frappe.get_list(
-                    "Issue",
-                    fields=fields,
-                    filters=combined_filters,
-                    or_filters=additional_or_filters,
-                    order_by=validated_order_by,
-                    limit_page_length=limit_page_length,
-                    limit_start=limit_start,
-                    ignore_permissions=False
-                )
-            else:
-                issues = frappe.get_list(
-                    "Issue",
-                    fields=fields,
-                    filters=combined_filters,
-                    order_by=validated_order_by,
-                    limit_page_length=limit_page_length,
-                    limit_start=limit_start,
-                    ignore_permissions=False
-                )
-        
-        else:
-            # Default to all issues
-            issues = frappe.get_list(
-                "Issue",
-                fields=fields,
-                order_by=validated_order_by,
-                limit_page_length=limit_page_length,
-                limit_start=limit_start,
-                ignore_permissions=False
-            )
-        
-        # Add child table data and tags for each issue
-        for issue in issues:
-            # Get child table data for custom_users_assigned
-            user_assignments = frappe.db.get_all(
-                "Team User Assignment",
-                filters={"parent": issue.name},
-                fields=["*"],
-                order_by="idx asc"
-            )
-            issue["custom_users_assigned"] = user_assignments
-            
-            # Get tags for this issue
-            tags = frappe.db.get_all(
-                "Tag Link",
-                filters={
-                    "document_type": "Issue",
-                    "document_name": issue.name
-                },
-                fields=["tag"],
-                order_by="creation asc"
-            )
-            issue["_user_tags"] = [tag.tag for tag in tags] if tags else []
-        
-        return issues
+        fields = list(ISSUE_LIST_FIELDS)
+        
+        # Fetch the page and add child table data and tags for the whole page
+        return get_issues_page(
+            fields,
+            filter_list,
+            or_filters,
+            validated_order_by,
+            limit_page_length,
+            limit_start=limit_start,
+            pagination=pagination,
+            cursor=cursor,
+            response_format=format
+        )
         
     except Exception as e:
         frappe.log_error(f"Error in get_issues_by_stat_filter: {str(e)}")
@@ -1452,9 +1559,14 @@ def get_stat_filter_count(stat_type, filters=None):
         if not stat_type:
             frappe.throw(_("stat_type parameter is required"))
         
-        valid_stat_types = ["team_tickets", "assigned_to_me", "open_tickets", "actionable_tickets", "response_tickets"]
-        if stat_type not in valid_stat_types:
-            frappe.throw(_("Invalid stat_type: {0}. Valid types are: {1}").format(stat_type, ', '.join(valid_stat_types)))
+        if stat_type not in STAT_TYPES:
+            frappe.throw(_("Invalid stat_type: {0}. Valid types are: {1}").format(stat_type, ', '.join(STAT_TYPES)))
+        
+        permission_conditions = get_issue_permission_conditions()
+        
+        # Conditional GET: nothing the response depends on changed since the client's copy
+        if is_issue_list_not_modified("get_stat_filter_count", permission_conditions, stat_type=stat_type, filters=filters):
+            return None
         
         # Handle additional filters from frontend
         if filters is None:
@@ -1465,232 +1577,13 @@ def get_stat_filter_count(stat_type, filters=None):
             except:
                 filters = []
         
-        # Process additional filters with error handling
-        try:
-            additional_filters, additional_or_filters = process_filter_list(filters)
-        except Exception as filter_error:
-            additional_filters, additional_or_filters = {}, []
+        # Build field, tag and child table filters shared by every stat type
+        filter_list, or_filters = build_issue_filters(filters)
         
-        # Handle tag filters from additional filters with error handling
-        try:
-            tag_filters = get_tag_filters(filters)
-            issue_names_from_tags = None
-            
-            if tag_filters:
-                issue_names_from_tags = get_issues_by_tag_filters(tag_filters)
-                if issue_names_from_tags is not None:
-                    if len(issue_names_from_tags) == 0:
-                        return 0  # No issues match tag filters
-        except Exception as tag_error:
-            issue_names_from_tags = None
-        
-        # Handle child table filters with error handling
-        try:
-            child_filters = get_child_table_filters(filters)
-            issue_names_from_child_tables = None
-            
-            if child_filters:
-                issue_names_from_child_tables = get_issues_by_child_table_filters(child_filters)
-                if issue_names_from_child_tables is not None:
-                    if len(issue_names_from_child_tables) == 0:
-                        return 0  # No issues match child table filters
-        except Exception as child_error:
-            issue_names_from_child_tables = None
-        
-        # Combine all issue name restrictions
-        final_issue_names = None
-        if issue_names_from_tags is not None and issue_names_from_child_tables is not None:
-            # Both filters exist - intersect them
-            final_issue_names = list(set(issue_names_from_tags).intersection(set(issue_names_from_child_tables)))
-            if len(final_issue_names) == 0:
-                return 0
-        elif issue_names_from_tags is not None:
-            final_issue_names = issue_names_from_tags
-        elif issue_names_from_child_tables is not None:
-            final_issue_names = issue_names_from_child_tables
-        
-        # Get current user
-        current_user = frappe.session.user
-        
-        if stat_type == "team_tickets":
-            # All issues user can see with additional filters
-            combined_filters = additional_filters.copy()
-            
-            # Apply combined filtering if needed
-            if final_issue_names is not None:
-                if len(final_issue_names) == 0:
-                    return 0  # No issues match filters
-                combined_filters['name'] = ['in', final_issue_names]
-            
-            try:
-                if additional_or_filters:
-                    all_issues = frappe.get_list(
-                        "Issue",
-                        filters=combined_filters,
-                        or_filters=additional_or_filters,
-                        limit_page_length=0,
-                        as_list=True,
-                        ignore_permissions=False
-                    )
-                else:
-                    all_issues = frappe.get_list(
-                        "Issue",
-                        filters=combined_filters,
-                        limit_page_length=0,
-                        as_list=True,
-                        ignore_permissions=False
-                    )
-                return len(all_issues)
-            except Exception as db_error:
-                return 0
-        
-        elif stat_type == "assigned_to_me":
-            # Get all issues first, then filter by assignment
-            try:
-                all_issues = frappe.get_list(
-                    "Issue",
-                    fields=["name"],
-                    limit_page_length=0,
-                    ignore_permissions=False
-                )
-                
-                if all_issues:
-                    issue_names = [issue.name for issue in all_issues]
-                    
-                    # Check if Team User Assignment table exists
-                    if not frappe.db.table_exists("Team User Assignment"):
-                        return 0
-                    
-                    user_assignments = frappe.db.get_all(
-                        "Team User Assignment",
-                        filters={
-                            "parent": ["in", issue_names],
-                            "parenttype": "Issue",
-                            "parentfield": "custom_users_assigned",
-                            "user_assigned": current_user
-                        },
-                        fields=["parent"]
-                    )
-                    return len(user_assignments)
-                return 0
-            except Exception as db_error:
-                return 0
-        
-        elif stat_type == "open_tickets":
-            # Use the same logic as in get_issue_stats
-            all_issues = frappe.get_list(
-                "Issue",
-                fields=["name"],
-                limit_page_length=0,
-                ignore_permissions=False
-            )
-            
-            if all_issues:
-                issue_names = [issue.name for issue in all_issues]
-                user_assignments = frappe.db.get_all(
-                    "Team User Assignment",
-                    filters={
-                        "parent": ["in", issue_names],
-                        "parenttype": "Issue",
-                        "parentfield": "custom_users_assigned"
-                    },
-                    fields=["*"]
-                )
-                
-                user_teams = set()
-                for assignment in user_assignments:
-                    if assignment.user_assigned == current_user and assignment.team:
-                        user_teams.add(assignment.team)
-                
-                issue_team_assignments = {}
-                for assignment in user_assignments:
-                    if assignment.parent not in issue_team_assignments:
-                        issue_team_assignments[assignment.parent] = []
-                    if assignment.team:
-                        issue_team_assignments[assignment.parent].append(assignment.team)
-                
-                open_count = 0
-                for issue in all_issues:
-                    assigned_teams = issue_team_assignments.get(issue.name, [])
-                    has_team_assignment = any(team in user_teams for team in assigned_teams)
-                    if not has_team_assignment:
-                        open_count += 1
-                
-                return open_count
-            return 0
-        
-        elif stat_type == "actionable_tickets":
-            # Issues where customer awaits reply with additional filters
-            combined_filters = additional_filters.copy()
-            combined_filters["custom_is_response_expected"] = 1
-            
-            # Apply combined filtering if needed
-            if final_issue_names is not None:
-                if len(final_issue_names) == 0:
-                    return 0
-                combined_filters['name'] = ['in', final_issue_names]
-            
-            if additional_or_filters:
-                result = frappe.get_list(
-                    "Issue",
-                    filters=combined_filters,
-                    or_filters=additional_or_filters,
-                    limit_page_length=0,
-                    as_list=True,
-                    ignore_permissions=False
-                )
-            else:
-                result = frappe.get_list(
-                    "Issue",
-                    filters=combined_filters,
-                    limit_page_length=0,
-                    as_list=True,
-                    ignore_permissions=False
-                )
-            return len(result)
-        
-        elif stat_type == "response_tickets":
-            # Issues awaiting customer response with additional filters
-            combined_filters = additional_filters.copy()
-            combined_filters["custom_is_response_awaited"] = 1
-            
-            # Apply combined filtering if needed
-            if final_issue_names is not None:
-                if len(final_issue_names) == 0:
-                    return 0
-                combined_filters['name'] = ['in', final_issue_names]
-            
-            if additional_or_filters:
-                result = frappe.get_list(
-                    "Issue",
-                    filters=combined_filters,
-                    or_filters=additional_or_filters,
-                    limit_page_length=0,
-                    as_list=True,
-                    ignore_permissions=False
-                )
-            else:
-                result = frappe.get_list(
-                    "Issue",
-                    filters=combined_filters,
-                    limit_page_length=0,
-                    as_list=True,
-                    ignore_permissions=False
-                )
-            return len(result)
+        # Add the stat type predicate so the count runs in the database
+        filter_list.extend(get_stat_filter_conditions(stat_type, frappe.session.user, permission_conditions))
         
-        else:
-            # Default to all issues
-            try:
-                all_issues = frappe.get_list(
-                    "Issue",
-                    limit_page_length=0,
-                    as_list=True,
-                    ignore_permissions=False
-                )
-                return len(all_issues)
-            except Exception as db_error:
-                return 0
+        return count_issues(filter_list, or_filters)
         
     except Exception as e:
         error_message = str(e)
@@ -1700,6 +1593,137 @@ def get_stat_filter_count(stat_type, filters=None):
         return 0
 
 
+@frappe.whitelist()
+def get_stat_filter_counts(filters=None):
+    """
+    Get counts for every stat filter type in a single pass
+    The filters are parsed once and shared by all stat types, so the stat cards need one request per filter change
+    """
+    try:
+        permission_conditions = get_issue_permission_conditions()
+        
+        # Conditional GET: nothing the response depends on changed since the client's copy
+        if is_issue_list_not_modified("get_stat_filter_counts", permission_conditions, filters=filters):
+            return None
+        
+        # Handle additional filters from frontend
+        if filters is None:
+            filters = []
+        elif isinstance(filters, str):
+            try:
+                filters = json.loads(filters)
+            except:
+                filters = []
+        
+        # Build field, tag and child table filters once for all stat types
+        filter_list, or_filters = build_issue_filters(filters)
+        
+        return get_issue_stat_counts(get_issue_filter_conditions(filter_list, or_filters), permission_conditions)
+        
+    except Exception as e:
+        frappe.log_error(f"Error in get_stat_filter_counts: {e!s}")
+        
+        # Return zeros instead of throwing to avoid frontend errors
+        return {stat_type: 0 for stat_type in STAT_TYPES}
+
+
+@frappe.whitelist()
+def get_issue_tracker_data(stat_type=None, limit_page_length=10, limit_start=0, order_by="creation desc", filters=None, pagination="offset", cursor=None, tag_colors_version=None):
+    """
+    Get everything the issue tracker needs for first paint in a single request
+    Returns the page of issues, their total, the global and filtered stat counts and the tag color map
+    The tag color map is left out (None) when tag_colors_version is the current version
+    The filters and the permission condition are resolved once, and each part reports its time in milliseconds
+    """
+    def elapsed_ms(start):
+        return round((time.perf_counter() - start) * 1000, 2)
+    
+    try:
+        request_start = time.perf_counter()
+        timings = {}
+        
+        # Convert string parameters to integers
+        limit_page_length = int(limit_page_length)
+        limit_start = int(limit_start)
+        
+        if stat_type and stat_type not in STAT_TYPES:
+            frappe.throw(_("Invalid stat type: {0}").format(stat_type))
+        
+        # Process and validate order_by parameter
+        if isinstance(order_by, str) and order_by.startswith('[') and order_by.endswith(']'):
+            try:
+                order_by = json.loads(order_by)
+            except:
+                order_by = "creation desc"
+        
+        validated_order_by = validate_and_clean_order_by(process_order_by(order_by))
+        
+        # Handle additional filters from frontend
+        if filters is None:
+            filters = []
+        elif isinstance(filters, str):
+            try:
+                filters = json.loads(filters)
+            except:
+                filters = []
+        
+        # Parse the filters and resolve the permission condition once for every part
+        start = time.perf_counter()
+        filter_list, or_filters = build_issue_filters(filters)
+        permission_conditions = get_issue_permission_conditions()
+        page_filters = list(filter_list)
+        if stat_type:
+            page_filters.extend(get_stat_filter_conditions(stat_type, frappe.session.user, permission_conditions))
+        timings["filters"] = elapsed_ms(start)
+        
+        start = time.perf_counter()
+        issues = get_issues_page(
+            list(ISSUE_LIST_FIELDS),
+            page_filters,
+            or_filters,
+            validated_order_by,
+            limit_page_length,
+            limit_start=limit_start,
+            pagination=pagination,
+            cursor=cursor
+        )
+        timings["issues"] = elapsed_ms(start)
+        
+        start = time.perf_counter()
+        total = count_issues(page_filters, or_filters)
+        timings["total"] = elapsed_ms(start)
+        
+        # Global stats for the stat cards, and the per-stat counts with the filters applied
+        start = time.perf_counter()
+        stats = get_issue_stat_counts(permission_conditions=permission_conditions)
+        if filter_list or or_filters:
+            stat_counts = get_issue_stat_counts(get_issue_filter_conditions(filter_list, or_filters), permission_conditions)
+        else:
+            stat_counts = stats
+        timings["stats"] = elapsed_ms(start)
+        
+        start = time.perf_counter()
+        tag_color_data = get_tag_color_data()
+        tag_colors = None if tag_colors_version == tag_color_data["version"] else tag_color_data["colors"]
+        timings["tag_colors"] = elapsed_ms(start)
+        
+        timings["request"] = elapsed_ms(request_start)
+        
+        return {
+            "issues": issues,
+            "total": total,
+            "stats": stats,
+            "stat_counts": stat_counts,
+            "tag_colors": tag_colors,
+            "tag_colors_version": tag_color_data["version"],
+            "timings": timings
+        }
+        
+    except Exception as e:
+        frappe.log_error(f"Error in get_issue_tracker_data: {e!s}")
+        frappe.throw(_("Failed to load issue tracker data: {0}").format(str(e)))
+
+
 @frappe.whitelist()
 def get_filtered_issues_count(suggestion_type, suggestion_value):
     """
@@ -1725,35 +1749,14 @@ def get_filtered_issues_count(suggestion_type, suggestion_value):
         elif suggestion_type == "project":
             filters = {"project": suggestion_value}
         else:
-            # Default: count with complex OR conditions using frappe.get_list to respect permissions
-            # Build a complex filter for multiple field search
-            or_filters = [
-                ["name", "like", f"%{suggestion_value}%"],
-                ["subject", "like", f"%{suggestion_value}%"],
-                ["customer", "like", f"%{suggestion_value}%"],
-                ["raised_by", "like", f"%{suggestion_value}%"]
-            ]
-            
-            result = frappe.get_list(
-                "Issue",
-                or_filters=or_filters,
-                limit_page_length=0,
-                as_list=True,
-                ignore_permissions=False
-            )
+            # Default: count with the same FULLTEXT backed search condition as filter_issues_by_suggestion
+            search_condition = get_issue_search_condition(str(suggestion_value or "").strip())[0]
             
-            return len(result)
-        
-        # For specific field filters, use frappe.get_list to respect permissions
-        result = frappe.get_list(
-            "Issue",
-            filters=filters,
-            limit_page_length=0,
-            as_list=True,
-            ignore_permissions=False
-        )
+            # COUNT(*) through frappe.get_list to respect permissions
+            return count_issues([search_condition])
         
-        return len(result)
+        # For specific field filters, COUNT(*) through frappe.get_list to respect permissions
+        return count_issues(filters)
         
     except Exception as e:
         frappe.log_error(f"Error in get_filtered_issues_count: {str(e)}")
@@ -1765,6 +1768,7 @@ def search_users(search_query="", limit=10, doctype_filter="User"):
     """
     Search users for autocomplete in filters
     Support searching in User doctype with different filter criteria
+    Results are read from memory and checked with frappe.has_permission, see utils/autocomplete_index
     """
     try:
         limit = int(limit)
@@ -1774,37 +1778,8 @@ def search_users(search_query="", limit=10, doctype_filter="User"):
         
         search_query = search_query.strip()
         
-        # Base fields to return
-        fields = ["name", "full_name", "email", "enabled"]
-        
-        # Build filters based on doctype_filter
-        filters = {"enabled": 1}  # Only enabled users
-        
-        if doctype_filter == "User":
-            # Search in all users
-            or_filters = [
-                ["name", "like", f"%{search_query}%"],
-                ["full_name", "like", f"%{search_query}%"],
-                ["email", "like", f"%{search_query}%"]
-            ]
-        else:
-            # Default to User doctype
-            or_filters = [
-                ["name", "like", f"%{search_query}%"],
-                ["full_name", "like", f"%{search_query}%"],
-                ["email", "like", f"%{search_query}%"]
-            ]
-        
-        # Get users using frappe.get_list to respect permissions
-        users = frappe.get_list(
-            "User",
-            fields=fields,
-            filters=filters,
-            or_filters=or_filters,
-            order_by="full_name asc",
-            limit_page_length=limit,
-            ignore_permissions=False
-        )
+        # Enabled users matching name, full name or email, answered from the worker's autocomplete index
+        users = search_autocomplete_index("User", search_query, limit)
         
         # Format results for frontend
         results = []
@@ -1831,6 +1806,7 @@ def search_users(search_query="", limit=10, doctype_filter="User"):
 def search_customers(search_query="", limit=10):
     """
     Search customers for autocomplete in filters
+    Results are read from memory and checked with frappe.has_permission, see utils/autocomplete_index
     """
     try:
         limit = int(limit)
@@ -1840,20 +1816,8 @@ def search_customers(search_query="", limit=10):
         
         search_query = search_query.strip()
         
-        # Get customers using frappe.get_list to respect permissions
-        or_filters = [
-            ["name", "like", f"%{search_query}%"],
-            ["customer_name", "like", f"%{search_query}%"]
-        ]
-        
-        customers = frappe.get_list(
-            "Customer",
-            fields=["name", "customer_name", "customer_group", "territory"],
-            or_filters=or_filters,
-            order_by="customer_name asc",
-            limit_page_length=limit,
-            ignore_permissions=False
-        )
+        # Customers matching name or customer name, answered from the worker's autocomplete index
+        customers = search_autocomplete_index("Customer", search_query, limit)
         
         # Format results for frontend
         results = []
@@ -1875,10 +1839,36 @@ def search_customers(search_query="", limit=10):
         frappe.throw(_("Failed to search customers: {0}").format(str(e)))
 
 
+def get_user_groups_with_member_counts():
+    """
+    Every User Group as (name, member count), ordered by name
+    One grouped LEFT JOIN, cached in Redis until a User Group changes
+    """
+    user_groups = frappe.cache.get_value(USER_GROUPS_CACHE_KEY)
+    if user_groups is None:
+        user_groups = frappe.db.sql(
+            """SELECT ug.name, COUNT(ugm.name) AS member_count
+            FROM `tabUser Group` ug
+            LEFT JOIN `tabUser Group Member` ugm ON ugm.parent = ug.name AND ugm.parenttype = 'User Group'
+            GROUP BY ug.name
+            ORDER BY ug.name ASC""",
+            as_list=True
+        )
+        user_groups = [[name, cint(member_count)] for name, member_count in user_groups]
+        frappe.cache.set_value(USER_GROUPS_CACHE_KEY, user_groups)
+    return user_groups
+
+
+def clear_user_groups_cache(doc=None, method=None, *args):
+    """User Group changes (members included): drop the cached groups and member counts"""
+    frappe.cache.delete_value(USER_GROUPS_CACHE_KEY)
+
+
 @frappe.whitelist()
 def search_user_groups(search_query="", limit=10):
     """
     Search User Groups for CSM Team autocomplete in filters
+    Matches against the cached group list, so a keystroke costs no query once it is built
     """
     try:
         limit = int(limit)
@@ -1886,37 +1876,25 @@ def search_user_groups(search_query="", limit=10):
         if not search_query or len(search_query.strip()) < 1:
             return []
         
-        search_query = search_query.strip()
-        
-        # Get user groups using frappe.get_list to respect permissions
-        or_filters = [
-            ["name", "like", f"%{search_query}%"]
-        ]
+        search_query = search_query.strip().lower()
         
-        user_groups = frappe.get_list(
-            "User Group",
-            fields=["name"],
-            or_filters=or_filters,
-            order_by="name asc",
-            limit_page_length=limit,
-            ignore_permissions=False
-        )
+        # The cached list is shared by every user, check read permission on User Group here
+        frappe.has_permission("User Group", "read", throw=True)
         
         # Format results for frontend
         results = []
-        for group in user_groups:
-            # Get member count for display
-            member_count = frappe.db.count(
-                "User Group Member",
-                filters={"parent": group.name}
-            )
+        for name, member_count in get_user_groups_with_member_counts():
+            if search_query not in name.lower():
+                continue
             
             results.append({
-                "value": group.name,
-                "label": group.name,
+                "value": name,
+                "label": name,
                 "subtitle": f"{member_count} member(s)" if member_count > 0 else "Empty group",
                 "type": "user_group"
             })
+            if len(results) >= limit:
+                break
         
         return results
         
@@ -1929,6 +1907,7 @@ def search_user_groups(search_query="", limit=10):
 def search_contacts(search_query="", limit=10):
     """
     Search contacts for autocomplete in filters
+    Results are read from memory and checked with frappe.has_permission, see utils/autocomplete_index
     """
     try:
         limit = int(limit)
@@ -1938,22 +1917,8 @@ def search_contacts(search_query="", limit=10):
         
         search_query = search_query.strip()
         
-        # Get contacts using frappe.get_list to respect permissions
-        or_filters = [
-            ["name", "like", f"%{search_query}%"],
-            ["first_name", "like", f"%{search_query}%"],
-            ["last_name", "like", f"%{search_query}%"],
-            ["email_id", "like", f"%{search_query}%"]
-        ]
-        
-        contacts = frappe.get_list(
-            "Contact",
-            fields=["name", "first_name", "last_name", "email_id", "company_name"],
-            or_filters=or_filters,
-            order_by="first_name asc",
-            limit_page_length=limit,
-            ignore_permissions=False
-        )
+        # Contacts matching name, first or last name or email, answered from the worker's autocomplete index
+        contacts = search_autocomplete_index("Contact", search_query, limit)
         
         # Format results for frontend
         results = []
@@ -2009,6 +1974,7 @@ def get_sortable_columns():
 def search_leads(search_query="", limit=10):
     """
     Search leads for autocomplete in filters
+    Results are read from memory and checked with frappe.has_permission, see utils/autocomplete_index
     """
     try:
         limit = int(limit)
@@ -2018,22 +1984,8 @@ def search_leads(search_query="", limit=10):
         
         search_query = search_query.strip()
         
-        # Get leads using frappe.get_list to respect permissions
-        or_filters = [
-            ["name", "like", f"%{search_query}%"],
-            ["lead_name", "like", f"%{search_query}%"],
-            ["email_id", "like", f"%{search_query}%"],
-            ["company_name", "like", f"%{search_query}%"]
-        ]
-        
-        leads = frappe.get_list(
-            "Lead",
-            fields=["name", "lead_name", "email_id", "company_name", "status"],
-            or_filters=or_filters,
-            order_by="lead_name asc",
-            limit_page_length=limit,
-            ignore_permissions=False
-        )
+        # Leads matching name, lead name, email or company, answered from the worker's autocomplete index
+        leads = search_autocomplete_index("Lead", search_query, limit)
         
         # Format results for frontend
         results = []
@@ -2068,108 +2020,50 @@ def search_leads(search_query="", limit=10):
 def search_tags(search_query="", limit=15):
     """
     Search tags for autocomplete in filters
-    Returns both existing tags from Tag doctype and tags currently used in issues
+    Returns existing tags with how many issues use them (custom_issue_usage_count, kept by the Tag Link hooks)
+    One Tag query per keystroke instead of a Tag and a Tag Link count query per tag
     """
     try:
         limit = int(limit)
+        search_query = (search_query or "").strip()
         
-        if not search_query or len(search_query.strip()) < 1:
+        fields = ["name", "custom_issue_usage_count as usage_count"]
+        if frappe.db.has_column("Tag", "tag_color"):
+            fields.append("tag_color")
+        
+        if not search_query:
             # If no search query, return most frequently used tags in issues
-            tag_links = frappe.db.get_all(
-                "Tag Link",
-                filters={"document_type": "Issue"},
-                fields=["tag", "count(name) as usage_count"],
-                group_by="tag",
-                order_by="usage_count desc",
-                limit=limit
+            tags = frappe.get_list(
+                "Tag",
+                fields=fields,
+                filters=[["custom_issue_usage_count", ">", 0]],
+                order_by="custom_issue_usage_count desc, name asc",
+                limit_page_length=limit,
+                ignore_permissions=False
             )
-            
-            results = []
-            for tag_link in tag_links:
-                # Get tag color if available
-                try:
-                    tag_doc = frappe.get_doc("Tag", tag_link.tag)
-                    tag_color = getattr(tag_doc, 'tag_color', None) or '#gray'
-                except:
-                    tag_color = '#gray'
-                
-                results.append({
-                    "value": tag_link.tag,
-                    "label": tag_link.tag,
-                    "subtitle": f"Used in {tag_link.usage_count} issue(s)",
-                    "type": "tag",
-                    "color": tag_color
-                })
-            
-            return results
-        
-        search_query = search_query.strip()
-        
-        # Search in existing tags first
-        tag_results = []
-        try:
+        else:
             tags = frappe.get_list(
                 "Tag",
-                fields=["name", "tag_color"],
+                fields=fields,
                 filters=[["name", "like", f"%{search_query}%"]],
                 order_by="name asc",
                 limit_page_length=limit,
                 ignore_permissions=False
             )
-            
-            for tag in tags:
-                # Check if this tag is used in issues
-                usage_count = frappe.db.count(
-                    "Tag Link",
-                    filters={"document_type": "Issue", "tag": tag.name}
-                )
-                
-                tag_results.append({
-                    "value": tag.name,
-                    "label": tag.name,
-                    "subtitle": f"Used in {usage_count} issue(s)" if usage_count > 0 else "Available tag",
-                    "type": "tag",
-                    "color": tag.tag_color or '#gray'
-                })
-        except:
-            # If Tag doctype doesn't exist or has issues, continue with tag links search
-            pass
-        
-        # Also search in tag links for tags actually used in issues
-        if len(tag_results) < limit:
-            remaining_limit = limit - len(tag_results)
-            existing_tag_names = [tag["value"] for tag in tag_results]
-            
-            tag_links = frappe.db.get_all(
-                "Tag Link",
-                filters={
-                    "document_type": "Issue",
-                    "tag": ["like", f"%{search_query}%"]
-                },
-                fields=["tag", "count(name) as usage_count"],
-                group_by="tag",
-                order_by="usage_count desc",
-                limit=remaining_limit * 2  # Get extra in case of duplicates
-            )
-            
-            for tag_link in tag_links:
-                if tag_link.tag not in existing_tag_names and len(tag_results) < limit:
-                    # Try to get tag color
-                    try:
-                        tag_doc = frappe.get_doc("Tag", tag_link.tag)
-                        tag_color = getattr(tag_doc, 'tag_color', None) or '#gray'
-                    except:
-                        tag_color = '#gray'
-                    
-                    tag_results.append({
-                        "value": tag_link.tag,
-                        "label": tag_link.tag,
-                        "subtitle": f"Used in {tag_link.usage_count} issue(s)",
-                        "type": "tag",
-                        "color": tag_color
-                    })
-        
-        return tag_results[:limit]
+        
+        # Tags without a color of their own use their category color
+        tag_colors = get_tag_color_data()["colors"]
+        
+        return [
+            {
+                "value": tag.name,
+                "label": tag.name,
+                "subtitle": f"Used in {tag.usage_count} issue(s)" if tag.usage_count else "Available tag",
+                "type": "tag",
+                "color": tag.get("tag_color") or tag_colors.get(tag.name) or '#gray'
+            }
+            for tag in tags
+        ]
         
     except Exception as e:
         frappe.log_error(f"Error in search_tags: {str(e)}")
@@ -0,0 +1,556 @@
+import json
+from typing import ClassVar
+from unittest.mock import patch
+
+import frappe
+import frappe.share
+from frappe.desk.doctype.tag.tag import add_tag
+from frappe.tests.utils import FrappeTestCase
+
+from force_trans_customization.api.issues import (
+    ISSUE_LIST_FIELDS,
+    build_issue_filters,
+    compile_issue_filter_plan,
+    encode_issues_columnar,
+    filter_issues_by_suggestion,
+    get_cached_issue_filter_plan,
+    get_issue_list_etag,
+    get_issue_permission_conditions,
+    get_issue_rows,
+    get_issue_search_condition,
+    get_issue_stat_counts,
+    get_issues_count_with_filters,
+    get_issues_page,
+    get_keyset_sort_keys,
+    has_issue_search_index,
+    parse_if_none_match,
+)
+
+
+def get_issue_stats_in_python():
+    """
+    Reference implementation of get_issue_stats that counts in Python
+    Kept here to check the aggregate query returns the same numbers
+    """
+    all_issues = frappe.get_list(
+        "Issue",
+        fields=["name", "custom_is_response_awaited", "custom_is_response_expected"],
+        limit_page_length=0,
+        ignore_permissions=False
+    )
+    current_user = frappe.session.user
+
+    issue_assignments = {}
+    user_teams = set()
+    if all_issues:
+        user_assignments = frappe.db.get_all(
+            "Team User Assignment",
+            filters={
+                "parent": ["in", [issue.name for issue in all_issues]],
+                "parenttype": "Issue",
+                "parentfield": "custom_users_assigned"
+            },
+            fields=["parent", "user_assigned", "team"]
+        )
+        for assignment in user_assignments:
+            if assignment.user_assigned == current_user and assignment.team:
+                user_teams.add(assignment.team)
+            issue_assignments.setdefault(assignment.parent, []).append(assignment)
+
+    stats = {
+        "team_tickets": len(all_issues),
+        "open_tickets": 0,
+        "assigned_to_me": 0,
+        "actionable_tickets": 0,
+        "response_tickets": 0
+    }
+    for issue in all_issues:
+        assignments = issue_assignments.get(issue.name, [])
+        if any(assignment.user_assigned == current_user for assignment in assignments):
+            stats["assigned_to_me"] += 1
+        if not any(assignment.team in user_teams for assignment in assignments if assignment.team):
+            stats["open_tickets"] += 1
+        if issue.custom_is_response_expected:
+            stats["actionable_tickets"] += 1
+        if issue.custom_is_response_awaited:
+            stats["response_tickets"] += 1
+
+    return stats
+
+
+def get_issues_by_tag_filters_in_python(tag_filters):
+    """
+    Reference implementation of the tag filters that intersects Tag Link name sets in Python
+    Kept here to check the Tag Link semi-joins select the same issues
+    """
+    all_issues = set(frappe.get_all("Issue", pluck="name"))
+    issue_tags = {}
+    for link in frappe.get_all("Tag Link", filters={"document_type": "Issue"}, fields=["document_name", "tag"]):
+        issue_tags.setdefault(link.document_name, set()).add(link.tag)
+
+    result = all_issues
+    for tag_filter in tag_filters:
+        tags = {tag.strip() for tag in tag_filter["value"].split(",") if tag.strip()}
+        if tag_filter["operator"] == "has":
+            issue_names = {name for name, linked in issue_tags.items() if tags & linked}
+        elif tag_filter["operator"] == "has_all":
+            issue_names = {name for name, linked in issue_tags.items() if tags <= linked}
+        else:
+            issue_names = {name for name in all_issues if not tags & issue_tags.get(name, set())}
+        result = result & issue_names
+
+    return result
+
+
+def get_issues_by_child_table_filters_in_python(child_filters):
+    """
+    Reference implementation of the assignment filters that intersects Team User Assignment name sets in Python
+    Kept here to check the Team User Assignment subqueries select the same issues
+    """
+    all_issues = set(frappe.get_all("Issue", pluck="name"))
+
+    result = all_issues
+    for child_filter in child_filters:
+        value = child_filter["value"]
+        values = [v.strip() for v in value.split(",") if v.strip()] if isinstance(value, str) else value
+        if not values:
+            continue
+
+        field = child_filter["field"]
+        child_field = "user_assigned" if field == "custom_users_assigned" else "team"
+        issue_values = {}
+        for row in frappe.get_all(
+            "Team User Assignment",
+            filters={"parenttype": "Issue", "parentfield": field},
+            fields=["parent", child_field]
+        ):
+            issue_values.setdefault(row.parent, set()).add(row[child_field])
+
+        if child_filter["operator"] == "not_in":
+            issue_names = {name for name in all_issues if not set(values) & issue_values.get(name, set())}
+        elif child_filter["operator"] == "in" and field == "custom_users_assigned":
+            issue_names = {name for name, linked in issue_values.items() if set(values) <= linked}
+        else:
+            issue_names = {name for name, linked in issue_values.items() if set(values) & linked}
+        result = result & issue_names
+
+    return result
+
+
+class TestIssueStats(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+
+        # (assignments as (user, team), response expected, response awaited)
+        seed = [
+            ([("Administrator", "Test Team A")], 1, 0),
+            ([("Guest", "Test Team A")], 0, 1),
+            ([("Guest", "Test Team B")], 1, 1),
+            ([("Administrator", "Test Team B"), ("Guest", "Test Team C")], 0, 0),
+            ([("Guest", "Test Team C")], 1, 0),
+            ([], 0, 0),
+        ]
+        for i, (assignments, response_expected, response_awaited) in enumerate(seed):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Stats {i}",
+                "description": "Testing issue statistics",
+                "raised_by": "customer@example.com",
+                "status": "Open",
+                "custom_is_response_expected": response_expected,
+                "custom_is_response_awaited": response_awaited
+            })
+            for user, team in assignments:
+                issue.append("custom_users_assigned", {"user_assigned": user, "team": team})
+            issue.insert()
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def test_issue_stats_match_python_implementation(self):
+        # Administrator is served from Issue Statistics by get_issue_stats, check the aggregate SQL itself
+        self.assertEqual(get_issue_stat_counts(), get_issue_stats_in_python())
+
+    def test_restricted_user_stats_match_python_implementation(self):
+        # A CSM user without groups only sees the issues they are individually assigned to
+        user = frappe.get_doc({
+            "doctype": "User",
+            "email": "test-issue-stats-csm@example.com",
+            "first_name": "Test CSM",
+            "send_welcome_email": 0,
+            "roles": [{"role": "Support Team"}]
+        }).insert(ignore_permissions=True)
+        issue = frappe.get_doc({
+            "doctype": "Issue",
+            "subject": "Test Issue for Stats restricted",
+            "raised_by": "customer@example.com",
+            "status": "Open",
+            "custom_is_response_expected": 1
+        })
+        issue.append("custom_users_assigned", {"user_assigned": user.name, "team": "Test Team A"})
+        issue.insert()
+
+        frappe.set_user(user.name)
+        self.assertTrue(get_issue_permission_conditions())
+        stats = get_issue_stat_counts()
+        self.assertEqual(stats, get_issue_stats_in_python())
+        self.assertEqual(stats["team_tickets"], 1)
+
+
+class TestIssueFilterPlan(FrappeTestCase):
+    filters: ClassVar[list[dict]] = [
+        {"field": "status", "operator": "in", "value": "Open, Replied"},
+        {"field": "subject", "operator": "contains", "value": "invoice"},
+        {"field": "_user_tags", "operator": "has", "value": "urgent"},
+        {"field": "custom_users_assigned", "operator": "in", "value": ["Administrator", "Guest"]},
+    ]
+
+    def setUp(self):
+        get_cached_issue_filter_plan.cache_clear()
+
+    def test_cached_plan_matches_compiled_plan(self):
+        plan = compile_issue_filter_plan(self.filters)
+        filter_list, or_filters = build_issue_filters(self.filters)
+        self.assertEqual(filter_list, plan.get_filter_list())
+        self.assertEqual(or_filters, plan.get_or_filters())
+
+    def test_plan_is_shared_by_canonical_json(self):
+        build_issue_filters(self.filters)
+        # Same filters with a different key order hit the same plan
+        reordered = [dict(reversed(list(filter_obj.items()))) for filter_obj in self.filters]
+        filter_list, or_filters = build_issue_filters(reordered)
+        self.assertEqual(get_cached_issue_filter_plan.cache_info().hits, 1)
+
+        # Callers extend the returned filters, the cached plan must not change
+        filter_list.append("1 = 0")
+        or_filters.clear()
+        self.assertNotIn("1 = 0", build_issue_filters(self.filters)[0])
+        self.assertTrue(build_issue_filters(self.filters)[1])
+
+
+class TestTagFilters(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        self.issue_names = []
+        for i, tags in enumerate([["test-red"], ["test-red", "test-blue"], ["test-blue", "test-green"], []]):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Tags {i}",
+                "raised_by": "customer@example.com",
+                "status": "Open"
+            }).insert()
+            for tag in tags:
+                add_tag(tag, "Issue", issue.name)
+            self.issue_names.append(issue.name)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def assertMatchesNameSets(self, tag_filters, expected):
+        filter_list, or_filters = build_issue_filters(tag_filters)
+        issue_names = set(frappe.get_list("Issue", filters=filter_list, or_filters=or_filters, pluck="name"))
+        self.assertEqual(issue_names, get_issues_by_tag_filters_in_python(tag_filters))
+        self.assertEqual(issue_names & set(self.issue_names), {self.issue_names[i] for i in expected})
+
+    def test_has(self):
+        self.assertMatchesNameSets([{"field": "_user_tags", "operator": "has", "value": "test-red"}], [0, 1])
+        self.assertMatchesNameSets([{"field": "_user_tags", "operator": "has", "value": "test-red, test-green"}], [0, 1, 2])
+
+    def test_has_all(self):
+        self.assertMatchesNameSets([{"field": "_user_tags", "operator": "has_all", "value": "test-red, test-blue"}], [1])
+        self.assertMatchesNameSets([{"field": "_user_tags", "operator": "has_all", "value": "test-blue"}], [1, 2])
+
+    def test_not_has_keeps_issues_without_tags(self):
+        self.assertMatchesNameSets([{"field": "_user_tags", "operator": "not_has", "value": "test-red"}], [2, 3])
+        self.assertMatchesNameSets([{"field": "_user_tags", "operator": "not_has", "value": "test-red, test-blue"}], [3])
+
+    def test_tag_filters_are_intersected(self):
+        self.assertMatchesNameSets([
+            {"field": "_user_tags", "operator": "has", "value": "test-blue"},
+            {"field": "_user_tags", "operator": "not_has", "value": "test-green"},
+        ], [1])
+
+
+class TestChildTableFilters(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        self.issue_names = []
+
+        # (assignments as (user, team), CSM team)
+        seed = [
+            ([("Administrator", "Test Team A")], "Test Team A"),
+            ([("Administrator", "Test Team A"), ("Guest", "Test Team B")], "Test Team B"),
+            ([("Guest", "Test Team C")], "Test Team C"),
+            ([], None),
+        ]
+        for i, (assignments, csm_team) in enumerate(seed):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Assignment Filters {i}",
+                "raised_by": "customer@example.com",
+                "status": "Open"
+            })
+            for user, team in assignments:
+                issue.append("custom_users_assigned", {"user_assigned": user, "team": team})
+            issue.insert()
+            if csm_team:
+                # The team filter reads Team User Assignment rows stored under the custom_assigned_csm_team parentfield
+                frappe.get_doc({
+                    "doctype": "Team User Assignment",
+                    "parent": issue.name,
+                    "parenttype": "Issue",
+                    "parentfield": "custom_assigned_csm_team",
+                    "user_assigned": "Administrator",
+                    "team": csm_team
+                }).db_insert()
+            self.issue_names.append(issue.name)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def assertMatchesNameSets(self, child_filters, expected):
+        filter_list, or_filters = build_issue_filters(child_filters)
+        issue_names = set(frappe.get_list("Issue", filters=filter_list, or_filters=or_filters, pluck="name"))
+        self.assertEqual(issue_names, get_issues_by_child_table_filters_in_python(child_filters))
+        self.assertEqual(issue_names & set(self.issue_names), {self.issue_names[i] for i in expected})
+
+    def test_users_are_and_across_values(self):
+        self.assertMatchesNameSets([{"field": "custom_users_assigned", "operator": "in", "value": "Administrator"}], [0, 1])
+        self.assertMatchesNameSets([{"field": "custom_users_assigned", "operator": "in", "value": ["Administrator", "Guest"]}], [1])
+        self.assertMatchesNameSets([{"field": "custom_users_assigned", "operator": "not_in", "value": "Guest"}], [0, 3])
+
+    def test_teams_are_or_across_values(self):
+        self.assertMatchesNameSets([{"field": "custom_assigned_csm_team", "operator": "in", "value": "Test Team A, Test Team C"}], [0, 2])
+        self.assertMatchesNameSets([{"field": "custom_assigned_csm_team", "operator": "not_in", "value": ["Test Team B"]}], [0, 2, 3])
+
+    def test_empty_selection_adds_no_condition(self):
+        for value in ("", " , ", []):
+            child_filters = [{"field": "custom_users_assigned", "operator": "in", "value": value}]
+            self.assertEqual(build_issue_filters(child_filters), ([], []))
+            self.assertMatchesNameSets(child_filters, [0, 1, 2, 3])
+
+
+class TestKeysetPagination(FrappeTestCase):
+    filter_list = (["Issue", "subject", "like", "Test Issue for Keyset%"],)
+
+    def setUp(self):
+        frappe.set_user("Administrator")
+
+        # (status, first_responded_on), with ties and NULL sort values
+        seed = [
+            ("Open", None),
+            ("Open", "2025-01-01 10:00:00"),
+            ("Replied", None),
+            ("Replied", "2025-01-02 10:00:00"),
+            ("Open", "2025-01-01 10:00:00"),
+        ]
+        for i, (status, first_responded_on) in enumerate(seed):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Keyset {i}",
+                "raised_by": "customer@example.com",
+                "status": status
+            }).insert()
+            frappe.db.set_value("Issue", issue.name, "first_responded_on", first_responded_on, update_modified=False)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def get_cursor_pages(self, order_by, page_length=2):
+        pages, cursor = [], None
+        while True:
+            page = get_issues_page(
+                ["name"], list(self.filter_list), [], order_by, page_length, pagination="cursor", cursor=cursor
+            )
+            pages.append([issue.name for issue in page["issues"]])
+            cursor = page["next_cursor"]
+            if not cursor:
+                return pages
+
+    def assertCursorPagesMatchOffsetOrder(self, order_by):
+        sort_keys = get_keyset_sort_keys(order_by)
+        expected = frappe.get_list(
+            "Issue",
+            filters=list(self.filter_list),
+            order_by=", ".join(f"{field} {direction}" for field, direction in sort_keys),
+            pluck="name"
+        )
+        pages = self.get_cursor_pages(order_by)
+        self.assertEqual([name for page in pages for name in page], expected)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+
+    def test_multi_column_order(self):
+        self.assertCursorPagesMatchOffsetOrder("status asc, first_responded_on desc")
+        self.assertCursorPagesMatchOffsetOrder("status desc, creation asc")
+
+    def test_ties_are_broken_by_name(self):
+        self.assertEqual(get_keyset_sort_keys("status desc"), [("status", "desc"), ("name", "desc")])
+        self.assertCursorPagesMatchOffsetOrder("status desc")
+        self.assertCursorPagesMatchOffsetOrder("status asc")
+
+    def test_null_sort_values(self):
+        # NULLs sort first in asc and last in desc order
+        self.assertCursorPagesMatchOffsetOrder("first_responded_on asc")
+        self.assertCursorPagesMatchOffsetOrder("first_responded_on desc")
+
+    def test_cursor_for_another_order_is_rejected(self):
+        page = get_issues_page(["name"], list(self.filter_list), [], "status asc", 2, pagination="cursor")
+        for order_by in ("subject asc", "status desc", "status asc, first_responded_on desc"):
+            with self.assertRaises(frappe.ValidationError):
+                get_issues_page(
+                    ["name"], list(self.filter_list), [], order_by, 2, pagination="cursor", cursor=page["next_cursor"]
+                )
+        with self.assertRaises(frappe.ValidationError):
+            get_issues_page(["name"], list(self.filter_list), [], "status asc", 2, pagination="cursor", cursor="not a cursor")
+
+
+class TestIssueRows(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        self.issue_names = []
+        for i in range(3):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Rows {i}",
+                "description": "Testing issue rows",
+                "raised_by": "customer@example.com",
+                "status": "Open"
+            })
+            issue.append("custom_users_assigned", {"user_assigned": "Administrator", "team": "Test Team A"})
+            issue.insert()
+            self.issue_names.append(issue.name)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def test_rows_match_list_rows_in_requested_order(self):
+        requested = [*reversed(self.issue_names), "Missing Issue"]
+        rows = get_issue_rows(requested)
+        self.assertEqual([row.name for row in rows], requested[:-1])
+
+        # Same shape as the list rows
+        for row in rows:
+            self.assertEqual(set(row), set(ISSUE_LIST_FIELDS) | {"custom_users_assigned", "_user_tags"})
+            self.assertEqual(row["custom_users_assigned"][0].user_assigned, "Administrator")
+
+    def test_columnar_encoding_round_trips(self):
+        rows = get_issue_rows(self.issue_names)
+        encoded = encode_issues_columnar(rows, ISSUE_LIST_FIELDS)
+
+        # Same expansion as decodeIssueRows in the SPA
+        for row, values in zip(rows, encoded["rows"], strict=True):
+            decoded = dict(zip(encoded["columns"], values, strict=True))
+            decoded["custom_users_assigned"] = [
+                dict(zip(encoded["assignment_columns"], assignment, strict=True), parent=decoded["name"])
+                for assignment in decoded["custom_users_assigned"]
+            ]
+            for assignment in decoded["custom_users_assigned"]:
+                assignment["user_assigned"] = encoded["users"][assignment["user_assigned"]]
+                assignment["team"] = encoded["teams"][assignment["team"]]
+            decoded["_user_tags"] = [encoded["tags"][tag] for tag in decoded["_user_tags"]]
+
+            self.assertEqual(decoded, dict(row))
+        self.assertEqual(encoded["users"], ["Administrator"])
+
+
+class TestIssueListETag(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def test_etag_follows_parameters_and_data(self):
+        etag = get_issue_list_etag("get_issues_count_with_filters", {"filters": "[]"}, [])
+        self.assertEqual(etag, get_issue_list_etag("get_issues_count_with_filters", {"filters": "[]"}, []))
+        self.assertNotEqual(etag, get_issue_list_etag("get_issues_count_with_filters", {"filters": "{}"}, []))
+        self.assertNotEqual(etag, get_issue_list_etag("get_stat_filter_counts", {"filters": "[]"}, []))
+
+        frappe.get_doc({
+            "doctype": "Issue",
+            "subject": "Test Issue for ETag",
+            "raised_by": "customer@example.com",
+            "status": "Open"
+        }).insert()
+        self.assertNotEqual(etag, get_issue_list_etag("get_issues_count_with_filters", {"filters": "[]"}, []))
+
+    def test_etag_follows_shares(self):
+        issue = frappe.get_doc({
+            "doctype": "Issue",
+            "subject": "Test Issue for ETag share",
+            "raised_by": "customer@example.com",
+            "status": "Open"
+        }).insert()
+        etag = get_issue_list_etag("get_issues_count_with_filters", {"filters": "[]"}, [])
+
+        # A new share changes what a restricted user sees without touching the Issue
+        frappe.share.add("Issue", issue.name, "Guest", read=1, notify=0)
+        self.assertNotEqual(etag, get_issue_list_etag("get_issues_count_with_filters", {"filters": "[]"}, []))
+
+    def test_if_none_match_parsing_keeps_the_etag_value(self):
+        self.assertEqual(
+            parse_if_none_match('"abc", W/"Wx/", "W"'),
+            ["abc", "Wx/", "W"]
+        )
+        self.assertEqual(parse_if_none_match(None), [])
+
+    def test_filtered_request_returns_filtered_count(self):
+        for subject in ("Test Issue for ETag filter match", "Test Issue for ETag other"):
+            frappe.get_doc({
+                "doctype": "Issue",
+                "subject": subject,
+                "raised_by": "customer@example.com",
+                "status": "Open"
+            }).insert()
+
+        # Filters arrive once encoded in the GET query
+        filters = json.dumps([{"field": "subject", "operator": "contains", "value": "ETag filter match"}])
+        self.assertEqual(get_issues_count_with_filters(filters=filters), 1)
+        self.assertGreater(get_issues_count_with_filters(filters="[]"), 1)
+
+
+class TestSuggestionSearch(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        self.issue_names = []
+        for subject in ("Zqxwv freight delayed", "Zqxwv select from invoice", "Unrelated shipment"):
+            self.issue_names.append(frappe.get_doc({
+                "doctype": "Issue",
+                "subject": subject,
+                "raised_by": "customer@example.com",
+                "status": "Open"
+            }).insert().name)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def test_like_fallback_ranks_and_sorts(self):
+        with patch("force_trans_customization.api.issues.has_issue_search_index", return_value=False):
+            issues = filter_issues_by_suggestion("", "Zqxwv", limit_page_length=10, order_by="creation asc")
+            self.assertEqual([issue.name for issue in issues], self.issue_names[:2])
+
+            # Search text with SQL keywords stays a value
+            issues = filter_issues_by_suggestion("", "Zqxwv select from", limit_page_length=10)
+            self.assertEqual([issue.name for issue in issues], self.issue_names[1:2])
+
+            # Issue name prefix matches rank first
+            issues = filter_issues_by_suggestion("", self.issue_names[2], limit_page_length=10)
+            self.assertEqual(issues[0].name, self.issue_names[2])
+
+    def test_fulltext_search_ranks_by_relevance(self):
+        if not has_issue_search_index():
+            self.skipTest("Issue FULLTEXT index is not installed (patches/v1_2_add_issue_search_fulltext_index)")
+
+        # Uncommitted rows are not in the FULLTEXT index yet, rank the committed issues
+        issues = filter_issues_by_suggestion("", "select from issue", limit_page_length=20, order_by="modified desc")
+        self.assertIsInstance(issues, list)
+
+        condition, relevance = get_issue_search_condition("select from issue")
+        self.assertIn("MATCH(", condition)
+        ranked = frappe.db.sql(
+            f"""SELECT name FROM `tabIssue` WHERE {condition}
+            ORDER BY {relevance} DESC, `tabIssue`.modified DESC
+            LIMIT 20""",
+            pluck="name"
+        )
+        self.assertEqual([issue.name for issue in issues], ranked)
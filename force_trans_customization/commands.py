@@ -0,0 +1,31 @@
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("force-trans-index-advisor")
+@click.option("--user", default="Administrator", help="Run the queries as this user so their issue_query condition is included")
+@pass_context
+def index_advisor(context, user):
+    """EXPLAIN the issue list query shapes and report full table scans"""
+    from force_trans_customization.utils.index_advisor import explain_query_shapes
+
+    site = get_site(context)
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        frappe.set_user(user)
+        full_scans = explain_query_shapes()
+
+        if not full_scans:
+            click.secho("No full table scans in the issue list query shapes", fg="green")
+            return
+
+        click.secho(f"{len(full_scans)} full table scan(s):", fg="yellow")
+        for scan in full_scans:
+            click.echo(f"  {scan['label']:<32} {scan['table']:<28} rows={scan['rows']} key={scan['key']}")
+    finally:
+        frappe.destroy()
+
+
+commands = [index_advisor]
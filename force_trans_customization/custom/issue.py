@@ -0,0 +1,29 @@
+import html
+import re
+
+import frappe
+from frappe.utils import strip_html_tags
+
+# Length of the plain text description snippet the issue list shows instead of the full description
+DESCRIPTION_SNIPPET_LENGTH = 200
+
+def get_description_snippet(description):
+	"""
+	Plain text start of an Issue description, bounded to DESCRIPTION_SNIPPET_LENGTH characters
+	Email created issues carry the whole cleaned email body as description
+	"""
+	if not description:
+		return ""
+
+	text = html.unescape(strip_html_tags(description))
+	text = re.sub(r"\s+", " ", text).strip()
+	if len(text) > DESCRIPTION_SNIPPET_LENGTH:
+		text = text[:DESCRIPTION_SNIPPET_LENGTH - 1].rstrip() + "…"
+	return text
+
+def set_description_snippet(doc, method=None):
+	"""
+	Issue validate: keep custom_description_snippet in sync with the description
+	"""
+	if doc.is_new() or doc.has_value_changed("description") or not doc.get("custom_description_snippet"):
+		doc.custom_description_snippet = get_description_snippet(doc.description)
@@ -0,0 +1,75 @@
+import frappe
+from frappe.desk.doctype.tag import tag as frappe_tag
+
+from force_trans_customization.utils.issue_deltas import TAGS_FIELD, record_issue_change
+
+
+def update_tag_usage_counts(tags):
+	"""
+	Recount custom_issue_usage_count of the given tags from Tag Link
+	One UPDATE for all of them, used by the Tag Link hooks
+	"""
+	tags = [tag for tag in set(tags or []) if tag]
+	if not tags:
+		return
+
+	frappe.db.sql(
+		"""UPDATE `tabTag` tag
+		SET tag.custom_issue_usage_count = (
+			SELECT COUNT(*) FROM `tabTag Link` tl
+			WHERE tl.document_type = 'Issue' AND tl.tag = tag.name
+		)
+		WHERE tag.name IN %(tags)s""",
+		{"tags": tuple(tags)}
+	)
+
+def update_tag_usage_for_tag_link(doc, method=None):
+	"""
+	Tag Link after_insert / after_delete: keep the usage count of the tag in sync
+	"""
+	if doc.document_type != "Issue":
+		return
+	try:
+		update_tag_usage_counts([doc.tag])
+	except Exception as e:
+		# Counts are repaired by reconcile_tag_usage_counts, never block tagging
+		frappe.log_error(f"Error updating usage count of tag {doc.tag}: {e!s}", "Tag Usage Error")
+
+def update_tag_usage_for_issue(doc, method=None):
+	"""
+	Issue after_delete: Frappe deletes the Issue's Tag Links without running their hooks
+	"""
+	tags = [tag for tag in (doc.get("_user_tags") or "").split(",") if tag]
+	try:
+		# Delete them here already, so the recount doesn't depend on when Frappe does it
+		frappe.db.delete("Tag Link", {"document_type": "Issue", "document_name": doc.name})
+		update_tag_usage_counts(tags)
+	except Exception as e:
+		frappe.log_error(f"Error updating tag usage counts for {doc.name}: {e!s}", "Tag Usage Error")
+
+@frappe.whitelist()
+def remove_tag(tag, dt, dn):
+	"""
+	Override of frappe.desk.doctype.tag.tag.remove_tag
+	Frappe deletes the Tag Link with a plain DELETE, so the Tag Link hooks (usage count, realtime delta) don't run
+	"""
+	frappe_tag.remove_tag(tag, dt, dn)
+	if dt == "Issue":
+		update_tag_usage_for_tag_link(frappe._dict(document_type=dt, tag=tag))
+		record_issue_change(dn, [TAGS_FIELD])
+
+def reconcile_tag_usage_counts():
+	"""
+	Scheduled: recount every tag, catches Tag Links changed without hooks (bulk tag edits, deleted documents)
+	"""
+	frappe.db.sql(
+		"""UPDATE `tabTag` tag
+		LEFT JOIN (
+			SELECT tl.tag, COUNT(*) AS usage_count
+			FROM `tabTag Link` tl
+			WHERE tl.document_type = 'Issue'
+			GROUP BY tl.tag
+		) tag_usage ON tag_usage.tag = tag.name
+		SET tag.custom_issue_usage_count = IFNULL(tag_usage.usage_count, 0)
+		WHERE IFNULL(tag.custom_issue_usage_count, 0) != IFNULL(tag_usage.usage_count, 0)"""
+	)
@@ -0,0 +1,347 @@
+# Copyright (c) 2026, Sayaji Infotech and contributors
+# For license information, please see license.txt
+
+"""
+Issue Statistics keeps the stat card counters so get_issue_stats doesn't recount every Issue:
+
+- Global: total issues and issues with response expected / awaited
+- Team: issues with an assignment from the team, and how many of them expect / await a response
+- User: issues assigned to the user, issues with an assignment from any of the user's teams,
+  and how many of the user's issues expect / await a response
+
+Unassigned-for-team counts are derived (Global total - team assigned) so a new unassigned Issue
+only touches the Global row. An Issue change adds its +/- deltas to the rows it counts towards
+(counter = counter + delta), full recounts only run in reconcile_issue_statistics, which repairs
+any drift on a schedule, and the v1_5 build patch.
+"""
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint, now_datetime
+
+GLOBAL_NAME = "Global"
+COUNTERS = ["total_count", "assigned_count", "team_assigned_count", "response_expected_count", "response_awaited_count"]
+
+ASSIGNMENT_CONDITION = "{alias}.parenttype = 'Issue' AND {alias}.parentfield = 'custom_users_assigned'"
+
+
+class IssueStatistics(Document):
+	pass
+
+
+def get_statistics_name(scope, key=None):
+	return GLOBAL_NAME if scope == "Global" else f"{scope}::{key}"
+
+
+def get_issue_statistics(user):
+	"""
+	Stat card counts for a user who can see every Issue, read from two rows
+	Returns None when the table hasn't been built yet
+	"""
+	rows = frappe.get_all(
+		"Issue Statistics",
+		filters={"name": ["in", [GLOBAL_NAME, get_statistics_name("User", user)]]},
+		fields=["name", *COUNTERS]
+	)
+	rows = {row.name: row for row in rows}
+	if GLOBAL_NAME not in rows:
+		return None
+
+	global_row = rows[GLOBAL_NAME]
+	user_row = rows.get(get_statistics_name("User", user)) or {}
+
+	return {
+		"team_tickets": cint(global_row.total_count),
+		"open_tickets": cint(global_row.total_count) - cint(user_row.get("team_assigned_count")),
+		"assigned_to_me": cint(user_row.get("assigned_count")),
+		"actionable_tickets": cint(global_row.response_expected_count),
+		"response_tickets": cint(global_row.response_awaited_count)
+	}
+
+
+def count_global():
+	"""Counters of the Global row"""
+	counts = frappe.db.sql(
+		"""SELECT COUNT(*) AS total_count,
+			SUM(CASE WHEN custom_is_response_expected = 1 THEN 1 ELSE 0 END) AS response_expected_count,
+			SUM(CASE WHEN custom_is_response_awaited = 1 THEN 1 ELSE 0 END) AS response_awaited_count
+		FROM `tabIssue`""",
+		as_dict=True
+	)[0]
+	return {None: counts}
+
+
+def count_teams(teams=None):
+	"""Counters of the Team rows, for every team or only the given ones"""
+	team_condition = ""
+	values = {}
+	if teams is not None:
+		if not teams:
+			return {}
+		team_condition = "AND tua.team IN %(teams)s"
+		values["teams"] = tuple(teams)
+
+	rows = frappe.db.sql(
+		f"""SELECT tua.team AS stat_key,
+			COUNT(DISTINCT issue.name) AS assigned_count,
+			COUNT(DISTINCT CASE WHEN issue.custom_is_response_expected = 1 THEN issue.name END) AS response_expected_count,
+			COUNT(DISTINCT CASE WHEN issue.custom_is_response_awaited = 1 THEN issue.name END) AS response_awaited_count
+		FROM `tabTeam User Assignment` tua
+		INNER JOIN `tabIssue` issue ON issue.name = tua.parent
+		WHERE {ASSIGNMENT_CONDITION.format(alias="tua")}
+		AND IFNULL(tua.team, '') != '' {team_condition}
+		GROUP BY tua.team""",
+		values,
+		as_dict=True
+	)
+	return {row.stat_key: row for row in rows}
+
+
+def count_users(users=None):
+	"""Counters of the User rows, for every assigned user or only the given ones"""
+	user_condition = ""
+	values = {}
+	if users is not None:
+		if not users:
+			return {}
+		user_condition = "AND tua.user_assigned IN %(users)s"
+		values["users"] = tuple(users)
+
+	rows = frappe.db.sql(
+		f"""SELECT tua.user_assigned AS stat_key,
+			COUNT(DISTINCT issue.name) AS assigned_count,
+			COUNT(DISTINCT CASE WHEN issue.custom_is_response_expected = 1 THEN issue.name END) AS response_expected_count,
+			COUNT(DISTINCT CASE WHEN issue.custom_is_response_awaited = 1 THEN issue.name END) AS response_awaited_count
+		FROM `tabTeam User Assignment` tua
+		INNER JOIN `tabIssue` issue ON issue.name = tua.parent
+		WHERE {ASSIGNMENT_CONDITION.format(alias="tua")} {user_condition}
+		GROUP BY tua.user_assigned""",
+		values,
+		as_dict=True
+	)
+	counts = {row.stat_key: row for row in rows}
+
+	# Issues with an assignment from any team the user is assigned with (same rule as the open_tickets stat)
+	team_rows = frappe.db.sql(
+		f"""SELECT user_team.user_assigned AS stat_key, COUNT(DISTINCT team_issue.name) AS team_assigned_count
+		FROM (
+			SELECT DISTINCT tua.user_assigned, tua.team
+			FROM `tabTeam User Assignment` tua
+			INNER JOIN `tabIssue` issue ON issue.name = tua.parent
+			WHERE {ASSIGNMENT_CONDITION.format(alias="tua")}
+			AND IFNULL(tua.team, '') != '' {user_condition}
+		) user_team
+		INNER JOIN `tabTeam User Assignment` team_tua ON team_tua.team = user_team.team
+			AND {ASSIGNMENT_CONDITION.format(alias="team_tua")}
+		INNER JOIN `tabIssue` team_issue ON team_issue.name = team_tua.parent
+		GROUP BY user_team.user_assigned""",
+		values,
+		as_dict=True
+	)
+	for row in team_rows:
+		counts.setdefault(row.stat_key, frappe._dict())["team_assigned_count"] = row.team_assigned_count
+
+	return counts
+
+
+def save_statistics(scope, counts, keys=None):
+	"""
+	Upsert the rows of a scope from counts (key -> counters)
+	keys missing from counts are reset to zero, with keys=None every other row of the scope is deleted
+	"""
+	now = now_datetime()
+	all_keys = set(counts) if keys is None else set(keys) | set(counts)
+
+	values = []
+	for key in all_keys:
+		row = counts.get(key) or {}
+		values.append(
+			[get_statistics_name(scope, key), scope, key]
+			+ [cint(row.get(counter)) for counter in COUNTERS]
+			+ [now, now, "Administrator", "Administrator"]
+		)
+
+	if values:
+		columns = ["name", "scope", "stat_key", *COUNTERS, "creation", "modified", "owner", "modified_by"]
+		placeholders = ", ".join(["(" + ", ".join(["%s"] * len(columns)) + ")"] * len(values))
+		updates = ", ".join(f"`{column}` = VALUES(`{column}`)" for column in [*COUNTERS, "modified"])
+		frappe.db.sql(
+			f"""INSERT INTO `tabIssue Statistics` ({", ".join(f"`{column}`" for column in columns)})
+			VALUES {placeholders}
+			ON DUPLICATE KEY UPDATE {updates}""",
+			[value for row in values for value in row]
+		)
+
+	if keys is None:
+		stale = frappe.get_all("Issue Statistics", filters={"scope": scope}, pluck="stat_key")
+		stale = [key for key in stale if key not in counts and scope != "Global"]
+		if stale:
+			frappe.db.delete("Issue Statistics", {"scope": scope, "stat_key": ["in", stale]})
+
+
+def get_assignment_keys(doc):
+	"""(user, team) pairs of an Issue's custom_users_assigned rows"""
+	if not doc:
+		return set()
+	return {(row.user_assigned, row.team or "") for row in doc.get("custom_users_assigned") or []}
+
+
+def get_issue_counters(doc):
+	"""Counters one Issue adds to its Global, Team and User rows, as {(scope, key): {counter: value}}"""
+	if not doc:
+		return {}
+
+	flags = {
+		"response_expected_count": cint(doc.get("custom_is_response_expected")),
+		"response_awaited_count": cint(doc.get("custom_is_response_awaited")),
+	}
+	counters = {("Global", None): dict(total_count=1, **flags)}
+	for user, team in get_assignment_keys(doc):
+		if team:
+			counters[("Team", team)] = dict(assigned_count=1, **flags)
+		counters[("User", user)] = dict(assigned_count=1, **flags)
+	return counters
+
+
+def get_team_assigned_deltas(before_keys, after_keys):
+	"""
+	team_assigned_count changes of the users working with the Issue's teams, as ({user: delta}, users to recount)
+	A user's teams are the teams they are assigned with on any Issue. Users who gain or lose a team
+	with this change have every Issue of that team to add or remove, they are recounted instead.
+	"""
+	before_teams = {team for user, team in before_keys if team}
+	after_teams = {team for user, team in after_keys if team}
+	# A user can gain or lose a team while the Issue keeps its teams, so look at the (user, team) pairs
+	if not any(team for user, team in before_keys ^ after_keys):
+		return {}, set()
+
+	# Assignments are already saved (or deleted) when the doc events run
+	pairs = frappe.db.sql(
+		f"""SELECT tua.user_assigned, tua.team, COUNT(DISTINCT tua.parent) AS issue_count
+		FROM `tabTeam User Assignment` tua
+		WHERE {ASSIGNMENT_CONDITION.format(alias="tua")}
+		AND tua.team IN %(teams)s
+		GROUP BY tua.user_assigned, tua.team""",
+		{"teams": tuple(before_teams | after_teams)},
+		as_dict=True
+	)
+
+	user_teams = {}
+	recount = set()
+	for pair in pairs:
+		user_teams.setdefault(pair.user_assigned, set()).add(pair.team)
+		if (pair.user_assigned, pair.team) in after_keys - before_keys and pair.issue_count == 1:
+			# First assignment of the user with this team
+			recount.add(pair.user_assigned)
+	for user, team in before_keys - after_keys:
+		if team and team not in user_teams.get(user, ()):
+			# Last assignment of the user with this team is gone
+			recount.add(user)
+
+	deltas = {}
+	for user, teams in user_teams.items():
+		if user in recount:
+			continue
+		delta = int(bool(teams & after_teams)) - int(bool(teams & before_teams))
+		if delta:
+			deltas[user] = delta
+	return deltas, recount
+
+
+def apply_statistics_deltas(deltas):
+	"""Add deltas ({(scope, key): {counter: delta}}) to the rows with counter = counter + delta, creating missing rows"""
+	now = now_datetime()
+	values = []
+	for (scope, key), row in deltas.items():
+		if not any(row.values()):
+			continue
+		values.append(
+			[get_statistics_name(scope, key), scope, key]
+			+ [cint(row.get(counter)) for counter in COUNTERS]
+			+ [now, now, "Administrator", "Administrator"]
+		)
+	if not values:
+		return
+
+	columns = ["name", "scope", "stat_key", *COUNTERS, "creation", "modified", "owner", "modified_by"]
+	placeholders = ", ".join(["(" + ", ".join(["%s"] * len(columns)) + ")"] * len(values))
+	updates = ", ".join(f"`{counter}` = `{counter}` + VALUES(`{counter}`)" for counter in COUNTERS)
+	frappe.db.sql(
+		f"""INSERT INTO `tabIssue Statistics` ({", ".join(f"`{column}`" for column in columns)})
+		VALUES {placeholders}
+		ON DUPLICATE KEY UPDATE {updates}, `modified` = VALUES(`modified`)""",
+		[value for row in values for value in row]
+	)
+
+
+def update_issue_statistics(doc, method=None):
+	"""
+	Issue on_update / after_delete: apply what this change adds to and removes from the counters
+	(on_update also runs on insert, without a doc before save)
+	Response status changes from update_issue_status_on_customer_reply and
+	update_issue_status_after_agent_reply arrive here through Issue.save
+	Full recounts are left to reconcile_issue_statistics and the v1_5 build patch
+	"""
+	try:
+		if method == "after_delete":
+			before, after = doc, None
+		else:
+			before, after = doc.get_doc_before_save(), doc
+
+		before_counters = get_issue_counters(before)
+		after_counters = get_issue_counters(after)
+		deltas = {}
+		for row_key in set(before_counters) | set(after_counters):
+			old = before_counters.get(row_key, {})
+			new = after_counters.get(row_key, {})
+			deltas[row_key] = {counter: new.get(counter, 0) - old.get(counter, 0) for counter in COUNTERS}
+
+		before_keys, after_keys = get_assignment_keys(before), get_assignment_keys(after)
+		team_assigned_deltas, recount_users = get_team_assigned_deltas(before_keys, after_keys)
+		for user, delta in team_assigned_deltas.items():
+			deltas.setdefault(("User", user), dict.fromkeys(COUNTERS, 0))["team_assigned_count"] += delta
+
+		if not any(any(row.values()) for row in deltas.values()) and not recount_users:
+			# Nothing the counters depend on changed (most edits)
+			return
+
+		# Until the table is built there are no counters to adjust
+		if not frappe.db.exists("Issue Statistics", GLOBAL_NAME):
+			return
+
+		apply_statistics_deltas(deltas)
+		if recount_users:
+			save_statistics("User", count_users(recount_users), recount_users)
+	except Exception as e:
+		# Counters are repaired by reconcile_issue_statistics, never block the Issue save
+		frappe.log_error(f"Error updating issue statistics for {doc.name}: {e!s}", "Issue Statistics Error")
+
+
+def rebuild_issue_statistics():
+	"""Recompute every row from scratch"""
+	save_statistics("Global", count_global())
+	save_statistics("Team", count_teams())
+	save_statistics("User", count_users())
+
+
+def reconcile_issue_statistics():
+	"""
+	Scheduled: rebuild the table and log how many rows had drifted
+	Returns the number of rows that changed
+	"""
+	def snapshot():
+		return {
+			row.name: tuple(cint(row.get(counter)) for counter in COUNTERS)
+			for row in frappe.get_all("Issue Statistics", fields=["name", *COUNTERS])
+		}
+
+	before = snapshot()
+	rebuild_issue_statistics()
+	after = snapshot()
+
+	# A row of zeros counts the same as no row (deltas leave zeros the rebuild deletes)
+	zeros = tuple(0 for counter in COUNTERS)
+	drifted = sum(1 for name in set(before) | set(after) if before.get(name, zeros) != after.get(name, zeros))
+	if drifted:
+		frappe.logger("force_trans_customization").info(f"Issue Statistics reconcile repaired {drifted} row(s)")
+	return drifted
@@ -0,0 +1,87 @@
+# Copyright (c) 2026, Sayaji Infotech and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from force_trans_customization.api.issues import get_issue_stat_counts
+from force_trans_customization.force_trans_customization.doctype.issue_statistics.issue_statistics import (
+	get_issue_statistics,
+	rebuild_issue_statistics,
+	reconcile_issue_statistics,
+)
+
+
+class TestIssueStatistics(FrappeTestCase):
+	def setUp(self):
+		frappe.set_user("Administrator")
+		# Issue changes only adjust the counters of a built table
+		rebuild_issue_statistics()
+
+		# (assignments as (user, team), response expected, response awaited)
+		seed = [
+			([("Administrator", "Test Team A")], 1, 0),
+			([("Guest", "Test Team A")], 0, 1),
+			([("Administrator", "Test Team B"), ("Guest", "Test Team C")], 1, 1),
+			([], 0, 0),
+		]
+		self.issues = []
+		for i, (assignments, response_expected, response_awaited) in enumerate(seed):
+			issue = frappe.get_doc({
+				"doctype": "Issue",
+				"subject": f"Test Issue for Statistics {i}",
+				"raised_by": "customer@example.com",
+				"status": "Open",
+				"custom_is_response_expected": response_expected,
+				"custom_is_response_awaited": response_awaited
+			})
+			for user, team in assignments:
+				issue.append("custom_users_assigned", {"user_assigned": user, "team": team})
+			issue.insert()
+			self.issues.append(issue)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def assert_statistics_match_aggregate(self):
+		# The aggregate query without permission conditions counts every issue, like the table
+		self.assertEqual(get_issue_statistics("Administrator"), get_issue_stat_counts(permission_conditions=[]))
+
+	def test_statistics_follow_issue_changes(self):
+		self.assert_statistics_match_aggregate()
+
+		# Flag change, reassignment to another team and delete
+		self.issues[0].custom_is_response_awaited = 1
+		self.issues[0].save()
+		self.issues[1].custom_users_assigned = []
+		self.issues[1].append("custom_users_assigned", {"user_assigned": "Administrator", "team": "Test Team C"})
+		self.issues[1].save()
+		frappe.delete_doc("Issue", self.issues[2].name)
+
+		self.assert_statistics_match_aggregate()
+		# Team and User rows the aggregate doesn't read were kept exact too
+		self.assertFalse(reconcile_issue_statistics())
+
+	def test_user_joining_a_team_of_the_issue(self):
+		# The Issue keeps its teams, Administrator is assigned with Test Team C for the first time
+		self.issues[2].append("custom_users_assigned", {"user_assigned": "Administrator", "team": "Test Team C"})
+		self.issues[2].save()
+
+		self.assert_statistics_match_aggregate()
+		self.assertFalse(reconcile_issue_statistics())
+
+		# And leaves it again
+		self.issues[2].custom_users_assigned = [
+			row for row in self.issues[2].custom_users_assigned
+			if not (row.user_assigned == "Administrator" and row.team == "Test Team C")
+		]
+		self.issues[2].save()
+
+		self.assert_statistics_match_aggregate()
+		self.assertFalse(reconcile_issue_statistics())
+
+	def test_reconcile_repairs_drift(self):
+		frappe.db.set_value("Issue Statistics", "Global", "total_count", 0, update_modified=False)
+
+		self.assertTrue(reconcile_issue_statistics())
+		self.assert_statistics_match_aggregate()
@@ -155,9 +155,99 @@ app_include_js = [
 doc_events = {
 	"Communication": {
 		"after_insert": "force_trans_customization.custom.communication.on_communication_after_insert"
+	},
+	# Cached issue_query conditions depend on the user's roles and groups,
+	# the CSM team autocomplete caches the groups with their member counts
+	"User": {
+		"on_update": [
+			"force_trans_customization.permissions.clear_issue_query_cache",
+			"force_trans_customization.utils.autocomplete_index.record_autocomplete_change"
+		],
+		"after_rename": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"on_trash": [
+			"force_trans_customization.permissions.clear_issue_query_cache",
+			"force_trans_customization.utils.autocomplete_index.record_autocomplete_change"
+		]
+	},
+	# Filter autocomplete indexes of the workers
+	"Customer": {
+		"on_update": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"after_rename": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"on_trash": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change"
+	},
+	"Contact": {
+		"on_update": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"after_rename": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"on_trash": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change"
+	},
+	"Lead": {
+		"on_update": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"after_rename": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change",
+		"on_trash": "force_trans_customization.utils.autocomplete_index.record_autocomplete_change"
+	},
+	# Members are child rows saved with their User Group, which fires these events
+	"User Group": {
+		"on_update": [
+			"force_trans_customization.permissions.clear_issue_query_cache",
+			"force_trans_customization.api.issues.clear_user_groups_cache"
+		],
+		"after_rename": [
+			"force_trans_customization.permissions.clear_issue_query_cache",
+			"force_trans_customization.api.issues.clear_user_groups_cache"
+		],
+		"on_trash": [
+			"force_trans_customization.permissions.clear_issue_query_cache",
+			"force_trans_customization.api.issues.clear_user_groups_cache"
+		]
+	},
+	"DocShare": {
+		"on_update": "force_trans_customization.api.issues.bump_issue_list_generation",
+		"after_delete": "force_trans_customization.api.issues.bump_issue_list_generation"
+	},
+	# Description snippet for the issue list, Issue Statistics counters, tag usage counts, realtime list deltas
+	"Issue": {
+		"validate": "force_trans_customization.custom.issue.set_description_snippet",
+		"on_update": [
+			"force_trans_customization.force_trans_customization.doctype.issue_statistics.issue_statistics.update_issue_statistics",
+			"force_trans_customization.utils.issue_deltas.record_issue_update"
+		],
+		"after_delete": [
+			"force_trans_customization.force_trans_customization.doctype.issue_statistics.issue_statistics.update_issue_statistics",
+			"force_trans_customization.custom.tag.update_tag_usage_for_issue",
+			"force_trans_customization.utils.issue_deltas.record_issue_update"
+		]
+	},
+	"Tag Link": {
+		"after_insert": [
+			"force_trans_customization.custom.tag.update_tag_usage_for_tag_link",
+			"force_trans_customization.utils.issue_deltas.record_issue_tag_change"
+		],
+		"after_delete": [
+			"force_trans_customization.custom.tag.update_tag_usage_for_tag_link",
+			"force_trans_customization.utils.issue_deltas.record_issue_tag_change"
+		]
+	},
+	# Cached tag color map
+	"Tag": {
+		"on_update": "force_trans_customization.api.issues.clear_tag_colors_cache",
+		"after_rename": "force_trans_customization.api.issues.clear_tag_colors_cache",
+		"on_trash": "force_trans_customization.api.issues.clear_tag_colors_cache"
+	},
+	"Tag Category": {
+		"on_update": "force_trans_customization.api.issues.clear_tag_colors_cache",
+		"after_rename": "force_trans_customization.api.issues.clear_tag_colors_cache",
+		"on_trash": "force_trans_customization.api.issues.clear_tag_colors_cache"
 	}
 }
 
+# Clear cached issue_query conditions, the tag color map, the user groups and the autocomplete indexes on bench clear-cache
+clear_cache = [
+    "force_trans_customization.permissions.clear_issue_query_cache",
+    "force_trans_customization.api.issues.clear_tag_colors_cache",
+    "force_trans_customization.api.issues.clear_user_groups_cache",
+    "force_trans_customization.utils.autocomplete_index.clear_autocomplete_indexes"
+]
+
 # Email Hooks
 # ---------------
 # Hook to modify email headers before sending
@@ -187,6 +277,10 @@ make_email_body_message = [
 # 	],
 # }
 scheduler_events = {
+    "hourly": [
+        "force_trans_customization.force_trans_customization.doctype.issue_statistics.issue_statistics.reconcile_issue_statistics",
+        "force_trans_customization.custom.tag.reconcile_tag_usage_counts"
+    ],
     "cron": {
         "* * * * *": [
             "force_trans_customization.tasks.process_email_queue_frequent",
@@ -205,6 +299,10 @@ scheduler_events = {
 # override_whitelisted_methods = {
 # 	"frappe.desk.doctype.event.event.get_events": "force_trans_customization.event.get_events"
 # }
+override_whitelisted_methods = {
+	# Tag usage counts, Frappe removes the Tag Link without running its hooks
+	"frappe.desk.doctype.tag.tag.remove_tag": "force_trans_customization.custom.tag.remove_tag"
+}
 #
 # each overriding function accepts a `data` argument;
 # generated from the base implementation of the doctype dashboard,
@@ -288,4 +386,4 @@ fixtures = [
    {"doctype":"Custom DocPerm"},
 
 ]
-website_route_rules = [{'from_route': '/ui/<path:app_path>', 'to_route': 'ui'}, {'from_route': '/frontend/<path:app_path>', 'to_route': 'frontend'},]
\ No newline at end of file
+website_route_rules = [{'from_route': '/ui/<path:app_path>', 'to_route': 'ui'}, {'from_route': '/frontend/<path:app_path>', 'to_route': 'frontend'},]
@@ -0,0 +1,21 @@
+import frappe
+
+from force_trans_customization.api.issues import ISSUE_SEARCH_COLUMNS, ISSUE_SEARCH_INDEX
+
+
+def execute():
+    """Add a FULLTEXT index on Issue for issue_search"""
+
+    # FULLTEXT indexes are MariaDB/MySQL only, issue_search falls back to LIKE elsewhere
+    if frappe.db.db_type != "mariadb":
+        print("ℹ️  Skipping Issue search FULLTEXT index (not MariaDB)")
+        return
+
+    if frappe.db.has_index("tabIssue", ISSUE_SEARCH_INDEX):
+        print("ℹ️  Issue search FULLTEXT index already exists")
+        return
+
+    columns = ", ".join(f"`{column}`" for column in ISSUE_SEARCH_COLUMNS)
+    frappe.db.sql_ddl(f"ALTER TABLE `tabIssue` ADD FULLTEXT INDEX `{ISSUE_SEARCH_INDEX}` ({columns})")
+
+    print("✅ Added Issue search FULLTEXT index")
@@ -0,0 +1,10 @@
+import frappe
+
+
+def execute():
+    """Add an index on DocShare (share_doctype, user, share_name) for the issue_query shared documents lookup"""
+
+    # add_index skips the index if it already exists
+    frappe.db.add_index("DocShare", ["share_doctype", "user", "share_name"], "share_doctype_user_share_name_index")
+
+    print("✅ Added DocShare (share_doctype, user, share_name) index")
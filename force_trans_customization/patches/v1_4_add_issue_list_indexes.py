@@ -0,0 +1,14 @@
+import frappe
+
+from force_trans_customization.utils.index_advisor import add_issue_list_indexes
+
+
+def execute():
+    """Add composite indexes for the issue list permission, stat, tag and assignment queries and the sortable columns"""
+
+    created = add_issue_list_indexes()
+
+    for doctype, columns in created:
+        print(f"✅ Added {doctype} index on ({', '.join(columns)})")
+    if not created:
+        print("ℹ️  Issue list indexes already exist")
@@ -0,0 +1,14 @@
+import frappe
+
+from force_trans_customization.force_trans_customization.doctype.issue_statistics.issue_statistics import (
+    rebuild_issue_statistics,
+)
+
+
+def execute():
+    """Build the Issue Statistics counters from the existing Issues"""
+
+    frappe.reload_doc("force_trans_customization", "doctype", "issue_statistics")
+    rebuild_issue_statistics()
+
+    print(f"✅ Built Issue Statistics ({frappe.db.count('Issue Statistics')} rows)")
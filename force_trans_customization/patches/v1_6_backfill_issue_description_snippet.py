@@ -0,0 +1,43 @@
+import frappe
+from frappe.custom.doctype.custom_field.custom_field import create_custom_field
+
+from force_trans_customization.custom.issue import get_description_snippet
+
+
+def execute():
+    """Add custom_description_snippet to Issue and fill it for the existing issues"""
+
+    # Fixtures are synced after the patches, create the column here so it can be filled
+    if not frappe.db.has_column("Issue", "custom_description_snippet"):
+        create_custom_field("Issue", {
+            "fieldname": "custom_description_snippet",
+            "label": "Description Snippet",
+            "fieldtype": "Small Text",
+            "insert_after": "custom_is_response_expected",
+            "hidden": 1,
+            "read_only": 1,
+            "no_copy": 1,
+        })
+
+    issue_names = frappe.get_all(
+        "Issue",
+        filters={"custom_description_snippet": ["is", "not set"], "description": ["is", "set"]},
+        pluck="name"
+    )
+
+    # In batches, descriptions can be whole email bodies
+    batch_size = 500
+    for start in range(0, len(issue_names), batch_size):
+        issues = frappe.get_all(
+            "Issue",
+            filters={"name": ["in", issue_names[start:start + batch_size]]},
+            fields=["name", "description"]
+        )
+        for issue in issues:
+            frappe.db.set_value(
+                "Issue", issue.name, "custom_description_snippet",
+                get_description_snippet(issue.description), update_modified=False
+            )
+        frappe.db.commit()
+
+    print(f"✅ Filled the description snippet of {len(issue_names)} issues")
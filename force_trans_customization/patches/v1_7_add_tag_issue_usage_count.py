@@ -0,0 +1,24 @@
+import frappe
+from frappe.custom.doctype.custom_field.custom_field import create_custom_field
+
+from force_trans_customization.custom.tag import reconcile_tag_usage_counts
+
+
+def execute():
+    """Add custom_issue_usage_count to Tag and count the existing Tag Links"""
+
+    # Fixtures are synced after the patches, create the column here so it can be filled
+    if not frappe.db.has_column("Tag", "custom_issue_usage_count"):
+        create_custom_field("Tag", {
+            "fieldname": "custom_issue_usage_count",
+            "label": "Issue Usage Count",
+            "fieldtype": "Int",
+            "insert_after": "custom_tag_category",
+            "default": "0",
+            "read_only": 1,
+            "no_copy": 1,
+        })
+
+    reconcile_tag_usage_counts()
+
+    print("✅ Counted issue usage of every Tag")
@@ -24,7 +24,7 @@ has_permission = {
 }
 
 ROLE CUSTOMIZATION:
-Modify the 'csm_roles', 'tracking_role_profile', and 'accounting_role_profile' to match your actual role names and role profiles.
+Modify CSM_ROLES, TRACKING_ROLE_PROFILE and ACCOUNTING_ROLE_PROFILE to match your actual role names and role profiles.
 
 HOW IT WORKS:
 
@@ -65,77 +65,167 @@ FAIL-SAFE BEHAVIOR:
 
 import frappe
 import frappe.share
+from frappe.utils.caching import request_cache
 
+# Redis hash of user -> issue_query condition
+ISSUE_QUERY_CACHE_KEY = "force_trans_issue_query"
+# Redis hash of user -> role profile, roles and User Groups used by the Issue permission checks
+ISSUE_USER_FACTS_CACHE_KEY = "force_trans_issue_user_facts"
+
+# Define CSM team roles - adjust these role names based on your actual role setup
+CSM_ROLES = ["Support Team"]
+# Define role profiles for different teams
+TRACKING_ROLE_PROFILE = "Tracking Team"
+ACCOUNTING_ROLE_PROFILE = "Accounting Team"
+# Issue statuses per role profile
+ACCOUNTING_ALLOWED_STATUSES = ["Delivered", "Closed"]
+TRACKING_RESTRICTED_STATUSES = ["New", "In Review"]
+
+@request_cache
+def get_issue_user_facts(user):
+    """Role profile, roles and User Groups of a user, everything the Issue permission rules need to know about them.
+
+    Cached per user until clear_issue_query_cache runs, and for the request.
+    """
+    facts = frappe.cache.hget(ISSUE_USER_FACTS_CACHE_KEY, user)
+    if facts is None:
+        facts = {
+            "role_profile": frappe.db.get_value("User", user, "role_profile_name"),
+            "roles": frappe.get_roles(user),
+            "user_groups": frappe.get_all(
+                "User Group Member",
+                filters={"user": user},
+                fields=["parent"],
+                pluck="parent"
+            )
+        }
+        frappe.cache.hset(ISSUE_USER_FACTS_CACHE_KEY, user, facts)
+    return facts
+
+def is_restricted_issue_user(facts):
+    """Whether any Issue restriction applies to a user with these facts."""
+    return (
+        facts["role_profile"] in (ACCOUNTING_ROLE_PROFILE, TRACKING_ROLE_PROFILE)
+        or any(role in facts["roles"] for role in CSM_ROLES)
+    )
+
+def is_issue_allowed(facts, status, csm_team, is_assigned):
+    """Apply the role profile and CSM team rules to one Issue (shares are checked by the caller).
+
+    is_assigned is a bool or a callable, called only when the CSM rules need it.
+    """
+    if facts["role_profile"] == ACCOUNTING_ROLE_PROFILE:
+        # Only Delivered and Closed issues
+        return status in ACCOUNTING_ALLOWED_STATUSES
+    
+    if facts["role_profile"] == TRACKING_ROLE_PROFILE:
+        # Everything except New and In Review issues
+        return status not in TRACKING_RESTRICTED_STATUSES
+    
+    if any(role in facts["roles"] for role in CSM_ROLES):
+        # Issues of the user's groups, or issues the user is individually assigned to
+        if csm_team and csm_team in facts["user_groups"]:
+            return True
+        return bool(is_assigned() if callable(is_assigned) else is_assigned)
+    
+    # No restriction for other roles/profiles
+    return True
+
+@request_cache
 def issue_query(user):
-    """Restrict Issue list for team members based on their roles and role profiles."""
-    # Define CSM team roles - adjust these role names based on your actual role setup
-    csm_roles = ["Support Team"]
-    # Define role profiles for different teams
-    tracking_role_profile = "Tracking Team"
-    accounting_role_profile = "Accounting Team"
+    """Restrict Issue list for team members based on their roles and role profiles.
+
+    The condition only depends on the user's role profile, roles and User Groups (shares are
+    looked up by the query itself), so it is cached per user until clear_issue_query_cache runs
+    from the doc events on those, and for the request so endpoints that run several Issue
+    queries resolve it once.
+    """
+    condition = frappe.cache.hget(ISSUE_QUERY_CACHE_KEY, user)
+    if condition is None:
+        condition = build_issue_query(user)
+        if condition is None:
+            # Failed to build, allow access (fail-safe) but don't cache it
+            return ""
+        frappe.cache.hset(ISSUE_QUERY_CACHE_KEY, user, condition)
+    return condition
+
+def get_shared_issue_condition(user):
+    """Condition for Issues shared with the user for read, as a correlated EXISTS on DocShare.
+
+    Matches what frappe.share.get_shared("Issue", user, rights=["read"]) returns without
+    inlining every shared name into the query.
+    """
+    escaped_user = frappe.db.escape(user, percent=False)
+    condition = f"""EXISTS (
+                SELECT 1 FROM `tabDocShare`
+                WHERE `tabDocShare`.share_doctype = 'Issue'
+                AND `tabDocShare`.user = {escaped_user}
+                AND `tabDocShare`.share_name = `tabIssue`.name
+                AND `tabDocShare`.`read` = 1
+            )"""
+    if user == "Guest":
+        return condition
     
+    # Documents shared with everyone
+    return f"""({condition} OR EXISTS (
+                SELECT 1 FROM `tabDocShare`
+                WHERE `tabDocShare`.share_doctype = 'Issue'
+                AND `tabDocShare`.everyone = 1
+                AND `tabDocShare`.share_name = `tabIssue`.name
+                AND `tabDocShare`.`read` = 1
+            ))"""
+
+def get_assigned_issue_condition(user):
+    """Condition for Issues the user is individually assigned to via the custom_users_assigned table."""
+    return f"""EXISTS (
+                SELECT 1 FROM `tabTeam User Assignment` 
+                WHERE `tabTeam User Assignment`.parent = `tabIssue`.name 
+                AND `tabTeam User Assignment`.parenttype = 'Issue'
+                AND `tabTeam User Assignment`.parentfield = 'custom_users_assigned'
+                AND `tabTeam User Assignment`.user_assigned = {frappe.db.escape(user, percent=False)}
+            )"""
+
+def build_issue_query(user):
+    """Build the issue_query condition for a user, None if it could not be built."""
     try:
-        # Get user document to check role profile
-        user_doc = frappe.get_doc("User", user)
-        user_role_profile = user_doc.get("role_profile_name")
+        # Role profile, roles and groups of the user
+        facts = get_issue_user_facts(user)
+        user_role_profile = facts["role_profile"]
         
         # Check if user has Accounting Team role profile
-        if user_role_profile == accounting_role_profile:
-            # Get shared documents for this user
-            shared_issues = frappe.share.get_shared("Issue", user, rights=["read"])
-            
+        if user_role_profile == ACCOUNTING_ROLE_PROFILE:
             # Build the query condition for Accounting Team role profile
             conditions = []
             
             # Add status condition - only allow Delivered and Closed
-            allowed_statuses = ["Delivered", "Closed"]
-            status_conditions = "', '".join(allowed_statuses)
+            status_conditions = "', '".join(ACCOUNTING_ALLOWED_STATUSES)
             conditions.append(f"`tabIssue`.status IN ('{status_conditions}')")
             
-            # Add shared documents condition if any documents are shared
-            if shared_issues:
-                shared_conditions = "', '".join(shared_issues)
-                conditions.append(f"`tabIssue`.name IN ('{shared_conditions}')")
+            # Add shared documents condition (correlated lookup on DocShare)
+            conditions.append(get_shared_issue_condition(user))
             
             # Combine conditions with OR
             return f"({' OR '.join(conditions)})"
         
         # Check if user has Tracking Team role profile
-        elif user_role_profile == tracking_role_profile:
-            # Get shared documents for this user
-            shared_issues = frappe.share.get_shared("Issue", user, rights=["read"])
-            
+        elif user_role_profile == TRACKING_ROLE_PROFILE:
             # Build the query condition for Tracking Team role profile
             conditions = []
             
             # Add status condition - exclude New, In Review
-            restricted_statuses = ["New", "In Review"]
-            status_conditions = "', '".join(restricted_statuses)
+            status_conditions = "', '".join(TRACKING_RESTRICTED_STATUSES)
             conditions.append(f"`tabIssue`.status NOT IN ('{status_conditions}')")
             
-            # Add shared documents condition if any documents are shared
-            if shared_issues:
-                shared_conditions = "', '".join(shared_issues)
-                conditions.append(f"`tabIssue`.name IN ('{shared_conditions}')")
+            # Add shared documents condition (correlated lookup on DocShare)
+            conditions.append(get_shared_issue_condition(user))
             
             # Combine conditions with OR
             return f"({' OR '.join(conditions)})"
         
-        # Get user roles for CSM team check
-        user_roles = frappe.get_roles(user)
-        
         # Check if user has any CSM role
-        if any(role in user_roles for role in csm_roles):
-            # Find which user groups this user belongs to
-            user_groups = frappe.get_all(
-                "User Group Member",
-                filters={"user": user},
-                fields=["parent"],
-                pluck="parent"
-            )
-            
-            # Get shared documents for this user
-            shared_issues = frappe.share.get_shared("Issue", user, rights=["read"])
+        if any(role in facts["roles"] for role in CSM_ROLES):
+            # User groups this user belongs to
+            user_groups = facts["user_groups"]
             
             # Build the query condition
             conditions = []
@@ -143,91 +233,72 @@ def issue_query(user):
             # Add user group condition if user belongs to any groups
             if user_groups:
                 if len(user_groups) == 1:
-                    conditions.append(f"`tabIssue`.custom_assigned_csm_team = '{user_groups[0]}'")
+                    conditions.append(f"`tabIssue`.custom_assigned_csm_team = {frappe.db.escape(user_groups[0], percent=False)}")
                 else:
-                    user_group_conditions = "', '".join(user_groups)
-                    conditions.append(f"`tabIssue`.custom_assigned_csm_team IN ('{user_group_conditions}')")
+                    user_group_conditions = ", ".join(frappe.db.escape(group, percent=False) for group in user_groups)
+                    conditions.append(f"`tabIssue`.custom_assigned_csm_team IN ({user_group_conditions})")
             
             # Add condition for individually assigned users (custom_users_assigned table)
             # This allows users to see issues they're individually assigned to via the new assignment system
-            conditions.append(f"""EXISTS (
-                SELECT 1 FROM `tabTeam User Assignment` 
-                WHERE `tabTeam User Assignment`.parent = `tabIssue`.name 
-                AND `tabTeam User Assignment`.parenttype = 'Issue'
-                AND `tabTeam User Assignment`.parentfield = 'custom_users_assigned'
-                AND `tabTeam User Assignment`.user_assigned = '{user}'
-            )""")
+            conditions.append(get_assigned_issue_condition(user))
             
-            # Add shared documents condition if any documents are shared
-            if shared_issues:
-                shared_conditions = "', '".join(shared_issues)
-                conditions.append(f"`tabIssue`.name IN ('{shared_conditions}')")
+            # Add shared documents condition (correlated lookup on DocShare)
+            conditions.append(get_shared_issue_condition(user))
             
             # Combine conditions with OR
             if conditions:
                 return f"({' OR '.join(conditions)})"
             else:
                 # CSM user with no groups and no shared docs - fallback to individual assignment check
-                return f"""EXISTS (
-                    SELECT 1 FROM `tabTeam User Assignment` 
-                    WHERE `tabTeam User Assignment`.parent = `tabIssue`.name 
-                    AND `tabTeam User Assignment`.parenttype = 'Issue'
-                    AND `tabTeam User Assignment`.parentfield = 'custom_users_assigned'
-                    AND `tabTeam User Assignment`.user_assigned = '{user}'
-                )"""
+                return get_assigned_issue_condition(user)
     except Exception as e:
         # Log error and allow access if there's an issue (fail-safe approach)
         frappe.log_error(f"Error in issue_query permission function: {str(e)}", "Permissions Error")
+        return None
     
-    return ""  # No restriction for other roles/profiles or if error occurs
+    return ""  # No restriction for other roles/profiles
 
-def issue_has_permission(doc, user):
-    """Check if user has permission to access the Issue."""
-    # Define CSM team roles - should match the roles in issue_query function
-    csm_roles = ["Support Team"]
-    # Define role profiles for different teams
-    tracking_role_profile = "Tracking Team"
-    accounting_role_profile = "Accounting Team"
+def clear_issue_query_cache(doc=None, method=None, *args):
+    """Clear cached issue_query conditions and user facts affected by a change to doc (all of them without a doc).
+
+    Hooked to User and User Group doc events and to clear_cache. A renamed
+    User Group clears its members, their cached groups still hold the old name.
+    """
+    if doc is None:
+        frappe.cache.delete_value([ISSUE_QUERY_CACHE_KEY, ISSUE_USER_FACTS_CACHE_KEY])
+        return
     
+    users = set()
+    if doc.doctype == "User":
+        # Role profile or roles may have changed
+        users.add(doc.name)
+    elif doc.doctype == "User Group":
+        # Members may have been added or removed, clear current and previous members
+        users.update(member.user for member in doc.get("user_group_members") or [])
+        previous = doc.get_doc_before_save()
+        if previous:
+            users.update(member.user for member in previous.get("user_group_members") or [])
+    
+    for user in users:
+        frappe.cache.hdel(ISSUE_QUERY_CACHE_KEY, user)
+        frappe.cache.hdel(ISSUE_USER_FACTS_CACHE_KEY, user)
+
+def issue_has_permission(doc, user):
+    """Check if user has permission to access the Issue.
+
+    The user's role profile, roles and groups come from get_issue_user_facts, so repeated checks
+    only query for the individual assignment and share of the document when the rules need them.
+    """
     try:
-        # First check if the document is explicitly shared with this user
-        # This allows special access overrides through Frappe's built-in sharing
-        if frappe.share.get_shared("Issue", user, filters=[["share_name", "=", doc.name]]):
-            return True
-        
-        # Get user document to check role profile
-        user_doc = frappe.get_doc("User", user)
-        user_role_profile = user_doc.get("role_profile_name")
-        
-        # Check if user has Accounting Team role profile
-        if user_role_profile == accounting_role_profile:
-            # Check if the document status is in allowed statuses
-            doc_status = doc.get("status")
-            allowed_statuses = ["Delivered", "Closed"]
-            if doc_status in allowed_statuses:
-                return True
-            else:
-                # User doesn't have access to this Issue (not in allowed statuses)
-                return False
+        facts = get_issue_user_facts(user)
         
-        # Check if user has Tracking Team role profile
-        elif user_role_profile == tracking_role_profile:
-            # Check if the document status is NOT in restricted statuses
-            doc_status = doc.get("status")
-            restricted_statuses = ["New", "In Review"]
-            if doc_status not in restricted_statuses:
-                return True
-            else:
-                # User doesn't have access to this Issue (restricted status)
-                return False
-        
-        # Get user roles for CSM team check
-        user_roles = frappe.get_roles(user)
+        # No restriction for other roles/profiles (non-restricted users)
+        if not is_restricted_issue_user(facts):
+            return True
         
-        # Check if user has any CSM role
-        if any(role in user_roles for role in csm_roles):
+        def is_assigned():
             # Check if user is individually assigned to this issue via custom_users_assigned table
-            individually_assigned = frappe.get_all(
+            return bool(frappe.get_all(
                 "Team User Assignment",
                 filters={
                     "parent": doc.name,
@@ -236,36 +307,54 @@ def issue_has_permission(doc, user):
                     "user_assigned": user
                 },
                 limit=1
-            )
-            
-            if individually_assigned:
-                # User is individually assigned to this issue - grant access
-                return True
-            
-            # Find which user groups this user belongs to
-            user_groups = frappe.get_all(
-                "User Group Member",
-                filters={"user": user},
-                fields=["parent"],
-                pluck="parent"
-            )
-            
-            if user_groups:
-                # Check if the document's user group matches any of the user's groups
-                doc_user_group = doc.get("custom_assigned_csm_team")
-                if doc_user_group and doc_user_group in user_groups:
-                    return True
-                else:
-                    # User doesn't have access to this specific Issue via team assignment
-                    return False
-            else:
-                # CSM user is not assigned to any user group - check individual assignment only
-                # (individual assignment was already checked above, so deny access here)
-                return False
+            ))
+        
+        if is_issue_allowed(facts, doc.get("status"), doc.get("custom_assigned_csm_team"), is_assigned):
+            return True
+        
+        # Issues explicitly shared with this user are accessible regardless of restrictions
+        # This allows special access overrides through Frappe's built-in sharing
+        return bool(frappe.share.get_shared("Issue", user, filters=[["share_name", "=", doc.name]]))
     except Exception as e:
         # Log error and allow access if there's an issue (fail-safe approach)
         frappe.log_error(f"Error in issue_has_permission function: {str(e)}", "Permissions Error")
         return True  # Fail-safe: allow access if error occurs
+
+def get_permitted_issue_names(issue_names, user=None):
+    """Return the issue_names user may access under the issue_has_permission rules, in their order.
+
+    Checks the whole list in one query (status, team, individual assignment and share of every
+    Issue) for bulk actions and realtime row refreshes. Names of Issues that don't exist are
+    dropped for restricted users.
+    """
+    user = user or frappe.session.user
+    issue_names = list(dict.fromkeys(issue_names or []))
+    if not issue_names:
+        return []
     
-    # No restriction for other roles/profiles (non-restricted users)
-    return True
\ No newline at end of file
+    try:
+        facts = get_issue_user_facts(user)
+        
+        # No restriction for other roles/profiles (non-restricted users)
+        if not is_restricted_issue_user(facts):
+            return issue_names
+        
+        escaped_names = ", ".join(frappe.db.escape(name, percent=False) for name in issue_names)
+        issues = frappe.db.sql(
+            f"""SELECT `tabIssue`.name, `tabIssue`.status, `tabIssue`.custom_assigned_csm_team,
+                {get_assigned_issue_condition(user)} AS is_assigned,
+                {get_shared_issue_condition(user)} AS is_shared
+            FROM `tabIssue`
+            WHERE `tabIssue`.name IN ({escaped_names})""",
+            as_dict=True
+        )
+        
+        permitted = {
+            issue.name for issue in issues
+            if issue.is_shared or is_issue_allowed(facts, issue.status, issue.custom_assigned_csm_team, issue.is_assigned)
+        }
+        return [name for name in issue_names if name in permitted]
+    except Exception as e:
+        # Log error and allow access if there's an issue (fail-safe approach)
+        frappe.log_error(f"Error in get_permitted_issue_names function: {e!s}", "Permissions Error")
+        return issue_names  # Fail-safe: allow access if error occurs
@@ -12,63 +12,59 @@
     let customColorMap = {};
     let isColorMapLoaded = false;
     
+    // Local copy of the versioned tag color map, shared with the issue tracker app
+    const TAG_COLORS_STORAGE_KEY = 'force_trans_tag_colors';
+    
+    function getStoredTagColors() {
+        try {
+            const stored = JSON.parse(localStorage.getItem(TAG_COLORS_STORAGE_KEY) || 'null');
+            if (stored && stored.version && stored.colors) {
+                return stored;
+            }
+        } catch (e) {
+            // Ignore unreadable copies, the map is fetched again
+        }
+        return { version: null, colors: {} };
+    }
+    
+    // Build the color map from a {tag: hex color} map
+    function applyTagColors(colors) {
+        customColorMap = {};
+        Object.keys(colors).forEach(tagName => {
+            const colorVars = createCSSVariablesForColor(tagName, colors[tagName]);
+            if (colorVars) {
+                customColorMap[tagName.toLowerCase()] = colorVars;
+            }
+        });
+    }
+    
     // Load tag categories and build color map
     function loadTagCategoryColors() {
         if (isColorMapLoaded) return;
         
-        // Fetch all tags with their categories and build the color map
+        // Color tags from the local copy right away, the server only sends the map when its version changed
+        const stored = getStoredTagColors();
+        applyTagColors(stored.colors);
+        
         frappe.call({
-            method: 'frappe.client.get_list',
-            args: {
-                doctype: 'Tag',
-                fields: ['name', 'custom_tag_category'],
-                filters: [['custom_tag_category', '!=', '']],
-                limit_page_length: 0
-            }
+            method: 'force_trans_customization.api.issues.get_tag_color_map',
+            args: { version: stored.version },
+            type: 'GET'
         }).then(result => {
-            if (!result.message) return;
-            
-            const tags = result.message;
-            const categoryPromises = [];
+            const data = result.message;
+            if (!data) return;
             
-            // Get unique tag categories
-            const uniqueCategories = [...new Set(tags.map(tag => tag.custom_tag_category))];
-            
-            // Fetch all tag category colors
-            uniqueCategories.forEach(categoryName => {
-                const promise = frappe.call({
-                    method: 'frappe.client.get_value',
-                    args: {
-                        doctype: 'Tag Category',
-                        fieldname: 'category_color',
-                        filters: { name: categoryName }
-                    }
-                });
-                categoryPromises.push(promise);
-            });
+            if (data.colors) {
+                try {
+                    localStorage.setItem(TAG_COLORS_STORAGE_KEY, JSON.stringify({ version: data.version, colors: data.colors }));
+                } catch (e) {
+                    // Storage full or disabled, the colors are still used for this page
+                }
+                applyTagColors(data.colors);
+            }
             
-            // Wait for all category colors to be fetched
-            Promise.all(categoryPromises).then(categoryResults => {
-                // Build the color map
-                categoryResults.forEach((categoryResult, index) => {
-                    if (categoryResult.message && categoryResult.message.category_color) {
-                        const categoryName = uniqueCategories[index];
-                        const hexColor = categoryResult.message.category_color;
-                        
-                        // Find all tags that belong to this category
-                        const categoryTags = tags.filter(tag => tag.custom_tag_category === categoryName);
-                        
-                        // Add each tag to the color map
-                        categoryTags.forEach(tag => {
-                            const colorVars = createCSSVariablesForColor(tag.name, hexColor);
-                            customColorMap[tag.name.toLowerCase()] = colorVars;
-                        });
-                    }
-                });
-                
-                isColorMapLoaded = true;
-                console.log('✅ Tag Category color map loaded:', customColorMap);
-            });
+            isColorMapLoaded = true;
+            console.log('✅ Tag Category color map loaded:', customColorMap);
         });
     }
     
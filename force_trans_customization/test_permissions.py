@@ -0,0 +1,91 @@
+import frappe
+import frappe.share
+from frappe.tests.utils import FrappeTestCase
+
+from force_trans_customization.permissions import (
+    ACCOUNTING_ROLE_PROFILE,
+    ISSUE_USER_FACTS_CACHE_KEY,
+    TRACKING_ROLE_PROFILE,
+    get_issue_user_facts,
+    get_permitted_issue_names,
+    issue_has_permission,
+)
+
+
+def make_test_user(email, roles=(), role_profile=None):
+    user = frappe.get_doc({
+        "doctype": "User",
+        "email": email,
+        "first_name": "Test Permissions",
+        "send_welcome_email": 0,
+        "roles": [{"role": role} for role in roles]
+    }).insert(ignore_permissions=True)
+    if role_profile:
+        frappe.db.set_value("User", user.name, "role_profile_name", role_profile)
+    return user.name
+
+
+class TestIssuePermissions(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        self.csm_user = make_test_user("test-permissions-csm@example.com", roles=["Support Team"])
+        self.tracking_user = make_test_user("test-permissions-tracking@example.com", role_profile=TRACKING_ROLE_PROFILE)
+        self.accounting_user = make_test_user("test-permissions-accounting@example.com", role_profile=ACCOUNTING_ROLE_PROFILE)
+        self.user_group = frappe.get_doc({
+            "doctype": "User Group",
+            "name": "Test Permissions Team",
+            "user_group_members": [{"user": self.csm_user}]
+        }).insert(ignore_permissions=True)
+
+        # (status, CSM team, assigned to the CSM user, shared with every test user)
+        seed = [
+            ("New", self.user_group.name, False, False),
+            ("In Review", None, True, False),
+            ("Delivered", None, False, False),
+            ("Closed", None, False, False),
+            ("New", None, False, True),
+            ("In Transit", None, False, False),
+        ]
+        self.issue_names = []
+        for i, (status, csm_team, is_assigned, is_shared) in enumerate(seed):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Permissions {i}",
+                "raised_by": "customer@example.com",
+                "status": status,
+                "custom_assigned_csm_team": csm_team
+            })
+            if is_assigned:
+                issue.append("custom_users_assigned", {"user_assigned": self.csm_user, "team": self.user_group.name})
+            issue.insert()
+            if is_shared:
+                for user in (self.csm_user, self.tracking_user, self.accounting_user):
+                    frappe.share.add("Issue", issue.name, user, read=1, notify=0)
+            self.issue_names.append(issue.name)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def assertMatchesHasPermission(self, user, expected):
+        permitted = [
+            name for name in self.issue_names
+            if issue_has_permission(frappe.get_doc("Issue", name), user)
+        ]
+        self.assertEqual(get_permitted_issue_names([*self.issue_names, "Missing Issue"], user), permitted)
+        self.assertEqual(permitted, [self.issue_names[i] for i in expected])
+
+    def test_csm_user(self):
+        self.assertMatchesHasPermission(self.csm_user, [0, 1, 4])
+
+    def test_tracking_user(self):
+        self.assertMatchesHasPermission(self.tracking_user, [2, 3, 4, 5])
+
+    def test_accounting_user(self):
+        self.assertMatchesHasPermission(self.accounting_user, [2, 3, 4])
+
+    def test_user_group_rename_clears_member_facts(self):
+        self.assertIn(self.user_group.name, get_issue_user_facts(self.csm_user)["user_groups"])
+        self.assertIsNotNone(frappe.cache.hget(ISSUE_USER_FACTS_CACHE_KEY, self.csm_user))
+
+        frappe.rename_doc("User Group", self.user_group.name, "Test Permissions Team Renamed")
+        self.assertIsNone(frappe.cache.hget(ISSUE_USER_FACTS_CACHE_KEY, self.csm_user))
@@ -0,0 +1,261 @@
+"""
+Per worker in-memory index for the filter autocomplete endpoints
+
+search_users, search_customers, search_contacts and search_leads match like '%query%' on a few columns.
+Instead of running those LIKEs on every keystroke, each worker loads the doctype once, sorted like the
+endpoint's ORDER BY, and keeps a trigram index over the searched columns:
+
+- queries of 3+ characters walk the postings of their rarest trigram and verify the substring
+- shorter queries scan the sorted rows, which stops at the first few matches
+
+Doc events log the changed names in Redis after commit. Before searching, a worker applies the names
+logged since its last search, and rebuilds only when the log was reset or too many rows changed.
+"""
+
+from array import array
+
+import frappe
+from frappe.model.db_query import DatabaseQuery
+
+# Indexed doctypes: loaded fields, searched fields, row filters and sort field (the endpoint's ORDER BY)
+AUTOCOMPLETE_SOURCES = {
+    "User": {
+        "fields": ["name", "full_name", "email", "enabled"],
+        "search_fields": ["name", "full_name", "email"],
+        "filters": {"enabled": 1},
+        "order_by": "full_name",
+    },
+    "Customer": {
+        "fields": ["name", "customer_name", "customer_group", "territory"],
+        "search_fields": ["name", "customer_name"],
+        "filters": {},
+        "order_by": "customer_name",
+    },
+    "Contact": {
+        "fields": ["name", "first_name", "last_name", "email_id", "company_name"],
+        "search_fields": ["name", "first_name", "last_name", "email_id"],
+        "filters": {},
+        "order_by": "first_name",
+    },
+    "Lead": {
+        "fields": ["name", "lead_name", "email_id", "company_name", "status"],
+        "search_fields": ["name", "lead_name", "email_id", "company_name"],
+        "filters": {},
+        "order_by": "lead_name",
+    },
+}
+
+AUTOCOMPLETE_LOG_KEY = "force_trans_autocomplete_log"
+AUTOCOMPLETE_GENERATION_KEY = "force_trans_autocomplete_generation"
+
+# Logged changes after which the log is reset and every worker rebuilds
+AUTOCOMPLETE_LOG_LIMIT = 5000
+# Rows changed since the build a worker keeps outside the sort order before rebuilding
+AUTOCOMPLETE_DELTA_LIMIT = 1000
+# Candidates taken per requested result, leaves room for rows the permission check drops
+AUTOCOMPLETE_CANDIDATE_FACTOR = 3
+
+# (site, doctype) -> AutocompleteIndex of this worker
+_indexes = {}
+
+
+def redis_command(*args):
+    """Raw Redis command, for the atomic list and counter operations RedisWrapper doesn't return results of"""
+    return frappe.cache.execute_command(*args)
+
+
+def get_redis_key(key, doctype):
+    return frappe.cache.make_key(f"{key}::{doctype}")
+
+
+class AutocompleteIndex:
+    """Rows of one doctype in sort order, with trigram postings over the searched columns"""
+
+    def __init__(self, doctype):
+        self.doctype = doctype
+        self.source = AUTOCOMPLETE_SOURCES[doctype]
+        self.built = False
+        self.generation = None
+        self.applied = 0
+        self.reset()
+
+    def reset(self):
+        self.rows = []
+        self.haystacks = []
+        self.sort_keys = []
+        self.ids = {}
+        self.trigrams = {}
+        # Rows from self.base_count on were added after the build and are not in sort order
+        self.base_count = 0
+
+    def get_sort_key(self, row):
+        return ((row.get(self.source["order_by"]) or "").lower(), row.name)
+
+    def load_rows(self, names=None):
+        filters = dict(self.source["filters"])
+        if names is not None:
+            filters["name"] = ["in", names]
+        return frappe.get_all(
+            self.doctype,
+            fields=self.source["fields"],
+            filters=filters,
+            limit_page_length=0
+        )
+
+    def build(self):
+        self.reset()
+        for row in sorted(self.load_rows(), key=self.get_sort_key):
+            self.add(row)
+        self.base_count = len(self.rows)
+        self.built = True
+
+    def add(self, row):
+        row_id = len(self.rows)
+        haystack = "\n".join(str(row.get(field) or "").lower() for field in self.source["search_fields"])
+
+        self.rows.append(row)
+        self.haystacks.append(haystack)
+        self.sort_keys.append(self.get_sort_key(row))
+        self.ids[row.name] = row_id
+
+        for trigram in {haystack[i:i + 3] for i in range(len(haystack) - 2)}:
+            postings = self.trigrams.get(trigram)
+            if postings is None:
+                postings = self.trigrams[trigram] = array("I")
+            postings.append(row_id)
+
+    def remove(self, name):
+        # Postings keep the id, search skips removed rows
+        row_id = self.ids.pop(name, None)
+        if row_id is not None:
+            self.rows[row_id] = None
+            self.haystacks[row_id] = None
+
+    def apply_changes(self, names):
+        names = list(dict.fromkeys(names))
+        for name in names:
+            self.remove(name)
+        for row in self.load_rows(names):
+            self.add(row)
+
+        if len(self.rows) - self.base_count > AUTOCOMPLETE_DELTA_LIMIT:
+            self.build()
+
+    def sync(self):
+        """Apply the changes other workers logged since the last search, rebuild when the log was reset"""
+        generation = redis_command("GET", get_redis_key(AUTOCOMPLETE_GENERATION_KEY, self.doctype))
+        log_key = get_redis_key(AUTOCOMPLETE_LOG_KEY, self.doctype)
+        logged = redis_command("LLEN", log_key) or 0
+
+        if not self.built or generation != self.generation or logged < self.applied:
+            self.build()
+        elif logged > self.applied:
+            names = redis_command("LRANGE", log_key, self.applied, logged - 1) or []
+            self.apply_changes([frappe.safe_decode(name) for name in names])
+
+        self.generation = generation
+        self.applied = logged
+
+    def search(self, search_query, limit):
+        """Rows matching like '%search_query%' on any searched column, the first limit in sort order"""
+        query = search_query.lower()
+
+        if len(query) < 3:
+            candidates = range(self.base_count)
+        else:
+            postings = [self.trigrams.get(query[i:i + 3]) for i in range(len(query) - 2)]
+            if any(p is None for p in postings):
+                return []
+            # The rarest trigram has the fewest candidates, the substring check covers the others
+            candidates = min(postings, key=len)
+
+        matches = []
+        for row_id in candidates:
+            if row_id >= self.base_count or len(matches) >= limit:
+                break
+            haystack = self.haystacks[row_id]
+            if haystack is not None and query in haystack:
+                matches.append(row_id)
+
+        # Rows changed since the build are few, check all of them and merge by sort key
+        matches.extend(
+            row_id for row_id in range(self.base_count, len(self.rows))
+            if self.haystacks[row_id] is not None and query in self.haystacks[row_id]
+        )
+        matches.sort(key=lambda row_id: self.sort_keys[row_id])
+
+        return [self.rows[row_id] for row_id in matches[:limit]]
+
+
+def get_autocomplete_index(doctype):
+    """The worker's index of doctype for the current site, built on first use and synced on every use"""
+    key = (frappe.local.site, doctype)
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = AutocompleteIndex(doctype)
+    index.sync()
+    return index
+
+
+def has_read_restrictions(doctype):
+    """Whether frappe.get_list limits the rows of doctype the session user reads (user permissions, query hooks, shares)"""
+    query = DatabaseQuery(doctype)
+    return bool(query.build_match_conditions() or query.conditions)
+
+
+def search_autocomplete_index(doctype, search_query, limit):
+    """
+    Rows of doctype matching like '%search_query%' on its searched columns that the user can read,
+    in the endpoint's order
+    """
+    frappe.has_permission(doctype, "read", throw=True)
+
+    index = get_autocomplete_index(doctype)
+    if not has_read_restrictions(doctype):
+        return index.search(search_query, limit)
+
+    # Check the candidates in one query instead of loading each document
+    candidates = index.search(search_query, limit * AUTOCOMPLETE_CANDIDATE_FACTOR)
+    if not candidates:
+        return []
+    permitted = set(frappe.get_list(
+        doctype,
+        filters={"name": ["in", [row.name for row in candidates]]},
+        pluck="name",
+        limit_page_length=0
+    ))
+    return [row for row in candidates if row.name in permitted][:limit]
+
+
+def record_autocomplete_change(doc, method=None, *args):
+    """
+    on_update / on_trash / after_rename of an indexed doctype: log the changed names for the workers
+    Logged after commit, so workers reload the committed row
+    """
+    if doc.doctype not in AUTOCOMPLETE_SOURCES:
+        return
+
+    names = [doc.name]
+    if method == "after_rename" and args:
+        # Old name is gone
+        names.append(args[0])
+
+    def log_change():
+        try:
+            log_key = get_redis_key(AUTOCOMPLETE_LOG_KEY, doc.doctype)
+            logged = 0
+            for name in names:
+                logged = redis_command("RPUSH", log_key, name)
+            if logged > AUTOCOMPLETE_LOG_LIMIT:
+                redis_command("DEL", log_key)
+                redis_command("INCR", get_redis_key(AUTOCOMPLETE_GENERATION_KEY, doc.doctype))
+        except Exception as e:
+            frappe.log_error(f"Error logging autocomplete change for {doc.doctype} {doc.name}: {e!s}", "Autocomplete Index Error")
+
+    frappe.db.after_commit.add(log_change)
+
+
+def clear_autocomplete_indexes():
+    """bench clear-cache: every worker rebuilds its indexes on the next search"""
+    for doctype in AUTOCOMPLETE_SOURCES:
+        redis_command("INCR", get_redis_key(AUTOCOMPLETE_GENERATION_KEY, doctype))
@@ -0,0 +1,143 @@
+"""
+Indexes for the issue list access paths and an advisor that EXPLAINs the app's query shapes
+
+The indexes are created by patches/v1_4_add_issue_list_indexes. The advisor is run with:
+
+    bench --site <site> force-trans-index-advisor [--user <user>]
+"""
+
+import frappe
+
+from force_trans_customization.api.issues import (
+    ISSUE_ASSIGNMENT_FIELDS,
+    STAT_TYPES,
+    build_issue_filters,
+    get_issue_permission_conditions,
+    get_issue_search_condition,
+    get_stat_filter_conditions,
+    get_valid_sort_fields,
+)
+
+# (doctype, columns) of every composite index the issue list queries rely on
+ISSUE_LIST_INDEXES = [
+    # Permission predicates (CSM team, role profile statuses) with the default sort
+    ("Issue", ["custom_assigned_csm_team", "creation"]),
+    ("Issue", ["status", "creation"]),
+    # actionable_tickets / response_tickets stat filters with the default sort
+    ("Issue", ["custom_is_response_expected", "creation"]),
+    ("Issue", ["custom_is_response_awaited", "creation"]),
+    # Individual assignment EXISTS and the assigned user filter: parent + user
+    ("Team User Assignment", ["parent", "parentfield", "user_assigned"]),
+    # Team filter: parent + team
+    ("Team User Assignment", ["parent", "parentfield", "team"]),
+    # open_tickets: the teams of the current user
+    ("Team User Assignment", ["user_assigned", "parentfield", "team"]),
+    # Tags of a page of issues, and issues with a tag
+    ("Tag Link", ["document_type", "document_name"]),
+    ("Tag Link", ["document_type", "tag", "document_name"]),
+]
+
+
+def get_sort_indexes():
+    """Single column indexes for the sortable Issue columns"""
+    return [("Issue", [field]) for field in get_valid_sort_fields() if field != "name"]
+
+
+def get_index_name(columns):
+    return "_".join(columns) + "_index"
+
+
+def has_covering_index(doctype, columns):
+    """Whether an index on doctype starts with columns, in order (the table may have it under another name)"""
+    indexes = {}
+    for row in frappe.db.sql(f"SHOW INDEX FROM `tab{doctype}`", as_dict=True):
+        indexes.setdefault(row.Key_name, {})[row.Seq_in_index] = row.Column_name
+
+    for index_columns in indexes.values():
+        if [index_columns.get(i + 1) for i in range(len(columns))] == columns:
+            return True
+    return False
+
+
+def add_issue_list_indexes():
+    """Create the issue list indexes that aren't already covered, returns the (doctype, columns) created"""
+    created = []
+    for doctype, columns in ISSUE_LIST_INDEXES + get_sort_indexes():
+        if not frappe.db.table_exists(doctype) or has_covering_index(doctype, columns):
+            continue
+        frappe.db.add_index(doctype, columns, get_index_name(columns))
+        created.append((doctype, columns))
+    return created
+
+
+def get_query_shapes():
+    """The SQL of the app's hot Issue queries for the session user, as (label, sql)"""
+    sample_user = frappe.session.user
+    shapes = []
+
+    def issue_list_sql(filters=None, order_by="creation desc", or_filters=None):
+        return frappe.get_list(
+            "Issue",
+            fields=["name"],
+            filters=filters,
+            or_filters=or_filters,
+            order_by=order_by,
+            limit_page_length=20,
+            run=0
+        )
+
+    shapes.append(("list: default page", issue_list_sql()))
+    for field in get_valid_sort_fields():
+        shapes.append((f"list: order by {field}", issue_list_sql(order_by=f"{field} desc")))
+
+    for stat_type in STAT_TYPES:
+        shapes.append((f"list: {stat_type}", issue_list_sql(get_stat_filter_conditions(stat_type, sample_user))))
+
+    sample_filters = {
+        "tag has": [{"field": "_user_tags", "operator": "has", "value": "sample"}],
+        "tag not_has": [{"field": "_user_tags", "operator": "not_has", "value": "sample"}],
+        "assigned user": [{"field": "custom_users_assigned", "operator": "in", "value": sample_user}],
+        "assigned users (all)": [{"field": "custom_users_assigned", "operator": "in", "value": [sample_user, "Guest"]}],
+        "team": [{"field": "custom_assigned_csm_team", "operator": "equals", "value": "sample"}],
+    }
+    for label, filters in sample_filters.items():
+        filter_list, or_filters = build_issue_filters(filters)
+        shapes.append((f"list: {label}", issue_list_sql(filter_list, or_filters=or_filters)))
+
+    search_condition, relevance = get_issue_search_condition("sample issue")
+    where_clause = " AND ".join(f"({condition})" for condition in [search_condition, *get_issue_permission_conditions()])
+    shapes.append(("search", f"SELECT `tabIssue`.name FROM `tabIssue` WHERE {where_clause} ORDER BY {relevance} DESC LIMIT 8"))
+
+    # Assignments of a page of issues, as loaded by attach_assignments_and_tags
+    shapes.append((
+        "page: assignments",
+        frappe.get_all(
+            "Team User Assignment",
+            filters={"parent": ["in", ["a", "b"]]},
+            fields=ISSUE_ASSIGNMENT_FIELDS,
+            order_by="idx asc",
+            run=0
+        )
+    ))
+    shapes.append((
+        "page: tags",
+        "SELECT document_name, tag FROM `tabTag Link` WHERE document_type = 'Issue' AND document_name IN ('a', 'b') ORDER BY creation"
+    ))
+
+    return shapes
+
+
+def explain_query_shapes():
+    """EXPLAIN every query shape, returns a list of {label, table, type, key, rows} for the full scans"""
+    full_scans = []
+    for label, sql in get_query_shapes():
+        for row in frappe.db.sql(f"EXPLAIN {sql}", as_dict=True):
+            if row.get("type") == "ALL":
+                full_scans.append({
+                    "label": label,
+                    "table": row.get("table"),
+                    "type": row.get("type"),
+                    "key": row.get("key"),
+                    "rows": row.get("rows"),
+                })
+    return full_scans
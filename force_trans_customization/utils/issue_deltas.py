@@ -0,0 +1,229 @@
+"""
+Coalesced realtime deltas for the issue list
+
+Issue, assignment and tag changes are collected in Redis after commit. The first change of a window enqueues
+publish_issue_deltas, which waits ISSUE_DELTA_WINDOW seconds, takes everything collected meanwhile and publishes
+one issue_list_delta per user:
+
+    {"issues": [{"name", "modified", <changed list fields>, ...}], "removed": [names]}
+
+Rows carry only the list fields that changed (all of them for new issues), custom_users_assigned and _user_tags
+when those changed. "removed" lists deleted issues and issues the user can no longer see.
+
+Frappe's socket.io server only joins user, doctype and document rooms, so the team scoping is done here: users
+are grouped by the facts the Issue permission rules use, visibility is decided once per group, and each user of
+the group gets the group's delta (plus issues assigned or shared to them) in their own room.
+"""
+
+import time
+
+import frappe
+
+from force_trans_customization.api.issues import (
+    ISSUE_LIST_FIELDS,
+    ISSUE_LIST_GENERATION_KEY,
+    attach_assignments_and_tags,
+)
+from force_trans_customization.permissions import (
+    get_issue_user_facts,
+    is_issue_allowed,
+    is_restricted_issue_user,
+)
+from force_trans_customization.utils.autocomplete_index import redis_command
+
+ISSUE_DELTA_EVENT = "issue_list_delta"
+
+# Seconds changes are collected before a batch is published
+ISSUE_DELTA_WINDOW = 2
+
+ISSUE_DELTA_PENDING_KEY = "force_trans_issue_delta_pending"
+ISSUE_DELTA_LOCK_KEY = "force_trans_issue_delta_lock"
+
+# Markers stored with the issue name in the pending set
+ALL_FIELDS = "*"
+REMOVED = "-"
+ASSIGNMENTS_FIELD = "custom_users_assigned"
+TAGS_FIELD = "_user_tags"
+
+
+def record_issue_change(issue_name, fields):
+    """Collect changed fields of an issue after commit and make sure a publish job is coming"""
+    fields = list(fields)
+    if not issue_name or not fields:
+        return
+
+    def collect():
+        try:
+            pending_key = frappe.cache.make_key(ISSUE_DELTA_PENDING_KEY)
+            redis_command("SADD", pending_key, *[f"{issue_name}\t{field}" for field in fields])
+            # Changes the list ETag of every client, deletions included
+            redis_command("INCR", frappe.cache.make_key(ISSUE_LIST_GENERATION_KEY))
+
+            # The first change of a window enqueues the job, the lock expires in case the job never runs
+            lock_key = frappe.cache.make_key(ISSUE_DELTA_LOCK_KEY)
+            if redis_command("SET", lock_key, 1, "NX", "EX", ISSUE_DELTA_WINDOW * 10):
+                frappe.enqueue(
+                    "force_trans_customization.utils.issue_deltas.publish_issue_deltas",
+                    queue="short"
+                )
+        except Exception as e:
+            frappe.log_error(f"Error recording issue delta for {issue_name}: {e!s}", "Issue Delta Error")
+
+    frappe.db.after_commit.add(collect)
+
+
+def get_changed_list_fields(doc):
+    """List fields of an Issue changed by this save, ALL_FIELDS for a new issue"""
+    before = doc.get_doc_before_save()
+    if not before:
+        return [ALL_FIELDS]
+
+    fields = [field for field in ISSUE_LIST_FIELDS if doc.get(field) != before.get(field)]
+
+    def assignment_keys(issue):
+        return [(row.user_assigned, row.team) for row in issue.get(ASSIGNMENTS_FIELD) or []]
+
+    if assignment_keys(doc) != assignment_keys(before):
+        fields.append(ASSIGNMENTS_FIELD)
+    return fields
+
+
+def record_issue_update(doc, method=None):
+    """Issue on_update / after_delete"""
+    if method == "after_delete":
+        record_issue_change(doc.name, [REMOVED])
+        return
+
+    fields = get_changed_list_fields(doc)
+    if fields and fields != ["modified"]:
+        record_issue_change(doc.name, fields)
+
+
+def record_issue_tag_change(doc, method=None):
+    """Tag Link after_insert / after_delete"""
+    if doc.document_type == "Issue":
+        record_issue_change(doc.document_name, [TAGS_FIELD])
+
+
+def take_pending_changes():
+    """Atomically take the collected changes, as {issue name: set of fields}"""
+    pending_key = frappe.cache.make_key(ISSUE_DELTA_PENDING_KEY)
+    taken_key = f"{pending_key}::{frappe.generate_hash(length=8)}"
+    try:
+        redis_command("RENAME", pending_key, taken_key)
+    except Exception:
+        # Nothing collected
+        return {}
+
+    members = redis_command("SMEMBERS", taken_key) or []
+    redis_command("DEL", taken_key)
+
+    changes = {}
+    for member in members:
+        name, _, field = frappe.safe_decode(member).partition("\t")
+        changes.setdefault(name, set()).add(field)
+    return changes
+
+
+def get_issue_delta_audience():
+    """Enabled desk users with a role that can read Issue"""
+    roles = {perm.role for perm in frappe.get_meta("Issue").permissions if perm.read}
+    users = frappe.get_all(
+        "Has Role",
+        filters={"parenttype": "User", "role": ["in", list(roles)]},
+        distinct=True,
+        pluck="parent"
+    )
+    if not users:
+        return []
+    return frappe.get_all(
+        "User",
+        filters={"name": ["in", users], "enabled": 1, "user_type": "System User"},
+        pluck="name"
+    )
+
+
+def get_delta_row(issue, fields):
+    """The list row of an issue reduced to the fields that changed"""
+    if ALL_FIELDS in fields:
+        return issue
+    row = {"name": issue.name, "modified": issue.modified}
+    for field in fields:
+        if field in issue:
+            row[field] = issue[field]
+    return row
+
+
+def publish_issue_deltas():
+    """Background job: wait for the window to fill, then publish one delta per user"""
+    time.sleep(ISSUE_DELTA_WINDOW)
+
+    # Changes from here on start the next window
+    redis_command("DEL", frappe.cache.make_key(ISSUE_DELTA_LOCK_KEY))
+    changes = take_pending_changes()
+    if not changes:
+        return
+
+    issues = frappe.get_all(
+        "Issue",
+        fields=list(ISSUE_LIST_FIELDS),
+        filters={"name": ["in", list(changes)]}
+    )
+    attach_assignments_and_tags(issues)
+
+    issues_by_name = {issue.name: issue for issue in issues}
+    deleted = [name for name in changes if name not in issues_by_name]
+    rows = {issue.name: get_delta_row(issue, changes[issue.name]) for issue in issues}
+
+    # Shares decide visibility for restricted users, one query for the batch
+    shared_with = {}
+    shared_with_everyone = set()
+    for share in frappe.get_all(
+        "DocShare",
+        filters={"share_doctype": "Issue", "share_name": ["in", list(issues_by_name)], "read": 1},
+        fields=["share_name", "user", "everyone"]
+    ):
+        if share.everyone:
+            shared_with_everyone.add(share.share_name)
+        else:
+            shared_with.setdefault(share.share_name, set()).add(share.user)
+
+    # Visibility of the role profile / team rules, decided once per group of users with the same facts
+    group_visibility = {}
+
+    for user in get_issue_delta_audience():
+        facts = get_issue_user_facts(user)
+        group = (facts["role_profile"], tuple(sorted(facts["roles"])), tuple(sorted(facts["user_groups"])))
+
+        if group not in group_visibility:
+            if not is_restricted_issue_user(facts):
+                group_visibility[group] = None
+            else:
+                group_visibility[group] = {
+                    issue.name: is_issue_allowed(facts, issue.status, issue.custom_assigned_csm_team, False)
+                    for issue in issues
+                }
+        visibility = group_visibility[group]
+
+        visible, hidden = [], []
+        for issue in issues:
+            if (
+                visibility is None
+                or visibility[issue.name]
+                or issue.name in shared_with_everyone
+                or user in shared_with.get(issue.name, ())
+                or is_issue_allowed(
+                    facts, issue.status, issue.custom_assigned_csm_team,
+                    any(row.user_assigned == user for row in issue.custom_users_assigned)
+                )
+            ):
+                visible.append(rows[issue.name])
+            else:
+                hidden.append(issue.name)
+
+        frappe.publish_realtime(
+            ISSUE_DELTA_EVENT,
+            {"issues": visible, "removed": deleted + hidden},
+            user=user,
+            after_commit=False
+        )
@@ -0,0 +1,110 @@
+"""
+Benchmark for issue_search
+
+Seeds synthetic Issues, times the old LIKE '%query%' search against the FULLTEXT backed issue_search,
+then removes the seeded Issues again. Run it on a test site, it commits:
+
+    bench --site <site> execute force_trans_customization.utils.issue_search_benchmark.run --kwargs "{'rows': 500000}"
+"""
+
+import random
+import statistics
+import time
+
+import frappe
+from frappe.utils import add_to_date, now_datetime
+
+from force_trans_customization.api.issues import (
+    ISSUE_SEARCH_COLUMNS,
+    has_issue_search_index,
+    issue_search,
+)
+
+BENCH_PREFIX = "BENCH-ISS-"
+
+WORDS = [
+    "shipment", "delayed", "invoice", "customs", "broker", "container", "pickup", "delivery",
+    "damaged", "refund", "quote", "tracking", "port", "rail", "truck", "warehouse", "pallet",
+    "booking", "clearance", "freight", "manifest", "payment", "reefer", "temperature", "dispute"
+]
+
+DEFAULT_QUERIES = [
+    "container",            # whole word
+    "cont",                 # word prefix
+    "invoice delayed",      # several words
+    "customer 42",          # long and short word
+    "user42",               # raised_by prefix
+    f"{BENCH_PREFIX}00049", # issue name prefix
+    "zzzz",                 # no matches
+]
+
+
+def run(rows=500000, queries=None, repeat=5, limit=8):
+    """Seed rows synthetic Issues, time both search backends for every query and clean up"""
+    rows = int(rows)
+    repeat = int(repeat)
+    queries = queries or DEFAULT_QUERIES
+
+    if not has_issue_search_index():
+        print("⚠️  Issue search FULLTEXT index is missing, issue_search will fall back to LIKE")
+
+    try:
+        seed_issues(rows)
+
+        print(f"issue_search benchmark: {rows} issues, median of {repeat} runs, limit {limit}")
+        print(f"{'query':<24}{'like ms':>12}{'fulltext ms':>14}{'rows':>8}")
+        for query in queries:
+            like_ms = median_ms(lambda: legacy_like_search(query, limit), repeat)
+            fulltext_ms = median_ms(lambda: issue_search(query, limit), repeat)
+            print(f"{query:<24}{like_ms:>12.2f}{fulltext_ms:>14.2f}{len(issue_search(query, limit)):>8}")
+    finally:
+        frappe.db.delete("Issue", {"name": ["like", f"{BENCH_PREFIX}%"]})
+        frappe.db.commit()
+
+
+def seed_issues(rows, chunk_size=10000):
+    """Bulk insert synthetic Issues, committed so the FULLTEXT index picks them up"""
+    fields = ["name", "subject", "customer", "raised_by", "status", "creation", "modified", "owner", "modified_by"]
+    start = now_datetime()
+    randomizer = random.Random(42)
+
+    values = []
+    for i in range(rows):
+        created = add_to_date(start, minutes=-i)
+        values.append((
+            f"{BENCH_PREFIX}{i:07d}",
+            " ".join(randomizer.sample(WORDS, 4)),
+            f"Customer {i % 2000}",
+            f"user{i % 5000}@example{i % 50}.com",
+            randomizer.choice(["Open", "Replied", "Resolved", "Closed"]),
+            created,
+            created,
+            "Administrator",
+            "Administrator",
+        ))
+
+    frappe.db.bulk_insert("Issue", fields, values, chunk_size=chunk_size)
+    frappe.db.commit()
+
+
+def legacy_like_search(search_query, limit):
+    """The search issue_search ran before the FULLTEXT index: LIKE '%query%' on every column"""
+    pattern = frappe.db.escape(f"%{search_query}%", percent=False)
+    condition = " OR ".join(f"`{column}` LIKE {pattern}" for column in ISSUE_SEARCH_COLUMNS)
+    return frappe.db.sql(
+        f"""SELECT name, subject, status, raised_by, creation, description
+        FROM `tabIssue`
+        WHERE {condition}
+        ORDER BY modified DESC
+        LIMIT {int(limit)}""",
+        as_dict=True
+    )
+
+
+def median_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
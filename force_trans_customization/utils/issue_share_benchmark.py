@@ -0,0 +1,86 @@
+"""
+Benchmark for the issue_query shared documents condition
+
+Seeds synthetic Issues and DocShare rows for users with 0, 100 and 10k shared Issues, then compares
+the old inlined name IN ('...') condition with the DocShare EXISTS condition: SQL size, EXPLAIN plan
+and latency of a list page and a count. Run it on a test site, it commits:
+
+    bench --site <site> execute force_trans_customization.utils.issue_share_benchmark.run
+"""
+
+import json
+
+import frappe
+import frappe.share
+from frappe.utils import now_datetime
+
+from force_trans_customization.permissions import get_shared_issue_condition
+from force_trans_customization.utils.issue_search_benchmark import BENCH_PREFIX, median_ms, seed_issues
+
+BENCH_USER = "issue-share-benchmark@example.com"
+
+
+def run(issues=50000, share_counts=(0, 100, 10000), repeat=5, show_plans=True):
+    """Seed issues and shares, time both shared documents conditions for every share count and clean up"""
+    issues = int(issues)
+    share_counts = [int(count) for count in share_counts]
+
+    try:
+        seed_issues(max([issues, *share_counts]))
+        issue_names = frappe.get_all(
+            "Issue", filters={"name": ["like", f"{BENCH_PREFIX}%"]}, order_by="name asc", pluck="name"
+        )
+
+        print(f"issue_query shared documents benchmark: {len(issue_names)} issues, median of {repeat} runs")
+        print(f"{'shares':>8}{'condition':>12}{'sql bytes':>12}{'page ms':>10}{'count ms':>10}")
+        for share_count in share_counts:
+            seed_shares(issue_names[:share_count])
+
+            for label, condition in [
+                ("inline IN", legacy_inline_share_condition(BENCH_USER)),
+                ("EXISTS", get_shared_issue_condition(BENCH_USER)),
+            ]:
+                # Same shape as the Tracking Team condition, the share branch decides visibility of New issues
+                where_clause = f"(`tabIssue`.status NOT IN ('New', 'In Review') OR {condition})"
+                page_sql = f"""SELECT `tabIssue`.name FROM `tabIssue` WHERE {where_clause}
+                    ORDER BY `tabIssue`.creation DESC LIMIT 20"""
+                count_sql = f"SELECT COUNT(*) FROM `tabIssue` WHERE {where_clause}"
+
+                page_ms = median_ms(lambda: frappe.db.sql(page_sql), repeat)
+                count_ms = median_ms(lambda: frappe.db.sql(count_sql), repeat)
+                print(f"{share_count:>8}{label:>12}{len(where_clause):>12}{page_ms:>10.2f}{count_ms:>10.2f}")
+
+                if show_plans:
+                    for row in frappe.db.sql(f"EXPLAIN {page_sql}", as_dict=True):
+                        print(f"{'':>8}  {json.dumps(row, default=str)}")
+
+            frappe.db.delete("DocShare", {"user": BENCH_USER})
+            frappe.db.commit()
+    finally:
+        frappe.db.delete("DocShare", {"user": BENCH_USER})
+        frappe.db.delete("Issue", {"name": ["like", f"{BENCH_PREFIX}%"]})
+        frappe.db.commit()
+
+
+def seed_shares(issue_names):
+    """Share issue_names with the benchmark user for read"""
+    if not issue_names:
+        return
+
+    fields = ["name", "share_doctype", "share_name", "user", "read", "everyone", "creation", "modified", "owner", "modified_by"]
+    now = now_datetime()
+    values = [
+        (frappe.generate_hash(length=10), "Issue", issue_name, BENCH_USER, 1, 0, now, now, "Administrator", "Administrator")
+        for issue_name in issue_names
+    ]
+    frappe.db.bulk_insert("DocShare", fields, values)
+    frappe.db.commit()
+
+
+def legacy_inline_share_condition(user):
+    """The shared documents condition issue_query built before the DocShare EXISTS: every name inlined"""
+    shared_issues = frappe.share.get_shared("Issue", user, rights=["read"])
+    if not shared_issues:
+        return "0"
+    shared_conditions = "', '".join(shared_issues)
+    return f"`tabIssue`.name IN ('{shared_conditions}')"
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from force_trans_customization.utils.autocomplete_index import AutocompleteIndex, search_autocomplete_index
+
+
+class StaticAutocompleteIndex(AutocompleteIndex):
+    """Index over in-memory rows instead of the database"""
+
+    def __init__(self, doctype, rows):
+        self.source_rows = {row["name"]: frappe._dict(row) for row in rows}
+        super().__init__(doctype)
+
+    def load_rows(self, names=None):
+        if names is None:
+            return list(self.source_rows.values())
+        return [self.source_rows[name] for name in names if name in self.source_rows]
+
+
+class TestAutocompleteIndex(FrappeTestCase):
+    def setUp(self):
+        self.index = StaticAutocompleteIndex("Customer", [
+            {"name": "CUST-3", "customer_name": "Zephyr Freight"},
+            {"name": "CUST-1", "customer_name": "acme Logistics"},
+            {"name": "CUST-2", "customer_name": "Blue Harbor Freight"},
+            {"name": "CUST-4", "customer_name": None},
+        ])
+        self.index.build()
+
+    def search(self, query, limit=10):
+        return [row.name for row in self.index.search(query, limit)]
+
+    def test_infix_match_in_sort_order(self):
+        # Like '%freight%' on name or customer_name, ordered by customer_name
+        self.assertEqual(self.search("FREIGHT"), ["CUST-2", "CUST-3"])
+        self.assertEqual(self.search("ight"), ["CUST-2", "CUST-3"])
+        self.assertEqual(self.search("cust-4"), ["CUST-4"])
+        self.assertEqual(self.search("nothing"), [])
+
+    def test_short_query_scans_until_limit(self):
+        self.assertEqual(self.search("a", limit=2), ["CUST-1", "CUST-2"])
+
+    def test_changes_are_applied_without_rebuild(self):
+        self.index.source_rows["CUST-1"].customer_name = "Acme Freight"
+        self.index.source_rows["CUST-5"] = frappe._dict(name="CUST-5", customer_name="Aardvark Freight")
+        del self.index.source_rows["CUST-3"]
+        self.index.apply_changes(["CUST-1", "CUST-3", "CUST-5"])
+
+        self.assertEqual(self.search("freight"), ["CUST-5", "CUST-1", "CUST-2"])
+        self.assertEqual(self.search("logistics"), [])
+
+
+class TestSearchAutocompleteIndex(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        self.index = StaticAutocompleteIndex("User", [
+            {"name": "Administrator", "full_name": "Administrator"},
+            {"name": "test-autocomplete-missing@example.com", "full_name": "Administrator Missing"},
+            {"name": "Guest", "full_name": "Guest Administrator"},
+        ])
+        self.index.build()
+
+    def search(self, query, limit=10, restricted=False):
+        with (
+            patch("force_trans_customization.utils.autocomplete_index.get_autocomplete_index", return_value=self.index),
+            patch("force_trans_customization.utils.autocomplete_index.has_read_restrictions", return_value=restricted),
+            patch("frappe.get_list", wraps=frappe.get_list) as get_list,
+        ):
+            names = [row.name for row in search_autocomplete_index("User", query, limit)]
+        return names, get_list.call_count
+
+    def test_unrestricted_user_skips_the_permission_check(self):
+        self.assertEqual(self.search("administrator"), (["Administrator", "test-autocomplete-missing@example.com", "Guest"], 0))
+
+    def test_restricted_user_is_checked_in_one_query(self):
+        # Rows the user can't read through frappe.get_list are dropped, in the index order
+        self.assertEqual(self.search("administrator", restricted=True), (["Administrator", "Guest"], 1))
+        self.assertEqual(self.search("administrator", limit=1, restricted=True), (["Administrator"], 1))
+        self.assertEqual(self.search("nothing", restricted=True), ([], 0))
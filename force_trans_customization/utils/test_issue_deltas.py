@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from force_trans_customization.utils.issue_deltas import ALL_FIELDS, REMOVED, publish_issue_deltas
+
+
+class TestPublishIssueDeltas(FrappeTestCase):
+    def setUp(self):
+        frappe.set_user("Administrator")
+        # A CSM user without groups only sees the issues they are individually assigned to
+        self.csm_user = frappe.get_doc({
+            "doctype": "User",
+            "email": "test-issue-deltas-csm@example.com",
+            "first_name": "Test Deltas",
+            "send_welcome_email": 0,
+            "roles": [{"role": "Support Team"}]
+        }).insert(ignore_permissions=True).name
+
+        self.issue_names = []
+        for i, assigned in enumerate([True, False]):
+            issue = frappe.get_doc({
+                "doctype": "Issue",
+                "subject": f"Test Issue for Deltas {i}",
+                "raised_by": "customer@example.com",
+                "status": "Open"
+            })
+            if assigned:
+                issue.append("custom_users_assigned", {"user_assigned": self.csm_user, "team": "Test Team A"})
+            issue.insert()
+            self.issue_names.append(issue.name)
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def publish(self, changes):
+        with (
+            patch("force_trans_customization.utils.issue_deltas.time.sleep"),
+            patch("force_trans_customization.utils.issue_deltas.take_pending_changes", return_value=changes),
+            patch(
+                "force_trans_customization.utils.issue_deltas.get_issue_delta_audience",
+                return_value=["Administrator", self.csm_user]
+            ),
+            patch("frappe.publish_realtime") as publish_realtime,
+        ):
+            publish_issue_deltas()
+        return {call.kwargs["user"]: call.args[1] for call in publish_realtime.call_args_list}
+
+    def test_payload_per_user(self):
+        assigned, unassigned = self.issue_names
+        payloads = self.publish({
+            assigned: {ALL_FIELDS},
+            unassigned: {"status"},
+            "Deleted Issue": {REMOVED},
+        })
+
+        # Unrestricted users get every row, changed fields only for updated issues
+        rows = {row["name"]: row for row in payloads["Administrator"]["issues"]}
+        self.assertEqual(set(rows), set(self.issue_names))
+        self.assertEqual(set(rows[unassigned]), {"name", "modified", "status"})
+        self.assertIn("custom_users_assigned", rows[assigned])
+        self.assertEqual(payloads["Administrator"]["removed"], ["Deleted Issue"])
+
+        # The CSM user can't read the unassigned issue, it is removed from their list
+        self.assertEqual([row["name"] for row in payloads[self.csm_user]["issues"]], [assigned])
+        self.assertEqual(sorted(payloads[self.csm_user]["removed"]), sorted(["Deleted Issue", unassigned]))
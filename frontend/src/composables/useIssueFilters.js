@@ -105,7 +105,7 @@ export function useIssueFilters() {
 			const query = searchQuery.value.toLowerCase().trim()
 			filteredIssues = filteredIssues.filter((issue) => {
 				const subject = (issue.subject || "").toLowerCase()
-				const description = (issue.description || "").toLowerCase()
+				const description = (issue.description || issue.custom_description_snippet || "").toLowerCase()
 				return subject.includes(query) || description.includes(query)
 			})
 		}
@@ -1,109 +1,50 @@
 import { onMounted, onUnmounted, ref } from 'vue'
 import { useSocket } from '../socket'
-import { reloadIssues, getIssuesCount, issuesResource, fetchSingleIssue, singleIssueResource, statFilterResource } from '../data/issues'
+import { reloadIssues, getIssuesCount, issuesResource, fetchIssuesByNames, statFilterResource } from '../data/issues'
 
 /**
- * Composable that implements Frappe's list view realtime update pattern
- * Similar to setup_realtime_updates() in frappe/public/js/frappe/list/list_view.js
+ * Composable that keeps the issue list current from realtime deltas
+ * The server batches Issue, assignment and tag changes and publishes one issue_list_delta per user
+ * ({ issues: [changed fields of each row], removed: [names] }, see utils/issue_deltas.py),
+ * rows are patched in place without refetching them
  */
 export function useIssueListUpdates(getCurrentParams, customRefreshFunction, getCurrentResourceState) {
   const socket = useSocket()
   const pendingDocumentRefreshes = ref([])
   const realtimeEventsSetup = ref(false)
-  const isLargeTable = ref(false) // Could be made configurable
   
-  // Debounced refresh similar to Frappe's approach
-  let debounceTimer = null
-  const debounceDelay = isLargeTable.value ? 15000 : 2000 // 15s for large tables, 2s for normal
-  
-  const debouncedRefresh = () => {
-    console.log(`⏰ Setting up debounced refresh with ${debounceDelay}ms delay`)
-    if (debounceTimer) {
-      clearTimeout(debounceTimer)
-      console.log('🔄 Cleared existing debounce timer')
-    }
-    debounceTimer = setTimeout(() => {
-      console.log('⏰ Debounce timer fired, calling processDocumentRefreshes')
-      processDocumentRefreshes()
-    }, debounceDelay)
-  }
-
   const setupRealtimeUpdates = () => {
     if (!socket || realtimeEventsSetup.value) {
       return
     }
     
-    // Subscribe to Issue doctype updates (Frappe's standard way)
-    socket.emit('doctype_subscribe', 'Issue')
-    
-    // Remove any existing listeners to avoid duplicates
-    socket.off('list_update')
+    // Remove any existing listener to avoid duplicates
+    socket.off('issue_list_delta')
     
-    // Listen for Frappe's standard list_update event
-    socket.on('list_update', (data) => {
+    // Deltas are published to the user's own room, no doctype subscription needed
+    socket.on('issue_list_delta', (delta) => {
       try {
-        console.log('📡 Received list_update event:', data)
-        
-        if (data?.doctype !== 'Issue') {
+        const changedNames = [
+          ...(delta?.issues || []).map(issue => issue.name),
+          ...(delta?.removed || [])
+        ]
+        if (!changedNames.length) {
           return
         }
 
-        // Skip updates if we're in a state where updates should be avoided
+        // While updates are avoided, remember the names and resync them in one call later
         if (avoidRealtimeUpdate()) {
-          console.log('⏸️ Skipping realtime update (avoid condition met)')
+          pendingDocumentRefreshes.value.push(...changedNames.map(name => ({ name })))
           return
         }
 
-        // Only process updates for existing issues, not newly created ones
-        if (data.action === 'insert' || data.action === 'create') {
-          console.log('📝 Skipping new issue creation update:', data.name)
-          return
-        }
-
-        console.log('✅ Adding to pending refreshes:', data.name)
-        // Add to pending refreshes
-        pendingDocumentRefreshes.value.push(data)
-        debouncedRefresh()
+        applyIssueDelta(delta)
       } catch (error) {
-        console.error('❌ Error processing list_update event:', error)
+        console.error('❌ Error processing issue_list_delta event:', error)
         // Don't let realtime errors break the system
       }
     })
 
-    // Also listen for individual document events that should trigger list updates
-    const documentEvents = ['doctype_update', 'Issue_update', 'Issue_create', 'Issue_delete']
-    
-    documentEvents.forEach(eventName => {
-      socket.on(eventName, (data) => {
-        if (data?.doctype !== 'Issue') {
-          return
-        }
-
-        if (avoidRealtimeUpdate()) {
-          return
-        }
-
-        // Convert to list_update format
-        const listUpdateData = {
-          doctype: 'Issue',
-          name: data.name,
-          action: eventName.includes('create') ? 'insert' : 
-                  eventName.includes('delete') ? 'delete' : 'update',
-          modified_by: data.modified_by || data.owner,
-          timestamp: new Date().toISOString()
-        }
-
-        // Only process updates for existing issues, not newly created ones
-        if (listUpdateData.action === 'insert') {
-          console.log('📝 Skipping new issue creation update:', data.name)
-          return
-        }
-
-        pendingDocumentRefreshes.value.push(listUpdateData)
-        debouncedRefresh()
-      })
-    })
-
     realtimeEventsSetup.value = true
   }
 
@@ -112,15 +53,8 @@ export function useIssueListUpdates(getCurrentParams, customRefreshFunction, get
       return
     }
     
-    // Unsubscribe from doctype updates
-    socket.emit('doctype_unsubscribe', 'Issue')
-    
-    // Remove all event listeners
-    socket.off('list_update')
-    const documentEvents = ['doctype_update', 'Issue_update', 'Issue_create', 'Issue_delete']
-    documentEvents.forEach(eventName => {
-      socket.off(eventName)
-    })
+    // Remove the delta listener
+    socket.off('issue_list_delta')
     
     realtimeEventsSetup.value = false
   }
@@ -188,6 +122,38 @@ export function useIssueListUpdates(getCurrentParams, customRefreshFunction, get
     }
   }
 
+  const applyIssueDelta = (delta) => {
+    const { activeResource } = getCurrentActiveResource()
+    if (!activeResource.data || !Array.isArray(activeResource.data)) {
+      return
+    }
+
+    let updatedCount = 0
+
+    // Patch the changed fields of rows on the current page, other rows aren't shown
+    ;(delta.issues || []).forEach(changes => {
+      const index = activeResource.data.findIndex(issue => issue.name === changes.name)
+      if (index !== -1) {
+        Object.assign(activeResource.data[index], changes)
+        updatedCount++
+      }
+    })
+
+    // Drop deleted rows and rows the user can no longer see
+    const removed = new Set(delta.removed || [])
+    if (removed.size && activeResource.data.some(issue => removed.has(issue.name))) {
+      const remaining = activeResource.data.filter(issue => !removed.has(issue.name))
+      updatedCount += activeResource.data.length - remaining.length
+      activeResource.setData ? activeResource.setData(remaining) : (activeResource.data = remaining)
+    }
+
+    if (updatedCount && window && typeof window.dispatchEvent === 'function') {
+      window.dispatchEvent(new CustomEvent('issueListUpdated', {
+        detail: { count: updatedCount, documents: (delta.issues || []).map(issue => issue.name) }
+      }))
+    }
+  }
+
   const updateIndividualRows = async (documentNames) => {
     try {
       // Determine which resource is currently active and get its data
@@ -307,21 +273,8 @@ export function useIssueListUpdates(getCurrentParams, customRefreshFunction, get
 
   const updateVisibleIssuesInPlace = async (visibleIssueNames, activeResource, currentData) => {
     try {
-      // Fetch the updated issues individually
-      const updatedIssues = await Promise.all(
-        visibleIssueNames.map(async (issueName) => {
-          try {
-            await fetchSingleIssue(issueName)
-            return singleIssueResource.data
-          } catch (error) {
-            console.warn(`Failed to fetch updated issue ${issueName}:`, error)
-            return null
-          }
-        })
-      )
-
-      // Filter out any failed fetches
-      const validUpdatedIssues = updatedIssues.filter(issue => issue !== null)
+      // Fetch the updated issues in one call, issues the user can no longer see are left out
+      const validUpdatedIssues = await fetchIssuesByNames(visibleIssueNames)
       
       if (validUpdatedIssues.length === 0) {
         console.warn('No valid updated issues fetched, falling back to custom refresh')
@@ -476,11 +429,6 @@ export function useIssueListUpdates(getCurrentParams, customRefreshFunction, get
     document.removeEventListener('visibilitychange', handleVisibilityChange)
     
     disableRealtimeUpdates()
-    
-    // Clear any pending debounce timer
-    if (debounceTimer) {
-      clearTimeout(debounceTimer)
-    }
   })
 
   return {
@@ -1,8 +1,47 @@
 import { createResource } from "frappe-ui"
 
+// Filters are sent as one JSON string in the GET query, callers may already pass them encoded
+function encodeFilters(filters) {
+	return typeof filters === "string" ? filters : JSON.stringify(filters)
+}
+
+// Expands a format=columnar list response (see encode_issues_columnar in api/issues.py)
+// back into the array of issue objects the list components read
+export function decodeIssueRows(data) {
+	if (data && data.issues && data.issues.format === "columnar") {
+		// Cursor pagination wraps the page with its next cursor
+		return { ...data, issues: decodeIssueRows(data.issues) }
+	}
+	if (!data || data.format !== "columnar") {
+		return data
+	}
+
+	return data.rows.map((row) => {
+		const issue = {}
+		data.columns.forEach((column, index) => {
+			issue[column] = row[index]
+		})
+
+		issue.custom_users_assigned = (issue.custom_users_assigned || []).map((assignmentRow) => {
+			const assignment = { parent: issue.name }
+			data.assignment_columns.forEach((column, index) => {
+				assignment[column] = assignmentRow[index]
+			})
+			assignment.user_assigned = data.users[assignment.user_assigned]
+			assignment.team = data.teams[assignment.team]
+			return assignment
+		})
+		issue._user_tags = (issue._user_tags || []).map((tagIndex) => data.tags[tagIndex])
+
+		return issue
+	})
+}
+
 // Main resource for fetching Issue doctype data with child table support
 export const issuesResource = createResource({
 	url: "force_trans_customization.api.issues.get_issues_with_assignments",
+	// GET, so the browser revalidates its copy with the ETag and reuses it on 304 Not Modified
+	method: "GET",
 	makeParams(params) {
 		// Handle null/undefined params explicitly
 		const safeParams = params || {}
@@ -22,10 +61,12 @@ export const issuesResource = createResource({
 		return {
 			limit_page_length,
 			limit_start,
-			filters,
+			filters: encodeFilters(filters),
 			order_by,
+			format: "columnar",
 		}
 	},
+	transform: decodeIssueRows,
 	onError(error) {
 		console.error("Failed to fetch issues:", error)
 		// Show user-friendly error message using Frappe UI toast
@@ -44,6 +85,8 @@ export const issuesResource = createResource({
 // Resource for getting total count of issues (for pagination)
 export const issuesCountResource = createResource({
 	url: "force_trans_customization.api.issues.get_issues_count_with_filters",
+	// GET, so the browser revalidates its copy with the ETag and reuses it on 304 Not Modified
+	method: "GET",
 	makeParams(params) {
 		// Handle null/undefined params explicitly
 		const safeParams = params || {}
@@ -53,7 +96,7 @@ export const issuesCountResource = createResource({
 		console.log('issuesCountResource filters:', filters)
 		
 		return {
-			filters,
+			filters: encodeFilters(filters),
 		}
 	},
 	onError(error) {
@@ -99,6 +142,57 @@ export function fetchSingleIssue(issueName) {
 	return singleIssueResource.reload(issueName)
 }
 
+// Resource for resyncing a set of list rows in one call (after missed realtime deltas)
+export const issuesByNamesResource = createResource({
+	url: "force_trans_customization.api.issues.get_issues_by_names",
+	makeParams(issueNames) {
+		return {
+			issue_names: JSON.stringify(issueNames || []),
+		}
+	},
+	onError(error) {
+		console.error("Failed to fetch issues by names:", error)
+	},
+	auto: false, // Don't auto-fetch, only fetch when called
+})
+
+// Helper function to fetch list rows for the given issue names
+export function fetchIssuesByNames(issueNames) {
+	return issuesByNamesResource.reload(issueNames).then(() => {
+		return issuesByNamesResource.data || []
+	})
+}
+
+// Full descriptions of the rows the user expands, the list endpoints only return custom_description_snippet
+export const issueDescriptionsResource = createResource({
+	url: "force_trans_customization.api.issues.get_issue_descriptions",
+	makeParams(issueNames) {
+		return {
+			issue_names: JSON.stringify(issueNames || []),
+		}
+	},
+	onError(error) {
+		console.error("Failed to fetch issue descriptions:", error)
+	},
+	auto: false, // Don't auto-fetch, only fetch when called
+})
+
+// Descriptions by issue name and modified, so an edited issue is fetched again
+const issueDescriptionCache = new Map()
+
+// Helper function to get the full description of an issue row
+export function fetchIssueDescription(issue) {
+	const cacheKey = `${issue.name}|${issue.modified || ""}`
+	if (issueDescriptionCache.has(cacheKey)) {
+		return Promise.resolve(issueDescriptionCache.get(cacheKey))
+	}
+	return issueDescriptionsResource.reload([issue.name]).then(() => {
+		const description = (issueDescriptionsResource.data || {})[issue.name] || ""
+		issueDescriptionCache.set(cacheKey, description)
+		return description
+	})
+}
+
 // Resource for fetching Issue Priority options
 export const issuePriorityResource = createResource({
 	url: "frappe.client.get_list",
@@ -247,14 +341,51 @@ export function getStatusOptions() {
 	return statusOptionsCache
 }
 
-// Resource for fetching tag colors from Tag Categories
+// Local copy of the versioned tag color map, shared with the desk tag color script
+const TAG_COLORS_STORAGE_KEY = "force_trans_tag_colors"
+
+function getStoredTagColors() {
+	try {
+		const stored = JSON.parse(localStorage.getItem(TAG_COLORS_STORAGE_KEY) || "null")
+		if (stored && stored.version && stored.colors) {
+			return stored
+		}
+	} catch (error) {
+		// Ignore unreadable copies, the map is fetched again
+	}
+	return { version: null, colors: {} }
+}
+
+// Keep the local copy in sync with a response, returns the current colors
+function storeTagColors(version, colors) {
+	if (!colors) {
+		// Version is current, keep using the local copy
+		return getStoredTagColors().colors
+	}
+	try {
+		localStorage.setItem(TAG_COLORS_STORAGE_KEY, JSON.stringify({ version, colors }))
+	} catch (error) {
+		// Storage full or disabled, the colors are still used for this page
+	}
+	return colors
+}
+
+// Resource for fetching tag colors from Tag Categories, only downloads the map when its version changed
 export const tagColorsResource = createResource({
-	url: "force_trans_customization.api.issues.get_tag_colors",
-	cache: "TagColors", // Cache for 10 minutes
+	url: "force_trans_customization.api.issues.get_tag_color_map",
+	makeParams() {
+		return {
+			version: getStoredTagColors().version,
+		}
+	},
+	transform(data) {
+		return storeTagColors(data?.version, data?.colors)
+	},
+	initialData: getStoredTagColors().colors,
 	onError(error) {
 		console.error("Failed to fetch tag colors:", error)
 	},
-	auto: true, // Auto-fetch on component mount
+	auto: false, // Loaded with the first paint data by loadIssueTrackerData
 })
 
 // Memoized tag color cache with data freshness check
@@ -318,6 +449,8 @@ export function searchIssues(searchQuery, limit = 8) {
 // Resource for filtering issues by stat type
 export const statFilterResource = createResource({
 	url: "force_trans_customization.api.issues.get_issues_by_stat_filter",
+	// GET, so the browser revalidates its copy with the ETag and reuses it on 304 Not Modified
+	method: "GET",
 	makeParams(params) {
 		const safeParams = params || {}
 		const result = {
@@ -325,15 +458,17 @@ export const statFilterResource = createResource({
 			limit_page_length: safeParams.limit_page_length || 10,
 			limit_start: safeParams.limit_start || 0,
 			order_by: safeParams.order_by || "creation desc",
+			format: "columnar",
 		}
 		
 		// Add filters if provided
 		if (safeParams.filters) {
-			result.filters = safeParams.filters
+			result.filters = encodeFilters(safeParams.filters)
 		}
 		
 		return result
 	},
+	transform: decodeIssueRows,
 	onError(error) {
 		console.error("Failed to filter issues by stat:", error)
 		if (window.$toast) {
@@ -351,6 +486,8 @@ export const statFilterResource = createResource({
 // Resource for getting count of issues by stat filter
 export const statFilterCountResource = createResource({
 	url: "force_trans_customization.api.issues.get_stat_filter_count",
+	// GET, so the browser revalidates its copy with the ETag and reuses it on 304 Not Modified
+	method: "GET",
 	makeParams(params) {
 		const safeParams = params || {}
 		const result = {
@@ -359,7 +496,7 @@ export const statFilterCountResource = createResource({
 		
 		// Add filters if provided
 		if (safeParams.filters) {
-			result.filters = safeParams.filters
+			result.filters = encodeFilters(safeParams.filters)
 		}
 		
 		return result
@@ -370,6 +507,28 @@ export const statFilterCountResource = createResource({
 	auto: false, // Don't auto-fetch, only fetch when called
 })
 
+// Resource for getting the counts of every stat filter type in one request
+export const statCountsResource = createResource({
+	url: "force_trans_customization.api.issues.get_stat_filter_counts",
+	// GET, so the browser revalidates its copy with the ETag and reuses it on 304 Not Modified
+	method: "GET",
+	makeParams(params) {
+		const safeParams = params || {}
+		const result = {}
+		
+		// Add filters if provided
+		if (safeParams.filters) {
+			result.filters = encodeFilters(safeParams.filters)
+		}
+		
+		return result
+	},
+	onError(error) {
+		console.error("Failed to get stat filter counts:", error)
+	},
+	auto: false, // Don't auto-fetch, only fetch when called
+})
+
 // Helper function to filter issues by stat type
 export function filterIssuesByStat(statType, params = {}) {
 	const filterParams = {
@@ -402,6 +561,63 @@ export function getStatFilterCount(statType, filters = null) {
 	return statFilterCountResource.reload(params)
 }
 
+// Helper function to get the counts of all stat filter types with one request
+export function getStatCounts(filters = null) {
+	const params = {}
+	
+	// Add filters if provided
+	if (filters) {
+		params.filters = filters
+	}
+	
+	return statCountsResource.reload(params)
+}
+
+// Resource for loading the issue tracker first paint in one request
+// (page rows, total, stat counts and tag colors)
+export const issueTrackerDataResource = createResource({
+	url: "force_trans_customization.api.issues.get_issue_tracker_data",
+	makeParams(params) {
+		const safeParams = params || {}
+		const result = {
+			stat_type: safeParams.stat_type || "team_tickets",
+			limit_page_length: safeParams.limit_page_length || 10,
+			limit_start: safeParams.limit_start || 0,
+			order_by: safeParams.order_by || "creation desc",
+			// The tag color map is left out when the local copy is current
+			tag_colors_version: getStoredTagColors().version,
+		}
+		
+		// Add filters if provided
+		if (safeParams.filters) {
+			result.filters = safeParams.filters
+		}
+		
+		return result
+	},
+	onError(error) {
+		console.error("Failed to load issue tracker data:", error)
+	},
+	auto: false, // Don't auto-fetch, only fetch when called
+})
+
+// Helper function to load the first paint and seed the resources the page reads from
+export function loadIssueTrackerData(statType, params = {}) {
+	return issueTrackerDataResource.reload({ stat_type: statType, ...params }).then(() => {
+		const data = issueTrackerDataResource.data || {}
+		
+		statFilterResource.setData(data.issues || [])
+		statCountsResource.setData(data.stat_counts || {})
+		tagColorsResource.setData(storeTagColors(data.tag_colors_version, data.tag_colors) || {})
+		
+		return data
+	}).catch((error) => {
+		// Tag colors are not auto-fetched, load them on their own so tags still get colored
+		tagColorsResource.reload()
+		throw error
+	})
+}
+
 // Helper function to refresh all filter options and clear caches
 export function refreshFilterOptions() {
 	// Clear caches before reloading